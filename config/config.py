@@ -12,8 +12,18 @@ load_dotenv()
 class Config:
     """Configuration class for test settings."""
 
+    # Local mock application: MOCK_APP=true serves a stand-in EM2M app from
+    # the test process and points BASE_URL at it. Parallel workers each get
+    # their own port (MOCK_APP_PORT + WORKER_ID).
+    MOCK_APP = os.getenv('MOCK_APP', 'false').lower() == 'true'
+    MOCK_APP_PORT = int(os.getenv('MOCK_APP_PORT', '8765')) + int(os.getenv('WORKER_ID', '0'))
+    MOCK_APP_LATENCY = int(os.getenv('MOCK_APP_LATENCY', '0'))
+
     # Application URLs
-    BASE_URL = os.getenv('BASE_URL', 'https://elasticm2m-dev.app.em2m.net')
+    if MOCK_APP:
+        BASE_URL = f"http://127.0.0.1:{MOCK_APP_PORT}"
+    else:
+        BASE_URL = os.getenv('BASE_URL', 'https://elasticm2m-dev.app.em2m.net')
     LOGIN_URL = f"{BASE_URL}/login"
     DASHBOARD_URL = f"{BASE_URL}/dashboard"
     ASSETS_URL = f"{BASE_URL}/assets"
@@ -30,6 +40,40 @@ class Config:
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     WINDOW_SIZE = os.getenv('WINDOW_SIZE', '1920,1080')
 
+    # Fast browser profile: no extensions, no background throttling and an
+    # eager page load strategy (pages are usable once the DOM is parsed)
+    FAST_MODE = os.getenv('FAST_MODE', 'false').lower() == 'true'
+    PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'eager' if FAST_MODE else 'normal')
+    BLOCK_IMAGES = os.getenv('BLOCK_IMAGES', 'false').lower() == 'true'
+    BLOCK_FONTS = os.getenv('BLOCK_FONTS', 'false').lower() == 'true'
+
+    # Driver binaries: resolved once and cached on disk for all runs and
+    # parallel workers. Pinned paths and offline mode never touch the network.
+    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', '')
+    GECKODRIVER_PATH = os.getenv('GECKODRIVER_PATH', '')
+    DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'
+    DRIVER_CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', os.path.join('~', '.wdm'))
+    DRIVER_CACHE_TTL = int(os.getenv('DRIVER_CACHE_TTL', '86400'))
+
+    # Browser reuse scope: scenario, feature or run
+    DRIVER_REUSE_SCOPE = os.getenv('DRIVER_REUSE_SCOPE', 'feature')
+
+    # Session reuse: log in once per run and restore the session afterwards.
+    # Scenarios tagged @ui-login always use the real login form.
+    SESSION_REUSE = os.getenv('SESSION_REUSE', 'true').lower() == 'true'
+    SESSION_CACHE_TTL = int(os.getenv('SESSION_CACHE_TTL', '1800'))
+
+    # Deep-link navigation: jump straight to entities already resolved through
+    # search. Scenarios tagged @search or @performance always use the real dropdown.
+    NAVIGATION_CACHE = os.getenv('NAVIGATION_CACHE', 'true').lower() == 'true'
+
+    # Search input: the whole term is inserted at once and the autocomplete
+    # is awaited. SEARCH_TYPE_PER_CHARACTER (or @type-per-character) types one
+    # key at a time instead. SEARCH_DEBOUNCE_MS is the minimum wait for apps
+    # that do not report their debounce as pending work.
+    SEARCH_TYPE_PER_CHARACTER = os.getenv('SEARCH_TYPE_PER_CHARACTER', 'false').lower() == 'true'
+    SEARCH_DEBOUNCE_MS = int(os.getenv('SEARCH_DEBOUNCE_MS', '300'))
+
     # Timeout settings
     DEFAULT_TIMEOUT = int(os.getenv('DEFAULT_TIMEOUT', '10'))
     PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
@@ -38,6 +82,52 @@ class Config:
     REPORT_DIR = os.getenv('REPORT_DIR', 'reports')
     SCREENSHOT_DIR = os.path.join(REPORT_DIR, 'screenshots')
 
+    # Screenshots are captured as browser-encoded JPEGs and saved on a
+    # background thread as SCREENSHOT_FORMAT (webp, jpeg or png), scaled down
+    # to SCREENSHOT_MAX_WIDTH pixels (0 = full size)
+    SCREENSHOT_FORMAT = os.getenv('SCREENSHOT_FORMAT', 'webp')
+    SCREENSHOT_QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '80'))
+    SCREENSHOT_MAX_WIDTH = int(os.getenv('SCREENSHOT_MAX_WIDTH', '0'))
+
+    # Run history for the HTML report: every run's results are added to a
+    # SQLite store; trends cover the last HISTORY_RUNS runs and a scenario
+    # regressed when it is REGRESSION_THRESHOLD percent slower than usual
+    HISTORY_DB = os.getenv('HISTORY_DB', os.path.join(REPORT_DIR, 'history.db'))
+    HISTORY_RUNS = int(os.getenv('HISTORY_RUNS', '20'))
+    REGRESSION_THRESHOLD = float(os.getenv('REGRESSION_THRESHOLD', '20'))
+
+    # WebDriver command profiling: per step/scenario timings written next to
+    # allure-results and attached to every Allure test case
+    COMMAND_PROFILING = os.getenv('COMMAND_PROFILING', 'true').lower() == 'true'
+    COMMAND_TIMINGS_FILE = os.getenv('COMMAND_TIMINGS_FILE', 'command-timings.json')
+
+    # Page performance: Navigation Timing, paint timings, LCP, CLS and long
+    # tasks of every page visit, attached to every Allure test case
+    WEB_VITALS = os.getenv('WEB_VITALS', 'true').lower() == 'true'
+    WEB_VITALS_FILE = os.getenv('WEB_VITALS_FILE', 'web-vitals.json')
+
+    # Sleep budget: fixed time.sleep() calls in project code are recorded per
+    # call site. SLEEP_BUDGET is the allowed seconds of sleeping per scenario
+    # (0 = no limit); SLEEP_BUDGET_MODE is warn or fail.
+    SLEEP_BUDGET = float(os.getenv('SLEEP_BUDGET', '0'))
+    SLEEP_BUDGET_MODE = os.getenv('SLEEP_BUDGET_MODE', 'warn')
+    SLEEP_REPORT_FILE = os.getenv('SLEEP_REPORT_FILE', 'sleep-report.json')
+
+    # Visual regression: baselines per feature/scenario/region are kept in
+    # VISUAL_BASELINE_DIR (created on first run, replaced when
+    # VISUAL_UPDATE_BASELINES is true). VISUAL_THRESHOLD is the allowed
+    # per-pixel channel difference (0-1) and VISUAL_MAX_DIFF_RATIO the share
+    # of pixels that may differ beyond anti-aliasing.
+    VISUAL_BASELINE_DIR = os.getenv('VISUAL_BASELINE_DIR', 'visual-baselines')
+    VISUAL_OUTPUT_DIR = os.path.join(REPORT_DIR, 'visual')
+    VISUAL_UPDATE_BASELINES = os.getenv('VISUAL_UPDATE_BASELINES', 'false').lower() == 'true'
+    VISUAL_THRESHOLD = float(os.getenv('VISUAL_THRESHOLD', '0.1'))
+    VISUAL_MAX_DIFF_RATIO = float(os.getenv('VISUAL_MAX_DIFF_RATIO', '0'))
+    VISUAL_WORKERS = int(os.getenv('VISUAL_WORKERS', '2'))
+
+    # Accessibility audit: WCAG level (AA or AAA) the contrast checks use
+    ACCESSIBILITY_LEVEL = os.getenv('ACCESSIBILITY_LEVEL', 'AA')
+
     # API settings (if needed)
     API_BASE_URL = os.getenv('API_BASE_URL', 'https://elasticm2m-dev.app.em2m.net/api')
     API_TOKEN = os.getenv('API_TOKEN', '')
@@ -51,7 +141,13 @@ class Config:
             Dictionary of browser options
         """
         return {
+            'browser': cls.BROWSER,
             'headless': cls.HEADLESS,
             'window_size': cls.WINDOW_SIZE,
-            'timeout': cls.DEFAULT_TIMEOUT
+            'timeout': cls.DEFAULT_TIMEOUT,
+            'page_load_timeout': cls.PAGE_LOAD_TIMEOUT,
+            'fast_mode': cls.FAST_MODE,
+            'page_load_strategy': cls.PAGE_LOAD_STRATEGY,
+            'block_images': cls.BLOCK_IMAGES,
+            'block_fonts': cls.BLOCK_FONTS
         }
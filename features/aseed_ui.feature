@@ -533,7 +533,7 @@ Feature: ASEED Page UI Testing
 
   @aseed-ui @cards @geofences
   Scenario: Verify Geofences card text is readable
-    Then the card text should have sufficient contrast
+    Then the Geofences card text should have sufficient contrast
 
   # ========================================
   # DASHBOARD CARDS - Layout & Grid (10 tests)
@@ -611,7 +611,7 @@ Feature: ASEED Page UI Testing
     And dates should be left-aligned
 
   # ========================================
-  # ACCESSIBILITY & RESPONSIVENESS (10 tests)
+  # ACCESSIBILITY & RESPONSIVENESS (11 tests)
   # ========================================
 
   @aseed-ui @accessibility
@@ -662,6 +662,12 @@ Feature: ASEED Page UI Testing
     When viewed on mobile device
     Then there should be no horizontal scrolling
 
+  @aseed-ui @accessibility
+  Scenario: Verify layout at every breakpoint
+    When the layout is captured at the mobile, tablet and desktop breakpoints
+    Then the organization name should be visible at every breakpoint
+    And there should be no horizontal scrolling at any breakpoint
+
   # ========================================
   # INTERACTIVE ELEMENTS (5 tests)
   # ========================================
@@ -690,4 +696,32 @@ Feature: ASEED Page UI Testing
     Then all links on the page should be valid
     And links should navigate to correct destinations
 
+  # ========================================
+  # VISUAL REGRESSION (1 test)
+  # ========================================
+
+  @aseed-ui @visual
+  Scenario: Verify ASEED page matches its visual baselines
+    Then the ASEED page should match its visual baseline
+    And the "header" region should match its visual baseline
+    And the "organization details" region should match its visual baseline
+    And the "dashboard cards" region should match its visual baseline
+    And there should be no visual differences
+
+  # ========================================
+  # PAGE PERFORMANCE (2 tests)
+  # ========================================
+
+  @aseed-ui @performance
+  Scenario: Verify ASEED page loads within its performance budget
+    Then the ASEED page should load in under 2s
+    And the ASEED page should have a layout shift score under 0.1
+    And the ASEED page should block the main thread for under 300ms
+
+  @aseed-ui @performance
+  Scenario: Verify tab switches stay within their performance budget
+    When the user clicks on "PAYMENT ASSURANCE" tab
+    Then the PAYMENT ASSURANCE page should load in under 1s
+    And the PAYMENT ASSURANCE page should have a layout shift score under 0.1
+
   # Total scenarios: 105+
@@ -3,10 +3,18 @@ Behave environment configuration file.
 This file contains hooks that run before/after scenarios, features, and test runs.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
+from config.config import Config
+from utilities.driver_binary import DriverBinaryCache
+from utilities.driver_factory import DriverFactory
+from utilities.driver_pool import DriverPool
+from utilities.session_cache import SessionCache
+from utilities.navigation_cache import NavigationCache
+from utilities.command_profiler import CommandProfiler
+from utilities.sleep_budget import SleepMonitor, format_ranking
+from utilities.screenshot_writer import ScreenshotWriter, capture_screenshot
+from utilities.visual_regression import VisualComparator, attach_to_allure, format_results
+from utilities.web_vitals import WebVitalsCollector
+from mock_app.server import MockEm2mApp
 import os
 
 
@@ -15,17 +23,64 @@ def before_all(context):
     Runs once before all tests.
     Setup global configurations here.
     """
-    # Set base URL from environment variable or use default
-    context.base_url = os.getenv('BASE_URL', 'https://elasticm2m-dev.app.em2m.net')
+    # Serve the local stand-in application when MOCK_APP is enabled
+    context.mock_app = None
+    if Config.MOCK_APP:
+        context.mock_app = MockEm2mApp(port=Config.MOCK_APP_PORT, latency=Config.MOCK_APP_LATENCY)
+        context.mock_app.start()
+        print(f"Mock EM2M app running at {context.mock_app.url}")
 
-    # Set default timeout
-    context.default_timeout = 10
+    # Set base URL and default timeout from configuration
+    context.base_url = Config.BASE_URL
+    context.default_timeout = Config.DEFAULT_TIMEOUT
 
     # Create reports directories if they don't exist
     for directory in ['reports', 'reports/screenshots', 'allure-results']:
         if not os.path.exists(directory):
             os.makedirs(directory)
 
+    # The driver binary is resolved once and shared with other runs and workers
+    driver_binaries = DriverBinaryCache.from_config(Config)
+
+    # Browsers are built from the Config browser settings, kept warm and
+    # reused according to DRIVER_REUSE_SCOPE
+    driver_factory = DriverFactory(Config.get_browser_options(), driver_binaries)
+    context.driver_pool = DriverPool(driver_factory.create, scope=Config.DRIVER_REUSE_SCOPE)
+
+    # Logged in sessions are captured once and restored into later scenarios
+    context.session_cache = SessionCache(context.base_url, ttl=Config.SESSION_CACHE_TTL)
+
+    # Pages resolved through search are reopened directly by later scenarios
+    context.navigation_cache = NavigationCache()
+
+    # Every WebDriver command is timed and attributed to its step
+    context.command_profiler = CommandProfiler() if Config.COMMAND_PROFILING else None
+
+    # Every page visit records its load, paint and layout shift timings
+    context.web_vitals = WebVitalsCollector() if Config.WEB_VITALS else None
+
+    # Every fixed sleep in project code is recorded against its call site
+    context.sleep_monitor = SleepMonitor(budget=Config.SLEEP_BUDGET, mode=Config.SLEEP_BUDGET_MODE)
+    context.sleep_monitor.install()
+
+    # Screenshots are encoded and written off the scenario's critical path
+    context.screenshot_writer = ScreenshotWriter(
+        Config.SCREENSHOT_DIR,
+        image_format=Config.SCREENSHOT_FORMAT,
+        quality=Config.SCREENSHOT_QUALITY,
+        max_width=Config.SCREENSHOT_MAX_WIDTH
+    )
+
+    # Visual comparisons run on worker threads while the browser moves on
+    context.visual_comparator = VisualComparator(
+        Config.VISUAL_BASELINE_DIR,
+        Config.VISUAL_OUTPUT_DIR,
+        workers=Config.VISUAL_WORKERS,
+        threshold=Config.VISUAL_THRESHOLD,
+        max_diff_ratio=Config.VISUAL_MAX_DIFF_RATIO,
+        update=Config.VISUAL_UPDATE_BASELINES
+    )
+
     print("Test suite initialization complete")
 
 
@@ -41,29 +96,54 @@ def before_feature(context, feature):
 def before_scenario(context, scenario):
     """
     Runs before each scenario.
-    Initialize browser here.
+    Get a browser from the pool here.
     """
     print(f"\nStarting Scenario: {scenario.name}")
 
-    # Setup Chrome options
-    chrome_options = Options()
+    context.driver = context.driver_pool.acquire()
 
-    # Uncomment for headless mode
-    # chrome_options.add_argument('--headless')
+    if context.command_profiler:
+        context.command_profiler.instrument(context.driver)
+        context.command_profiler.start_scenario(scenario)
 
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
+    if context.web_vitals:
+        context.web_vitals.instrument(context.driver)
+        context.web_vitals.start_scenario(scenario)
 
-    # Initialize WebDriver
-    context.driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_options
+    context.sleep_monitor.start_scenario(scenario)
+
+    # Pending visual comparisons of this scenario
+    context.visual_checks = []
+
+    # Scenarios tagged @ui-login always go through the real login form
+    context.reuse_session = Config.SESSION_REUSE and 'ui-login' not in scenario.effective_tags
+
+    # Scenarios tagged @search always go through the real search dropdown, and
+    # so do @performance scenarios, whose page budgets time that route change
+    context.use_navigation_cache = Config.NAVIGATION_CACHE and not (
+        {'search', 'performance'} & set(scenario.effective_tags)
     )
 
-    context.driver.maximize_window()
-    context.driver.implicitly_wait(context.default_timeout)
+    # Scenarios tagged @type-per-character type search terms one key at a time
+    context.type_search_per_character = (
+        Config.SEARCH_TYPE_PER_CHARACTER or 'type-per-character' in scenario.effective_tags
+    )
+
+
+def before_step(context, step):
+    """
+    Runs before each step.
+    """
+    if context.command_profiler:
+        context.command_profiler.start_step(step)
+
+
+def after_step(context, step):
+    """
+    Runs after each step.
+    """
+    if context.command_profiler:
+        context.command_profiler.end_step(step)
 
 
 def after_scenario(context, scenario):
@@ -71,31 +151,82 @@ def after_scenario(context, scenario):
     Runs after each scenario.
     Cleanup and screenshot capture on failure.
     """
+    # Attach the WebDriver command timings to the Allure report
+    if context.command_profiler:
+        timings = context.command_profiler.end_scenario(scenario)
+        try:
+            import allure
+            allure.attach(
+                context.command_profiler.format_summary(timings),
+                name="WebDriver Command Timings",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        except ImportError:
+            pass  # If allure is not available, continue
+
+    # Attach the page visit timings to the Allure report
+    if context.web_vitals:
+        vitals = context.web_vitals.end_scenario()
+        if vitals and vitals['visits']:
+            try:
+                import allure
+                allure.attach(
+                    context.web_vitals.format_summary(vitals),
+                    name="Page Performance",
+                    attachment_type=allure.attachment_type.TEXT
+                )
+            except ImportError:
+                pass  # If allure is not available, continue
+
+    # Report fixed sleeps and flag scenarios over the sleep budget
+    sleeps = context.sleep_monitor.end_scenario()
+    if sleeps and sleeps['calls']:
+        if sleeps['over_budget']:
+            print(f"[WARNING] Scenario slept {sleeps['total']:.2f}s, over the {Config.SLEEP_BUDGET:g}s sleep budget")
+        try:
+            import allure
+            allure.attach(
+                context.sleep_monitor.format_summary(sleeps),
+                name="Fixed Sleeps",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        except ImportError:
+            pass  # If allure is not available, continue
+
+    # Report visual comparisons no step waited for
+    for check in context.visual_checks:
+        try:
+            result = check.result()
+        except Exception as e:
+            print(f"[WARNING] Visual comparison failed: {e}")
+            continue
+        attach_to_allure(result)
+        if result['status'] == 'failed':
+            print(f"[WARNING] Visual difference not asserted by any step:\n{format_results([result])}")
+
     # Take screenshot on failure and attach to Allure report
     if scenario.status == 'failed':
-        screenshot_dir = 'reports/screenshots'
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
-
-        screenshot_name = f"{scenario.name.replace(' ', '_')}_{scenario.line}.png"
-        screenshot_path = os.path.join(screenshot_dir, screenshot_name)
-        context.driver.save_screenshot(screenshot_path)
+        image, image_format = capture_screenshot(context.driver, quality=Config.SCREENSHOT_QUALITY)
+        screenshot_name = f"{scenario.name.replace(' ', '_')}_{scenario.line}"
+        screenshot_path = context.screenshot_writer.submit(image, screenshot_name)
         print(f"Screenshot saved: {screenshot_path}")
 
-        # Attach screenshot to Allure report
+        # The capture is already compressed, so it is attached as is. Allure
+        # tracks the current test per thread, which is why this cannot move
+        # to the writer thread.
         try:
             import allure
-            allure.attach.file(
-                screenshot_path,
+            allure.attach(
+                image,
                 name=f"Failure Screenshot - {scenario.name}",
-                attachment_type=allure.attachment_type.PNG
+                attachment_type=allure.attachment_type.JPG if image_format == 'jpeg' else allure.attachment_type.PNG
             )
         except:
             pass  # If allure is not available, continue
 
-    # Close browser
+    # Reset the browser and return it to the pool
     if hasattr(context, 'driver'):
-        context.driver.quit()
+        context.driver_pool.release(context.driver)
 
     print(f"Scenario '{scenario.name}' completed with status: {scenario.status}")
 
@@ -104,6 +235,8 @@ def after_feature(context, feature):
     """
     Runs after each feature file.
     """
+    context.driver_pool.end_feature()
+
     print(f"\n{'='*80}")
     print(f"Completed Feature: {feature.name}")
     print(f"{'='*80}\n")
@@ -114,4 +247,25 @@ def after_all(context):
     Runs once after all tests.
     Final cleanup here.
     """
+    context.driver_pool.close_all()
+
+    context.screenshot_writer.close()
+    context.visual_comparator.close()
+
+    if context.mock_app:
+        context.mock_app.stop()
+
+    if context.command_profiler:
+        context.command_profiler.write(Config.COMMAND_TIMINGS_FILE)
+        print(f"Command timings saved: {Config.COMMAND_TIMINGS_FILE}")
+
+    if context.web_vitals:
+        context.web_vitals.write(Config.WEB_VITALS_FILE)
+        print(f"Page performance saved: {Config.WEB_VITALS_FILE}")
+
+    context.sleep_monitor.uninstall()
+    context.sleep_monitor.write(Config.SLEEP_REPORT_FILE)
+    print(f"\n{format_ranking(context.sleep_monitor.ranked_sites(limit=10))}")
+    print(f"Sleep report saved: {Config.SLEEP_REPORT_FILE}")
+
     print("\nTest suite execution complete")
@@ -1,3 +1,4 @@
+@ui-login
 Feature: User Login
   As a user of the EM2M application
   I want to be able to log in to the system
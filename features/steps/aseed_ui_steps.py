@@ -10,7 +10,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from pages.aseed_page import AseedPage
 from pages.search_page import SearchPage
-import time
+from config.config import Config
+from utilities.accessibility import audit_page, filter_violations, format_violations
 
 
 # ========================================
@@ -20,25 +21,34 @@ import time
 @when('the user searches for "{search_term}" and navigates to it')
 def step_search_and_navigate_to_aseed(context, search_term):
     """Search for ASEED and navigate to its page."""
+    # Initialize ASEED page
+    context.aseed_page = AseedPage(context.driver)
+
+    # Jump straight to the page when an earlier scenario already resolved it
+    cached_url = context.navigation_cache.get(search_term) if context.use_navigation_cache else None
+    if cached_url:
+        context.aseed_page.navigate_to(cached_url, label=search_term)
+        if context.aseed_page.is_page_loaded():
+            return
+        context.navigation_cache.invalidate(search_term)
+
     # Initialize search page
     if not hasattr(context, 'search_page'):
         context.search_page = SearchPage(context.driver)
 
     # Click search button
     context.search_page.click_search_button()
-    time.sleep(2)
 
     # Enter search term
-    context.search_page.enter_search_term(search_term)
-    time.sleep(3)
+    context.search_page.enter_search_term(search_term, per_character=context.type_search_per_character)
 
     # Wait for dropdown and click exact match
     context.search_page.wait_for_dropdown()
     context.search_page.click_exact_match(search_term)
-    time.sleep(3)
 
-    # Initialize ASEED page
-    context.aseed_page = AseedPage(context.driver)
+    # Remember where the search resolved to for later scenarios
+    if context.aseed_page.is_page_loaded():
+        context.navigation_cache.record(search_term, context.driver.current_url)
 
 
 # ========================================
@@ -197,7 +207,7 @@ def step_click_menu_button(context):
 @then('the side menu should open')
 def step_verify_side_menu_opens(context):
     """Verify side menu opens."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     # Check for side menu or drawer
     try:
         menu = context.driver.find_element(By.CSS_SELECTOR, "mat-sidenav, .sidenav, .mat-drawer, [class*='drawer']")
@@ -224,7 +234,7 @@ def step_click_search_button_header(context):
 @then('the search input should appear')
 def step_verify_search_input_appears(context):
     """Verify search input appears."""
-    time.sleep(2)
+    context.aseed_page.wait_until_stable()
     # Search input should be visible
     inputs = context.driver.find_elements(By.TAG_NAME, "input")
     visible_inputs = [inp for inp in inputs if inp.is_displayed()]
@@ -252,12 +262,12 @@ def step_click_profile_button(context):
 @then('the profile dropdown menu should open')
 def step_verify_profile_dropdown_opens(context):
     """Verify profile dropdown opens."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     # Check for dropdown menu
     try:
         menu = context.driver.find_element(By.CSS_SELECTOR, ".mat-menu-panel, [role='menu'], .dropdown-menu")
         # Menu might take time to appear
-        time.sleep(0.5)
+        context.aseed_page.wait_until_stable()
     except:
         # Dropdown might work differently
         pass
@@ -280,7 +290,7 @@ def step_click_notifications_icon(context):
     try:
         notif_icon = context.driver.find_element(By.CSS_SELECTOR, "[class*='notification']")
         notif_icon.click()
-        time.sleep(1)
+        context.aseed_page.wait_until_stable()
     except:
         pass
 
@@ -289,7 +299,7 @@ def step_click_notifications_icon(context):
 def step_verify_notifications_panel_opens(context):
     """Verify notifications panel opens."""
     # Notifications functionality might vary
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
 
 
 @then('the header should have a dark background color')
@@ -312,7 +322,7 @@ def step_verify_header_light_text(context):
 def step_scroll_down_page(context):
     """Scroll down the page."""
     context.driver.execute_script("window.scrollBy(0, 500);")
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('the header should remain fixed at the top')
@@ -328,7 +338,7 @@ def step_click_breadcrumb_item(context, text):
     try:
         breadcrumb_item = context.driver.find_element(By.XPATH, f"//*[contains(@class, 'breadcrumb')]//*[contains(text(), '{text}')]")
         breadcrumb_item.click()
-        time.sleep(1)
+        context.aseed_page.wait_until_stable()
     except:
         pass
 
@@ -336,7 +346,7 @@ def step_click_breadcrumb_item(context, text):
 @then('the page should navigate or refresh')
 def step_verify_page_navigates_or_refreshes(context):
     """Verify page navigates or refreshes."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     # Page should still be valid
     assert context.aseed_page.is_page_loaded(), "Page navigation failed"
 
@@ -366,8 +376,11 @@ def step_verify_header_no_overlap(context):
 @then('all header icons should be properly aligned')
 def step_verify_header_icons_aligned(context):
     """Verify header icons are aligned."""
-    # Visual check - header loads properly
-    assert context.aseed_page.is_menu_button_visible(), "Header icons not found"
+    buttons = context.aseed_page.get_header_button_layout()
+    assert len(buttons) > 0, "Header icons not found"
+    centers = [b['rect']['y'] + b['rect']['height'] / 2 for b in buttons]
+    assert max(centers) - min(centers) <= context.aseed_page.LAYOUT_TOLERANCE, \
+        f"Header icons are not vertically aligned, centers: {centers}"
 
 
 @then('header elements should have proper spacing')
@@ -422,14 +435,14 @@ def step_click_tab(context, tab_name):
 @then('the "{tab_name}" tab should become active')
 def step_verify_tab_becomes_active(context, tab_name):
     """Verify tab becomes active after click."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     assert context.aseed_page.is_tab_active(tab_name), f"Tab '{tab_name}' did not become active"
 
 
 @then('the tab content should change')
 def step_verify_tab_content_changes(context):
     """Verify tab content changes."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     # Content should have changed - page still loads
     assert True
 
@@ -456,32 +469,42 @@ def step_verify_inactive_tabs_clickable(context):
 @then('all tabs should have uppercase text')
 def step_verify_tabs_uppercase(context):
     """Verify tabs have uppercase text."""
-    tabs = context.aseed_page.get_all_tabs()
+    tabs = context.aseed_page.get_tab_layout()
+    assert len(tabs) > 0, "No tabs found"
     for tab in tabs:
-        if tab.is_displayed():
-            # Tabs typically have uppercase text
-            assert len(tab.text) > 0, "Tab has no text"
+        assert len(tab['text']) > 0, "Tab has no text"
+        assert tab['text'] == tab['text'].upper() or tab['styles']['text-transform'] == 'uppercase', \
+            f"Tab text is not uppercase: {tab['text']}"
 
 
 @then('tabs should have consistent font size')
 def step_verify_tabs_consistent_font(context):
     """Verify tabs have consistent font size."""
-    tabs = context.aseed_page.get_all_tabs()
+    tabs = context.aseed_page.get_tab_layout()
     assert len(tabs) > 0, "No tabs found"
+    font_sizes = {tab['styles']['font-size'] for tab in tabs}
+    assert len(font_sizes) == 1, f"Tabs use different font sizes: {font_sizes}"
 
 
 @then('all tabs should be aligned horizontally')
 def step_verify_tabs_horizontal_alignment(context):
     """Verify tabs are aligned horizontally."""
-    tabs = context.aseed_page.get_all_tabs()
+    tabs = context.aseed_page.get_tab_layout()
     assert len(tabs) >= 2, "Not enough tabs to verify alignment"
+    tops = [tab['rect']['y'] for tab in tabs]
+    assert max(tops) - min(tops) <= context.aseed_page.LAYOUT_TOLERANCE, \
+        f"Tabs are not on one line, tops: {tops}"
 
 
 @then('tabs should have equal spacing')
 def step_verify_tabs_equal_spacing(context):
     """Verify tabs have equal spacing."""
-    tabs = context.aseed_page.get_all_tabs()
+    tabs = context.aseed_page.get_tab_layout()
     assert len(tabs) > 0, "No tabs found"
+    gaps = [b['rect']['x'] - (a['rect']['x'] + a['rect']['width']) for a, b in zip(tabs, tabs[1:])]
+    if gaps:
+        assert max(gaps) - min(gaps) <= context.aseed_page.LAYOUT_TOLERANCE, \
+            f"Tab spacing is not equal, gaps: {gaps}"
 
 
 @when('the viewport width changes')
@@ -542,7 +565,7 @@ def step_click_specific_button(context, button_text):
 @then('a file upload dialog or modal should appear')
 def step_verify_upload_dialog_appears(context):
     """Verify upload dialog appears."""
-    time.sleep(1)
+    context.aseed_page.wait_until_stable()
     # File dialog or modal should appear
     # This might trigger browser file dialog which we can't directly test
     pass
@@ -581,7 +604,7 @@ def step_hover_logo_section(context):
         upload_btn = context.driver.find_element(*context.aseed_page.UPLOAD_LOGO_BUTTON)
         from selenium.webdriver.common.action_chains import ActionChains
         ActionChains(context.driver).move_to_element(upload_btn).perform()
-        time.sleep(0.5)
+        context.aseed_page.wait_until_stable()
     except:
         pass
 
@@ -590,7 +613,7 @@ def step_hover_logo_section(context):
 def step_verify_visual_feedback(context):
     """Verify visual feedback on hover."""
     # Visual check - hover effect
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('the logo section should be left-aligned')
@@ -688,14 +711,14 @@ def step_click_tag(context):
     tags = context.aseed_page.get_all_tags()
     if len(tags) > 0:
         tags[0].click()
-        time.sleep(0.5)
+        context.aseed_page.wait_until_stable()
 
 
 @then('nothing should happen or tag details should show')
 def step_verify_tag_click_behavior(context):
     """Verify tag click behavior."""
     # Tags might be non-interactive or show details
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('tags should be below the organization name')
@@ -755,7 +778,7 @@ def step_verify_card_visible(context, card_name):
 def step_verify_card_count(context, count):
     """Verify card displays specific count."""
     # Card is visible with count
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('the {card_name} card should have a bank/institution icon')
@@ -813,12 +836,8 @@ def step_verify_card_label(context, card_name, label):
 def step_verify_card_has_label(context, label):
     """Verify card has label."""
     # Check if any card has this label
-    cards = context.aseed_page.get_all_cards()
-    found = False
-    for card in cards:
-        if label in card.text:
-            found = True
-            break
+    cards = context.aseed_page.get_card_index()
+    found = any(label in card['text'] for card in cards.values())
     assert found, f"No card found with label '{label}'"
 
 
@@ -838,7 +857,7 @@ def step_click_card(context, card_name):
 @then('the user should navigate to {section_name} section or see {section_name} list')
 def step_verify_navigate_to_section(context, section_name):
     """Verify navigation to section."""
-    time.sleep(2)
+    context.aseed_page.wait_until_stable()
     # URL might change or content might update
     current_url = context.driver.current_url
     # Accept any valid navigation
@@ -848,7 +867,7 @@ def step_verify_navigate_to_section(context, section_name):
 @then('the user should navigate to {section_name} section')
 def step_verify_navigate_to_specific_section(context, section_name):
     """Verify navigation to specific section."""
-    time.sleep(2)
+    context.aseed_page.wait_until_stable()
     current_url = context.driver.current_url
     assert len(current_url) > 0, "Navigation failed"
 
@@ -890,26 +909,26 @@ def step_hover_over_card_alt(context, card_name):
 @then('the card should show a hover effect')
 def step_verify_card_hover_effect(context):
     """Verify card shows hover effect."""
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
     # Visual check
 
 
 @then('there should be visual feedback')
 def step_verify_visual_feedback_card(context):
     """Verify visual feedback on card."""
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('visual feedback should be displayed')
 def step_verify_visual_feedback_displayed(context):
     """Verify visual feedback is displayed."""
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('visual feedback should appear')
 def step_verify_visual_feedback_appears(context):
     """Verify visual feedback appears."""
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('the {card_name} card should have consistent size with other cards')
@@ -981,11 +1000,14 @@ def step_verify_card_icon_centered(context, card_name):
     assert context.aseed_page.is_card_visible(card_name), f"Card '{card_name}' not found"
 
 
-@then('the card text should have sufficient contrast')
-def step_verify_card_text_contrast(context):
-    """Verify card text has sufficient contrast."""
-    # Visual check
-    assert True
+@then('the {card_name} card text should have sufficient contrast')
+def step_verify_card_text_contrast(context, card_name):
+    """Verify a card's text has sufficient contrast."""
+    card = context.aseed_page.get_card(card_name)
+    assert card, f"Card '{card_name}' not found"
+    audit = audit_page(context.driver, root=card['element'], level=Config.ACCESSIBILITY_LEVEL)
+    violations = filter_violations(audit, 'color-contrast')
+    assert not violations, format_violations(violations)
 
 
 # ========================================
@@ -995,50 +1017,66 @@ def step_verify_card_text_contrast(context):
 @then('the dashboard cards should be arranged in a grid layout')
 def step_verify_cards_grid_layout(context):
     """Verify cards are in grid layout."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 6, f"Expected at least 6 cards, found {len(cards)}"
 
 
 @then('all dashboard cards should have equal width')
 def step_verify_cards_equal_width(context):
     """Verify cards have equal width."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 2, "Not enough cards to compare"
+    widths = {label: card['rect']['width'] for label, card in cards.items()}
+    assert max(widths.values()) - min(widths.values()) <= context.aseed_page.LAYOUT_TOLERANCE, \
+        f"Cards have different widths: {widths}"
 
 
 @then('all dashboard cards should have equal height')
 def step_verify_cards_equal_height(context):
     """Verify cards have equal height."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 2, "Not enough cards to compare"
+    heights = {label: card['rect']['height'] for label, card in cards.items()}
+    assert max(heights.values()) - min(heights.values()) <= context.aseed_page.LAYOUT_TOLERANCE, \
+        f"Cards have different heights: {heights}"
 
 
 @then('the spacing between cards should be uniform')
 def step_verify_cards_uniform_spacing(context):
     """Verify cards have uniform spacing."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 2, "Not enough cards to compare"
+    gaps = []
+    for row in context.aseed_page.group_into_rows(cards.values()):
+        gaps.extend(b['rect']['x'] - (a['rect']['x'] + a['rect']['width']) for a, b in zip(row, row[1:]))
+    if gaps:
+        assert max(gaps) - min(gaps) <= context.aseed_page.LAYOUT_TOLERANCE, \
+            f"Card spacing is not uniform, gaps: {gaps}"
 
 
 @then('cards should be arranged in multiple rows')
 def step_verify_cards_multiple_rows(context):
     """Verify cards are in multiple rows."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 6, "Not enough cards for multiple rows"
+    rows = context.aseed_page.group_into_rows(cards.values())
+    assert len(rows) >= 2, f"Cards are not in multiple rows, found {len(rows)} row"
 
 
 @then('there should be {count:d} cards per row')
 def step_verify_cards_per_row(context, count):
     """Verify number of cards per row."""
-    cards = context.aseed_page.get_all_cards()
-    # With 6+ cards and 3 per row, we should have multiple rows
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= count, f"Not enough cards: {len(cards)}"
+    row_sizes = [len(row) for row in context.aseed_page.group_into_rows(cards.values())]
+    assert row_sizes[0] == count and max(row_sizes) <= count, \
+        f"Expected {count} cards per row, rows have {row_sizes} cards"
 
 
 @then('the card grid should adjust responsively')
 def step_verify_card_grid_responsive(context):
     """Verify card grid is responsive."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) > 0, "No cards found after viewport change"
 
 
@@ -1047,30 +1085,28 @@ def step_verify_all_cards_in_viewport(context):
     """Verify all cards visible in viewport."""
     # Reset viewport to normal size
     context.aseed_page.set_viewport_size(1920, 1080)
-    time.sleep(1)
-    cards = context.aseed_page.get_all_cards()
-    visible_cards = [c for c in cards if c.is_displayed()]
+    visible_cards = context.aseed_page.get_dashboard_card_layout()
     assert len(visible_cards) >= 6, f"Not all cards visible: {len(visible_cards)}"
 
 
 @then('cards should have subtle shadows or borders')
 def step_verify_cards_shadows_or_borders(context):
     """Verify cards have shadows or borders."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) > 0, "No cards found"
 
 
 @then('all cards should have rounded corners')
 def step_verify_cards_rounded_corners(context):
     """Verify cards have rounded corners."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) > 0, "No cards found"
 
 
 @then('all cards should have equal internal padding')
 def step_verify_cards_equal_padding(context):
     """Verify cards have equal padding."""
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) > 0, "No cards found"
 
 
@@ -1156,30 +1192,40 @@ def step_verify_dates_left_aligned(context):
 # ACCESSIBILITY & RESPONSIVENESS
 # ========================================
 
+def _accessibility_audit(context):
+    """Audit the page once per scenario and share the result between its steps."""
+    if getattr(context, 'accessibility_audit', None) is None:
+        context.accessibility_audit = audit_page(context.driver, level=Config.ACCESSIBILITY_LEVEL)
+    return context.accessibility_audit
+
+
 @then('all images should have descriptive alt text')
 def step_verify_images_have_alt_text(context):
     """Verify images have alt text."""
-    # Images that are present should have alt text
-    assert context.aseed_page.is_elasticm2m_logo_visible() or True, "Image check"
+    violations = filter_violations(_accessibility_audit(context), 'image-alt')
+    assert not violations, format_violations(violations)
 
 
 @then('interactive buttons should have aria-label attributes')
 def step_verify_buttons_have_aria_labels(context):
     """Verify buttons have aria labels."""
-    # Modern Angular apps typically have proper aria labels
-    assert True
+    # Buttons with visible text are named by it; icon-only buttons need an aria-label
+    violations = filter_violations(_accessibility_audit(context), 'button-name', 'link-name')
+    assert not violations, format_violations(violations)
 
 
 @then('text should have sufficient contrast with background')
 def step_verify_text_contrast(context):
     """Verify text contrast."""
-    assert True
+    violations = filter_violations(_accessibility_audit(context), 'color-contrast')
+    assert not violations, format_violations(violations)
 
 
 @then('it should meet WCAG standards')
 def step_verify_wcag_standards(context):
     """Verify WCAG standards."""
-    assert True
+    violations = filter_violations(_accessibility_audit(context))
+    assert not violations, format_violations(violations)
 
 
 @when('the user navigates using Tab key')
@@ -1189,14 +1235,16 @@ def step_navigate_with_tab(context):
     from selenium.webdriver.common.action_chains import ActionChains
     from selenium.webdriver.common.keys import Keys
     ActionChains(context.driver).send_keys(Keys.TAB).perform()
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('focusable elements should be accessible')
 def step_verify_focusable_elements_accessible(context):
     """Verify focusable elements are accessible."""
-    # Tab navigation should work
-    assert True
+    audit = _accessibility_audit(context)
+    assert audit['focus_order'], "No focusable elements found"
+    violations = filter_violations(audit, 'tabindex', 'button-name', 'link-name', 'label')
+    assert not violations, format_violations(violations)
 
 
 @when('elements receive focus')
@@ -1205,7 +1253,7 @@ def step_elements_receive_focus(context):
     from selenium.webdriver.common.action_chains import ActionChains
     from selenium.webdriver.common.keys import Keys
     ActionChains(context.driver).send_keys(Keys.TAB).perform()
-    time.sleep(0.3)
+    context.aseed_page.wait_until_stable()
 
 
 @then('there should be a visible focus indicator')
@@ -1218,7 +1266,7 @@ def step_verify_focus_indicator_visible(context):
 @when('the viewport is set to mobile size')
 def step_set_mobile_viewport(context):
     """Set mobile viewport."""
-    context.aseed_page.set_viewport_size(375, 667)  # iPhone size
+    context.aseed_page.set_viewport_size(*context.aseed_page.BREAKPOINTS['mobile'])
 
 
 @then('all elements should be accessible and visible')
@@ -1231,7 +1279,7 @@ def step_verify_elements_accessible_on_mobile(context):
 @when('the viewport is set to tablet size')
 def step_set_tablet_viewport(context):
     """Set tablet viewport."""
-    context.aseed_page.set_viewport_size(768, 1024)  # iPad size
+    context.aseed_page.set_viewport_size(*context.aseed_page.BREAKPOINTS['tablet'])
 
 
 @then('the layout should adapt appropriately')
@@ -1243,14 +1291,14 @@ def step_verify_layout_adapts_tablet(context):
 @when('the viewport is set to desktop size')
 def step_set_desktop_viewport(context):
     """Set desktop viewport."""
-    context.aseed_page.set_viewport_size(1920, 1080)  # Full HD
+    context.aseed_page.set_viewport_size(*context.aseed_page.BREAKPOINTS['desktop'])
 
 
 @then('all elements should have optimal layout')
 def step_verify_optimal_layout_desktop(context):
     """Verify optimal layout on desktop."""
     assert context.aseed_page.is_organization_name_visible(), "Layout not optimal on desktop"
-    cards = context.aseed_page.get_all_cards()
+    cards = context.aseed_page.get_dashboard_card_layout()
     assert len(cards) >= 6, "Cards not visible on desktop"
 
 
@@ -1259,7 +1307,7 @@ def step_increase_font_size(context):
     """Increase browser font size."""
     # Zoom in
     context.driver.execute_script("document.body.style.zoom='150%'")
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @then('text should scale without breaking layout')
@@ -1274,7 +1322,7 @@ def step_verify_text_scales(context):
 @when('viewed on mobile device')
 def step_view_on_mobile(context):
     """View on mobile device."""
-    context.aseed_page.set_viewport_size(375, 667)
+    context.aseed_page.set_viewport_size(*context.aseed_page.BREAKPOINTS['mobile'])
 
 
 @then('there should be no horizontal scrolling')
@@ -1287,6 +1335,33 @@ def step_verify_no_horizontal_scroll(context):
     assert page_width <= viewport_width + 20, f"Horizontal scroll detected: page={page_width}, viewport={viewport_width}"
 
 
+@when('the layout is captured at the {names} breakpoints')
+def step_capture_layout_at_breakpoints(context, names):
+    """Capture the layout at several breakpoints, e.g. 'mobile, tablet and desktop'."""
+    breakpoint_names = [name.strip() for name in names.replace(' and ', ',').split(',') if name.strip()]
+    context.breakpoint_layouts = context.aseed_page.sweep_layout(breakpoint_names)
+
+
+@then('the organization name should be visible at every breakpoint')
+def step_verify_org_name_at_breakpoints(context):
+    """Verify the organization name is visible at every captured breakpoint."""
+    hidden = [
+        name for name, layout in context.breakpoint_layouts.items()
+        if not any(e['visible'] for e in layout['elements'][context.aseed_page.ORG_NAME])
+    ]
+    assert not hidden, f"Organization name not visible at: {', '.join(hidden)}"
+
+
+@then('there should be no horizontal scrolling at any breakpoint')
+def step_verify_no_horizontal_scroll_at_breakpoints(context):
+    """Verify the page fits the viewport width at every captured breakpoint."""
+    overflowing = {
+        name: layout['viewport'] for name, layout in context.breakpoint_layouts.items()
+        if layout['viewport']['scroll_width'] > layout['viewport']['width'] + 20
+    }
+    assert not overflowing, f"Horizontal scroll detected: {overflowing}"
+
+
 # ========================================
 # INTERACTIVE ELEMENTS
 # ========================================
@@ -1319,7 +1394,7 @@ def step_hover_over_icons(context):
         menu_btn = context.driver.find_element(*context.aseed_page.MENU_BUTTON)
         from selenium.webdriver.common.action_chains import ActionChains
         ActionChains(context.driver).move_to_element(menu_btn).perform()
-        time.sleep(0.5)
+        context.aseed_page.wait_until_stable()
     except:
         pass
 
@@ -1328,7 +1403,7 @@ def step_hover_over_icons(context):
 def step_verify_tooltips_appear(context):
     """Verify tooltips appear."""
     # Tooltips might appear on hover
-    time.sleep(0.5)
+    context.aseed_page.wait_until_stable()
 
 
 @when('actions are processing')
@@ -1361,3 +1436,29 @@ def step_verify_links_navigate_correctly(context):
     """Verify links navigate correctly."""
     # Links should have valid destinations
     assert True
+
+
+# ========================================
+# VISUAL REGRESSION
+# ========================================
+
+def _submit_visual_check(context, region_name):
+    """Screenshot a region and compare it with its baseline in the background."""
+    image, masks, css_width = context.aseed_page.capture_visual_region(region_name)
+    context.visual_checks.append(context.visual_comparator.submit(
+        image, context.feature.name, context.scenario.name, region_name, masks, css_width
+    ))
+
+
+@then('the ASEED page should match its visual baseline')
+def step_verify_page_visual_baseline(context):
+    """Compare the viewport with its visual baseline."""
+    _submit_visual_check(context, 'page')
+
+
+@then('the "{region_name}" region should match its visual baseline')
+def step_verify_region_visual_baseline(context, region_name):
+    """Compare a page region with its visual baseline."""
+    assert region_name in context.aseed_page.VISUAL_REGIONS, \
+        f"Unknown visual region '{region_name}', expected one of: {', '.join(context.aseed_page.VISUAL_REGIONS)}"
+    _submit_visual_check(context, region_name)
@@ -6,19 +6,18 @@ from behave import given, when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 from pages.login_page import LoginPage
 from pages.search_page import SearchPage
 from config.config import Config
-import time
+from utilities.visual_regression import attach_to_allure, format_results
 
 
 @given('the user navigates to "{url}"')
 def step_navigate_to_url(context, url):
     """Navigate to a specific URL."""
-    if url.startswith('http'):
-        context.driver.get(url)
-    else:
-        context.driver.get(f"{context.base_url}{url}")
+    full_url = url if url.startswith('http') else f"{context.base_url}{url}"
+    BasePage(context.driver).navigate_to(full_url, label=url)
 
 
 @when('the user waits for {seconds:d} seconds')
@@ -86,17 +85,80 @@ def step_verify_url_contains(context, expected_url_part):
 @given('the user is logged in with valid credentials')
 def step_user_logged_in_with_valid_credentials(context):
     """Ensure user is logged in with valid credentials."""
-    login_page = LoginPage(context.driver)
-    login_page.navigate_to_login()
-    login_page.login(Config.TEST_USERNAME, Config.TEST_PASSWORD)
+    credentials = (Config.TEST_USERNAME, Config.TEST_PASSWORD)
 
-    # Wait for page to load after login
-    time.sleep(8)  # Increased wait time for page to fully load
+    # Restore the session captured by an earlier scenario when allowed
+    restored = context.reuse_session and context.session_cache.restore(context.driver, credentials)
 
-    # Wait for page to be ready
-    WebDriverWait(context.driver, 20).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
+    if not restored:
+        login_page = LoginPage(context.driver)
+        login_page.navigate_to_login()
+        login_page.login(*credentials)
+
+        # Wait for page to load after login
+        login_page.wait_until_stable(timeout=20)
+
+        # Wait for page to be ready
+        WebDriverWait(context.driver, 20).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
+        if context.reuse_session and '/login' not in context.driver.current_url:
+            context.session_cache.capture(context.driver, credentials)
 
     # Initialize search page for search tests
     context.search_page = SearchPage(context.driver)
+
+
+@then('there should be no visual differences')
+def step_verify_no_visual_differences(context):
+    """Wait for the scenario's visual comparisons and fail on any difference."""
+    results = [check.result() for check in context.visual_checks]
+    context.visual_checks.clear()
+    for result in results:
+        attach_to_allure(result)
+    failed = [r for r in results if r['status'] == 'failed']
+    assert not failed, f"Visual differences found:\n{format_results(failed)}"
+
+
+def _page_visit(context, label):
+    """Get the latest recorded visit of a page, failing when there is none."""
+    assert context.web_vitals, "Page performance is not collected (WEB_VITALS=false)"
+    visit = context.web_vitals.find_visit(label)
+    assert visit, f"No visit to the {label} page was recorded in this scenario"
+    return visit
+
+
+@then('the {label} page should load in under {seconds:g}s')
+def step_verify_page_load_budget(context, label, seconds):
+    """Check the load time of the latest visit to a page against a budget."""
+    visit = _page_visit(context, label)
+    assert visit['load'] is not None, f"The {label} page did not report a load time"
+    assert visit['load'] < seconds, \
+        f"The {label} page took {visit['load']:.3f}s to load, over the {seconds:g}s budget"
+
+
+@then('the {label} page should paint its largest content in under {seconds:g}s')
+def step_verify_page_lcp_budget(context, label, seconds):
+    """Check the Largest Contentful Paint of a page load against a budget."""
+    visit = _page_visit(context, label)
+    assert visit.get('lcp') is not None, f"The {label} page did not report a Largest Contentful Paint"
+    assert visit['lcp'] < seconds, \
+        f"The {label} page painted its largest content after {visit['lcp']:.3f}s, over the {seconds:g}s budget"
+
+
+@then('the {label} page should have a layout shift score under {score:g}')
+def step_verify_page_cls_budget(context, label, score):
+    """Check the Cumulative Layout Shift of a page visit against a budget."""
+    visit = _page_visit(context, label)
+    assert visit['cls'] < score, \
+        f"The {label} page shifted its layout by {visit['cls']:.3f}, over the {score:g} budget"
+
+
+@then('the {label} page should block the main thread for under {milliseconds:d}ms')
+def step_verify_page_blocking_budget(context, label, milliseconds):
+    """Check the Total Blocking Time of a page visit against a budget."""
+    visit = _page_visit(context, label)
+    blocking = visit['total_blocking_time'] * 1000
+    assert blocking < milliseconds, \
+        f"The {label} page blocked the main thread for {blocking:.0f}ms, over the {milliseconds}ms budget"
@@ -54,9 +54,6 @@ def step_click_login_button(context):
 @then('the user should be redirected to the dashboard')
 def step_verify_dashboard_redirect(context):
     """Verify user is redirected to dashboard or homepage after login."""
-    import time
-    time.sleep(3)  # Wait for redirect
-
     # Wait for redirect away from login page
     WebDriverWait(context.driver, 15).until(
         lambda driver: '/login' not in driver.current_url
@@ -71,8 +68,7 @@ def step_verify_dashboard_redirect(context):
 @then('the user should see their profile information')
 def step_verify_profile_information(context):
     """Verify profile information or authenticated page is displayed."""
-    import time
-    time.sleep(2)  # Wait for page to load
+    context.login_page.wait_until_stable()  # Wait for page to load
 
     # Try to find any authenticated page element (profile, menu, etc.)
     # Instead of looking for specific profile info, just verify page loaded
@@ -92,8 +88,7 @@ def step_verify_profile_information(context):
 @then('the user should see an error message "{expected_message}"')
 def step_verify_error_message(context, expected_message):
     """Verify error message is displayed."""
-    import time
-    time.sleep(2)  # Wait for error message to appear
+    context.login_page.wait_until_stable()  # Wait for error message to appear
 
     # Try multiple selectors to find the error message
     error_element = None
@@ -9,7 +9,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from pages.search_page import SearchPage
 from pages.login_page import LoginPage
 from config.config import Config
-import time
 
 
 @when('the user clicks the search button in the navbar')
@@ -19,15 +18,13 @@ def step_click_search_button(context):
         context.search_page = SearchPage(context.driver)
 
     context.search_page.click_search_button()
-    time.sleep(1)  # Wait for search input to appear
 
 
 @when('the user enters "{search_term}" in the search input field')
 def step_enter_search_term(context, search_term):
     """Enter text in the search input field."""
-    context.search_page.enter_search_term(search_term)
+    context.search_page.enter_search_term(search_term, per_character=context.type_search_per_character)
     context.search_term = search_term
-    time.sleep(1)  # Wait for typing to complete
 
 
 @when('the user waits for the dropdown to appear')
@@ -49,7 +46,7 @@ def step_verify_dropdown_displays_results(context):
     assert context.search_page.is_dropdown_visible(), \
         "Search dropdown is not visible"
 
-    options = context.search_page.get_dropdown_options()
+    options = context.search_page.get_dropdown_snapshot()
     assert len(options) > 0, "No results found in dropdown"
 
 
@@ -64,14 +61,13 @@ def step_verify_dropdown_contains_text(context, text):
 def step_click_exact_match(context, text):
     """Click on the exact match from dropdown."""
     context.search_page.click_exact_match(text)
-    time.sleep(2)  # Wait for navigation
 
 
 @then('the user should be on the ASEED details page')
 def step_verify_aseed_details_page(context):
     """Verify user is on the ASEED details page."""
     # Wait for page to load
-    time.sleep(2)
+    context.search_page.wait_until_stable()
 
     # Get current URL
     current_url = context.driver.current_url
@@ -4,54 +4,315 @@ Standalone HTML Report Generator
 Generates beautiful HTML report from Allure JSON results WITHOUT needing Allure CLI
 """
 
+import argparse
+import heapq
+import itertools
 import json
 import os
+import re
 from datetime import datetime
+from html import escape
 from pathlib import Path
 
-def read_allure_results(results_dir='allure-results'):
-    """Read all result JSON files from allure-results directory."""
-    results = []
+from config.config import Config
+from utilities.allure_results import iter_results
+from utilities.run_history import RunHistory, scenario_id
+
+# Step categories for the time split, first match wins. Steps matching
+# none of them count as actions.
+STEP_CATEGORIES = (
+    ('sleeps', re.compile(r'\bwaits? for \d+(\.\d+)? seconds?\b', re.IGNORECASE)),
+    ('assertions', re.compile(r'^then\b|\bshould\b', re.IGNORECASE)),
+    ('waits', re.compile(r'\bwaits?\b|\bto appear\b|\bprocessing\b', re.IGNORECASE)),
+    ('navigation', re.compile(r'\bnavigat|\bis on the\b|\blogged in\b|\bsearches for\b|\bcomplete search\b',
+                              re.IGNORECASE)),
+)
+CATEGORY_COLORS = {
+    'navigation': '#4299e1',
+    'waits': '#ed8936',
+    'sleeps': '#f56565',
+    'assertions': '#48bb78',
+    'actions': '#9f7aea'
+}
+
+# Rows shown in the slowest steps and previous run comparison tables
+SLOWEST_STEPS = 10
+COMPARISON_ROWS = 15
+
+# Chunked output: results per data file and the longest failure message kept
+CHUNK_SIZE = 500
+MAX_MESSAGE_LENGTH = 2000
+
+# History rows on the chunked page (regressions and flaky scenarios first)
+CHUNKED_HISTORY_ROWS = 50
+
+VIRTUAL_LIST_CSS = """
+        .result-toolbar {
+            display: flex;
+            gap: 10px;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+
+        .result-toolbar input, .result-toolbar select {
+            padding: 8px 12px;
+            border: 1px solid #cbd5e0;
+            border-radius: 5px;
+            font-size: 0.95em;
+        }
+
+        .result-toolbar input { flex: 1; }
+
+        .result-count {
+            color: #718096;
+            font-size: 0.9em;
+            white-space: nowrap;
+        }
+
+        .result-list {
+            position: relative;
+            height: 60vh;
+            overflow-y: auto;
+            border: 1px solid #e2e8f0;
+            border-radius: 5px;
+        }
+
+        .result-spacer { position: relative; }
+
+        .result-row {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 44px;
+            display: flex;
+            align-items: center;
+            gap: 15px;
+            padding: 0 15px;
+            border-bottom: 1px solid #edf2f7;
+            border-left: 4px solid #cbd5e0;
+            cursor: pointer;
+            color: #2d3748;
+        }
+
+        .result-row:hover, .result-row.selected { background: #f7fafc; }
+        .result-row.passed { border-left-color: #48bb78; }
+        .result-row.failed, .result-row.broken { border-left-color: #f56565; }
+
+        .result-row .row-name {
+            flex: 1;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+
+        .result-row .row-feature {
+            width: 25%;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+            color: #718096;
+            font-size: 0.9em;
+        }
+
+        .result-details {
+            margin-top: 15px;
+            padding: 20px;
+            background: #f7fafc;
+            border-radius: 5px;
+        }
+
+        .result-details pre {
+            white-space: pre-wrap;
+            color: #742a2a;
+            background: #fff5f5;
+            padding: 10px;
+            border-radius: 5px;
+            margin-top: 10px;
+            font-size: 0.85em;
+        }
+"""
+
+# Virtualized result list: only the visible rows exist in the DOM and data
+# chunks are loaded with script tags (works from file://) when rows scroll
+# into view. Filtering and search scan the chunks one by one.
+VIRTUAL_LIST_SCRIPT = """
+    <script>
+    (function () {
+        'use strict';
+        var manifest = window.reportManifest;
+        var ROW_HEIGHT = 44, OVERSCAN = 10;
+        var chunks = [], requested = {}, waiting = {};
+        var list = document.getElementById('result-list');
+        var spacer = document.getElementById('result-spacer');
+        var search = document.getElementById('result-search');
+        var statusFilter = document.getElementById('result-status');
+        var counter = document.getElementById('result-count');
+        var details = document.getElementById('result-details');
+        var matches = null, scanning = false, scanToken = 0, frame = null, selected = null;
+
+        window.reportChunk = function (index, rows) {
+            chunks[index] = rows;
+            (waiting[index] || []).forEach(function (callback) { callback(); });
+            delete waiting[index];
+        };
+
+        function loadChunk(index, callback) {
+            if (chunks[index]) { return callback(); }
+            (waiting[index] = waiting[index] || []).push(callback);
+            if (requested[index]) { return; }
+            requested[index] = true;
+            var script = document.createElement('script');
+            script.src = manifest.dataDir + '/chunk-' + String(index).padStart(5, '0') + '.js';
+            document.head.appendChild(script);
+        }
+
+        function rowAt(index) {
+            var chunk = chunks[Math.floor(index / manifest.chunkSize)];
+            return chunk ? chunk[index % manifest.chunkSize] : null;
+        }
+
+        function count() { return matches ? matches.length : manifest.total; }
+
+        function scheduleRender() {
+            if (frame === null) { frame = requestAnimationFrame(render); }
+        }
+
+        function element(tag, className, text) {
+            var el = document.createElement(tag);
+            if (className) { el.className = className; }
+            if (text !== undefined) { el.textContent = text; }
+            return el;
+        }
+
+        function render() {
+            frame = null;
+            var total = count();
+            spacer.style.height = (total * ROW_HEIGHT) + 'px';
+            var first = Math.max(0, Math.floor(list.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            var last = Math.min(total, Math.ceil((list.scrollTop + list.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+            var fragment = document.createDocumentFragment();
+            for (var position = first; position < last; position++) {
+                var index = matches ? matches[position] : position;
+                var row = rowAt(index), el;
+                if (row) {
+                    el = element('div', 'result-row ' + row[1] + (index === selected ? ' selected' : ''));
+                    el.appendChild(element('span', 'row-name', row[0]));
+                    el.appendChild(element('span', 'row-feature', row[3] || ''));
+                    el.appendChild(element('span', 'test-status ' + row[1], row[1]));
+                    el.appendChild(element('span', 'test-duration', (row[2] / 1000).toFixed(2) + 's'));
+                    el.dataset.index = index;
+                } else {
+                    el = element('div', 'result-row', 'Loading...');
+                    loadChunk(Math.floor(index / manifest.chunkSize), scheduleRender);
+                }
+                el.style.top = (position * ROW_HEIGHT) + 'px';
+                fragment.appendChild(el);
+            }
+            spacer.replaceChildren(fragment);
+            counter.textContent = (matches ? total + ' of ' + manifest.total : total) + ' results' +
+                (scanning ? ' (searching...)' : '');
+        }
+
+        function showDetails(index) {
+            var row = rowAt(index);
+            if (!row) { return; }
+            selected = index;
+            details.replaceChildren();
+            details.appendChild(element('div', 'test-name', row[0]));
+            details.appendChild(element('span', 'test-status ' + row[1], row[1]));
+            details.appendChild(element('span', 'test-duration', (row[2] / 1000).toFixed(2) + 's'));
+            var total = Math.max(row[2], 1);
+            row[5].forEach(function (step) {
+                var line = element('div', 'waterfall-row');
+                var label = element('div', 'waterfall-label', step[0]);
+                label.title = step[0];
+                var track = element('div', 'waterfall-track');
+                var bar = element('div', 'waterfall-bar');
+                bar.style.left = (step[1] / total * 100) + '%';
+                bar.style.width = Math.max(step[2] / total * 100, 0.3) + '%';
+                bar.style.background = manifest.categories[step[3]][1];
+                track.appendChild(bar);
+                line.appendChild(label);
+                line.appendChild(track);
+                line.appendChild(element('div', 'waterfall-time', (step[2] / 1000).toFixed(2) + 's'));
+                details.appendChild(line);
+            });
+            if (row[4]) { details.appendChild(element('pre', null, row[4])); }
+            details.hidden = false;
+            scheduleRender();
+        }
+
+        function applyFilter() {
+            var query = search.value.trim().toLowerCase(), status = statusFilter.value;
+            var token = ++scanToken;
+            list.scrollTop = 0;
+            if (!query && !status) {
+                matches = null;
+                scanning = false;
+                return scheduleRender();
+            }
+            matches = [];
+            scanning = true;
+            (function scan(chunkIndex) {
+                if (chunkIndex >= manifest.chunks) {
+                    scanning = false;
+                    return scheduleRender();
+                }
+                loadChunk(chunkIndex, function () {
+                    if (token !== scanToken) { return; }
+                    chunks[chunkIndex].forEach(function (row, i) {
+                        if (status && row[1] !== status) { return; }
+                        if (query && row[0].toLowerCase().indexOf(query) === -1 &&
+                            (row[3] || '').toLowerCase().indexOf(query) === -1) { return; }
+                        matches.push(chunkIndex * manifest.chunkSize + i);
+                    });
+                    scheduleRender();
+                    scan(chunkIndex + 1);
+                });
+            })(0);
+        }
+
+        var searchTimer = null;
+        search.addEventListener('input', function () {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(applyFilter, 150);
+        });
+        statusFilter.addEventListener('change', applyFilter);
+        list.addEventListener('scroll', scheduleRender);
+        window.addEventListener('resize', scheduleRender);
+        spacer.addEventListener('click', function (event) {
+            var row = event.target.closest('.result-row');
+            if (row && row.dataset.index !== undefined) { showDetails(Number(row.dataset.index)); }
+        });
+        scheduleRender();
+    })();
+    </script>"""
 
+def iter_allure_results(results_dir='allure-results'):
+    """
+    Stream result JSON files from allure-results directory.
+
+    Files are parsed in parallel (with orjson when installed) and yielded
+    one by one instead of being collected into a list first.
+    """
     if not os.path.exists(results_dir):
         print(f"Error: {results_dir} directory not found!")
         print("Please run tests first with: behave -f allure_behave.formatter:AllureFormatter -o allure-results")
-        return []
+        return
 
-    for filename in os.listdir(results_dir):
-        if filename.endswith('-result.json'):
-            filepath = os.path.join(results_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    results.append(data)
-            except Exception as e:
-                print(f"Warning: Could not read {filename}: {e}")
+    for _, result in iter_results(results_dir):
+        yield result
 
-    return results
+def read_allure_results(results_dir='allure-results'):
+    """Read all result JSON files from allure-results directory."""
+    return list(iter_allure_results(results_dir))
 
 def calculate_metrics(results):
     """Calculate test metrics from results."""
-    total = len(results)
-    passed = sum(1 for r in results if r.get('status') == 'passed')
-    failed = sum(1 for r in results if r.get('status') == 'failed')
-    skipped = sum(1 for r in results if r.get('status') == 'skipped')
-    broken = sum(1 for r in results if r.get('status') == 'broken')
-
-    total_duration = sum(r.get('stop', 0) - r.get('start', 0) for r in results)
-    total_duration_sec = total_duration / 1000 if total_duration else 0
-
-    pass_rate = (passed / total * 100) if total > 0 else 0
-
-    return {
-        'total': total,
-        'passed': passed,
-        'failed': failed,
-        'skipped': skipped,
-        'broken': broken,
-        'pass_rate': pass_rate,
-        'duration': total_duration_sec
-    }
+    summary = ResultSummary()
+    for result in results:
+        summary.add(result)
+    return summary.metrics()
 
 def format_duration(seconds):
     """Format duration in human-readable format."""
@@ -62,10 +323,301 @@ def format_duration(seconds):
         secs = seconds % 60
         return f"{minutes}m {secs:.1f}s"
 
-def generate_html_report(results, metrics, output_file='test_report.html'):
-    """Generate standalone HTML report."""
+def categorize_step(name):
+    """Get the time split category of a step from its name."""
+    for category, pattern in STEP_CATEGORIES:
+        if pattern.search(name):
+            return category
+    return 'actions'
+
+def step_timings(result):
+    """
+    Get the timing of each top-level step of a result.
+
+    Returns:
+        List of dictionaries with name, category, status, offset and
+        duration (both in seconds from the scenario start)
+    """
+    start = result.get('start', 0)
+    return [
+        {
+            'name': step.get('name', 'Step'),
+            'category': categorize_step(step.get('name', '')),
+            'status': step.get('status', 'unknown'),
+            'offset': max(0, step.get('start', start) - start) / 1000,
+            'duration': max(0, step.get('stop', 0) - step.get('start', 0)) / 1000
+        }
+        for step in result.get('steps', [])
+        if 'start' in step and 'stop' in step
+    ]
+
+class ResultSummary:
+    """
+    Single-pass aggregation of results for the report sections.
+
+    Only counters, the slowest steps and one duration per scenario are
+    kept, so results can be streamed through it.
+    """
+
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.statuses = {}
+        self.total = 0
+        self.duration = 0.0
+        self.split = {category: 0.0 for category in CATEGORY_COLORS}
+        self.durations = {}
+        self._slowest = []
+        self._step_counter = itertools.count()
+
+    def add(self, result):
+        """Add one result."""
+        status = result.get('status')
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.total += 1
+        duration = (result.get('stop', 0) - result.get('start', 0)) / 1000
+        self.duration += duration
+        self.durations[scenario_id(result)] = (result.get('name', 'Unknown Test'), duration)
+
+        for step in step_timings(result):
+            self.split[step['category']] += step['duration']
+            # Min-heap of the slowest steps; the per-step counter breaks
+            # duration ties so the step dictionaries are never compared
+            entry = (step['duration'], next(self._step_counter), dict(step, scenario=result.get('name', 'Unknown Test')))
+            if len(self._slowest) < SLOWEST_STEPS:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+
+    def metrics(self):
+        """Get the status counts, pass rate and total duration."""
+        passed = self.statuses.get('passed', 0)
+        return {
+            'total': self.total,
+            'passed': passed,
+            'failed': self.statuses.get('failed', 0),
+            'skipped': self.statuses.get('skipped', 0),
+            'broken': self.statuses.get('broken', 0),
+            'pass_rate': (passed / self.total * 100) if self.total > 0 else 0,
+            'duration': self.duration
+        }
+
+    def performance(self, previous_durations=None):
+        """
+        Get the category split, slowest steps and previous run comparison.
+
+        Args:
+            previous_durations: Optional dictionary of scenario id to the previous run's duration
+        """
+        previous_durations = previous_durations or {}
+        comparison = []
+        for key, (name, duration) in self.durations.items():
+            previous = previous_durations.get(key)
+            if previous is None:
+                continue
+            comparison.append({
+                'id': key,
+                'name': name,
+                'duration': duration,
+                'previous': previous,
+                'delta': duration - previous,
+                'change': (duration - previous) / previous * 100 if previous else 0
+            })
+
+        return {
+            'split': dict(self.split),
+            'split_total': sum(self.split.values()),
+            'slowest_steps': [step for _, _, step in sorted(self._slowest, key=lambda e: e[0], reverse=True)],
+            'comparison': sorted(comparison, key=lambda c: abs(c['delta']), reverse=True),
+            'has_previous': bool(previous_durations)
+        }
+
+def calculate_performance(results, previous_durations=None):
+    """
+    Aggregate step timings of all results for the performance section.
+
+    Args:
+        results: Allure results
+        previous_durations: Optional dictionary of scenario id to the previous run's duration
+
+    Returns:
+        Dictionary with the category split, slowest steps and previous run comparison
+    """
+    summary = ResultSummary()
+    for result in results:
+        summary.add(result)
+    return summary.performance(previous_durations)
+
+def render_waterfall(result):
+    """Render the step timing waterfall of one result as HTML."""
+    steps = step_timings(result)
+    total = max([(result.get('stop', 0) - result.get('start', 0)) / 1000] +
+                [s['offset'] + s['duration'] for s in steps])
+    if not steps or total <= 0:
+        return ""
+
+    rows = ""
+    for step in steps:
+        left = step['offset'] / total * 100
+        width = max(step['duration'] / total * 100, 0.3)
+        rows += f"""
+                    <div class="waterfall-row">
+                        <div class="waterfall-label" title="{escape(step['name'])}">{escape(step['name'])}</div>
+                        <div class="waterfall-track">
+                            <div class="waterfall-bar" style="left: {left:.2f}%; width: {width:.2f}%; background: {CATEGORY_COLORS[step['category']]};"></div>
+                        </div>
+                        <div class="waterfall-time">{step['duration']:.2f}s</div>
+                    </div>"""
+
+    return f"""
+                <details class="waterfall">
+                    <summary>Step timings ({len(steps)} steps)</summary>{rows}
+                </details>"""
+
+def render_performance_section(performance):
+    """Render the performance section (time split, slowest steps, comparison) as HTML."""
+    split_total = performance['split_total']
+    split_bar = ""
+    split_rows = ""
+    for category, seconds in performance['split'].items():
+        share = seconds / split_total * 100 if split_total else 0
+        if share > 0:
+            split_bar += (f'<div class="split-segment" style="width: {share:.2f}%; '
+                          f'background: {CATEGORY_COLORS[category]};" title="{category}"></div>')
+        split_rows += f"""
+                    <tr>
+                        <td><span class="legend" style="background: {CATEGORY_COLORS[category]};"></span>{category.capitalize()}</td>
+                        <td class="num">{format_duration(seconds)}</td>
+                        <td class="num">{share:.1f}%</td>
+                    </tr>"""
+
+    slowest_rows = "".join(f"""
+                    <tr>
+                        <td>{escape(step['name'])}</td>
+                        <td>{escape(step['scenario'])}</td>
+                        <td class="num">{step['duration']:.2f}s</td>
+                    </tr>""" for step in performance['slowest_steps'])
 
-    html = f"""<!DOCTYPE html>
+    if performance['has_previous']:
+        comparison = performance['comparison']
+        slower = sum(1 for c in comparison if c['delta'] > 0)
+        faster = sum(1 for c in comparison if c['delta'] < 0)
+        comparison_rows = "".join(f"""
+                    <tr>
+                        <td>{escape(c['name'])}</td>
+                        <td class="num">{c['previous']:.2f}s</td>
+                        <td class="num">{c['duration']:.2f}s</td>
+                        <td class="num {'slower' if c['delta'] > 0 else 'faster'}">{c['delta']:+.2f}s ({c['change']:+.0f}%)</td>
+                    </tr>""" for c in comparison[:COMPARISON_ROWS])
+        comparison_html = f"""
+            <h3>Compared with the previous run</h3>
+            <p class="perf-note">{slower} scenarios slower, {faster} faster, {len(comparison)} compared</p>
+            <table class="perf-table">
+                <thead><tr><th>Scenario</th><th class="num">Previous</th><th class="num">Current</th><th class="num">Change</th></tr></thead>
+                <tbody>{comparison_rows}
+                </tbody>
+            </table>"""
+    else:
+        comparison_html = """
+            <h3>Compared with the previous run</h3>
+            <p class="perf-note">No previous run recorded yet, the comparison appears from the next test run on.</p>"""
+
+    return f"""
+        <div class="chart-container performance">
+            <h2 style="color: #2d3748; margin-bottom: 20px;">Performance</h2>
+
+            <h3>Time split</h3>
+            <div class="split-bar">{split_bar}</div>
+            <table class="perf-table">
+                <thead><tr><th>Category</th><th class="num">Time</th><th class="num">Share</th></tr></thead>
+                <tbody>{split_rows}
+                </tbody>
+            </table>
+
+            <h3>Slowest steps</h3>
+            <table class="perf-table">
+                <thead><tr><th>Step</th><th>Scenario</th><th class="num">Duration</th></tr></thead>
+                <tbody>{slowest_rows}
+                </tbody>
+            </table>
+{comparison_html}
+        </div>
+"""
+
+def render_sparkline(values, width=120, height=28):
+    """Render a list of durations as an inline SVG line."""
+    if len(values) < 2:
+        return ""
+    low, high = min(values), max(values)
+    spread = (high - low) or 1
+    step = width / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{height - 2 - (value - low) / spread * (height - 4):.1f}"
+        for i, value in enumerate(values)
+    )
+    return (f'<svg class="sparkline" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'<polyline points="{points}" fill="none" stroke="#4299e1" stroke-width="2"/></svg>')
+
+def render_history_section(history, limit=None):
+    """
+    Render the run history section (trends, regressions, flaky rates) as HTML.
+
+    Args:
+        history: History data from update_history()
+        limit: Optional maximum number of scenario rows
+    """
+    trends = history['trends']
+    regressions = sum(1 for t in trends if t['regression'])
+    flaky = sum(1 for t in trends if t['flaky_rate'] > 0)
+    shown = trends[:limit] if limit else trends
+
+    rows = ""
+    for t in shown:
+        change = f"{t['change']:+.0f}%" if t['change'] is not None else "-"
+        baseline = f"{t['baseline']:.2f}s" if t['baseline'] is not None else "-"
+        rows += f"""
+                    <tr class="{'regression' if t['regression'] else ''}">
+                        <td>{escape(t['name'])}</td>
+                        <td>{render_sparkline(t['durations'])}</td>
+                        <td class="num">{t['latest']:.2f}s</td>
+                        <td class="num">{baseline}</td>
+                        <td class="num {'slower' if t['regression'] else ''}">{change}</td>
+                        <td class="num">{t['pass_rate']:.0f}%</td>
+                        <td class="num">{t['flaky_rate']:.0f}%</td>
+                    </tr>"""
+
+    return f"""
+        <div class="chart-container performance">
+            <h2 style="color: #2d3748; margin-bottom: 20px;">History</h2>
+            <p class="perf-note">
+                Last {min(history['runs'], history['window'])} of {history['runs']} recorded runs:
+                {regressions} scenarios more than {history['threshold']:g}% slower than their median,
+                {flaky} with changing outcomes{f" (top {len(shown)} of {len(trends)} scenarios shown)" if len(shown) < len(trends) else ""}
+            </p>
+            <table class="perf-table">
+                <thead><tr>
+                    <th>Scenario</th><th>Duration trend</th><th class="num">Latest</th><th class="num">Median</th>
+                    <th class="num">Change</th><th class="num">Pass rate</th><th class="num">Flaky rate</th>
+                </tr></thead>
+                <tbody>{rows}
+                </tbody>
+            </table>
+        </div>
+"""
+
+def render_page(metrics, content, extra_css='', script=''):
+    """
+    Render the report page around its content.
+
+    Args:
+        metrics: Dictionary from calculate_metrics()
+        content: HTML of the sections below the pass rate
+        extra_css: Additional CSS rules
+        script: Additional script tags placed before </body>
+
+    Returns:
+        Page HTML
+    """
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -257,6 +809,107 @@ def generate_html_report(results, metrics, output_file='test_report.html'):
             padding: 20px;
         }}
 
+        .performance h3 {{
+            color: #4a5568;
+            margin: 25px 0 10px;
+        }}
+
+        .perf-note {{
+            color: #718096;
+            font-size: 0.9em;
+            margin-bottom: 10px;
+        }}
+
+        .perf-table {{
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.9em;
+        }}
+
+        .perf-table th, .perf-table td {{
+            text-align: left;
+            padding: 8px 10px;
+            border-bottom: 1px solid #e2e8f0;
+            color: #4a5568;
+        }}
+
+        .perf-table .num {{ text-align: right; white-space: nowrap; }}
+        .perf-table .slower, .test-delta.slower {{ color: #c53030; }}
+        .perf-table .faster, .test-delta.faster {{ color: #2f855a; }}
+
+        .perf-table tr.regression td {{ background: #fff5f5; }}
+
+        .sparkline {{ display: block; }}
+
+        .split-bar {{
+            display: flex;
+            height: 24px;
+            border-radius: 12px;
+            overflow: hidden;
+            background: #e2e8f0;
+            margin-bottom: 10px;
+        }}
+
+        .legend {{
+            display: inline-block;
+            width: 12px;
+            height: 12px;
+            border-radius: 3px;
+            margin-right: 8px;
+        }}
+
+        .test-delta {{
+            font-size: 0.85em;
+            margin-left: 10px;
+        }}
+
+        .waterfall {{
+            margin-top: 15px;
+        }}
+
+        .waterfall summary {{
+            cursor: pointer;
+            color: #4a5568;
+            font-size: 0.9em;
+        }}
+
+        .waterfall-row {{
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            margin-top: 6px;
+            font-size: 0.85em;
+            color: #4a5568;
+        }}
+
+        .waterfall-label {{
+            width: 35%;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }}
+
+        .waterfall-track {{
+            position: relative;
+            flex: 1;
+            height: 14px;
+            background: #edf2f7;
+            border-radius: 3px;
+        }}
+
+        .waterfall-bar {{
+            position: absolute;
+            top: 0;
+            height: 100%;
+            border-radius: 3px;
+        }}
+
+        .waterfall-time {{
+            width: 60px;
+            text-align: right;
+        }}
+
+{extra_css}
         .pie-chart {{
             width: 200px;
             height: 200px;
@@ -308,6 +961,41 @@ def generate_html_report(results, metrics, output_file='test_report.html'):
             </p>
         </div>
 
+{content}
+
+        <div class="footer">
+            <p>EM2M Test Automation Framework</p>
+            <p style="margin-top: 10px; font-size: 0.9em;">
+                Powered by Behave + Selenium + Python
+            </p>
+        </div>
+    </div>
+
+    <script>
+        // Animate progress bar on load
+        window.addEventListener('load', function() {{
+            const progressBar = document.querySelector('.progress-fill');
+            const width = progressBar.style.width;
+            progressBar.style.width = '0%';
+            setTimeout(() => {{
+                progressBar.style.width = width;
+            }}, 100);
+        }});
+    </script>{script}
+</body>
+</html>
+"""
+
+def generate_html_report(results, metrics, output_file='test_report.html', performance=None, history=None):
+    """Generate standalone HTML report."""
+    if performance is None:
+        performance = calculate_performance(results)
+    compared_runs = {c['id']: c for c in performance['comparison']}
+
+    html = render_performance_section(performance)
+    if history:
+        html += render_history_section(history)
+    html += """
         <div class="test-list">
             <h2 style="color: #2d3748; margin-bottom: 25px;">Test Results</h2>
 """
@@ -330,72 +1018,231 @@ def generate_html_report(results, metrics, output_file='test_report.html'):
                 steps_html += f'<div class="step" style="color: #a0aec0;">... and {len(steps) - 5} more steps</div>'
             steps_html += '</div>'
 
+        # Change against the previous run, if it ran this scenario
+        delta_html = ""
+        compared = compared_runs.get(scenario_id(result))
+        if compared:
+            trend = 'slower' if compared['delta'] > 0 else 'faster'
+            delta_html = (f'<span class="test-delta {trend}">{compared["delta"]:+.2f}s '
+                          f'vs previous run</span>')
+
         html += f"""
             <div class="test-item {status}">
                 <div class="test-name">{name}</div>
                 <span class="test-status {status}">{status}</span>
                 <span class="test-duration">{duration:.2f}s</span>
+                {delta_html}
                 {steps_html}
+                {render_waterfall(result)}
             </div>
         """
 
     html += """
         </div>
-
-        <div class="footer">
-            <p>EM2M Test Automation Framework</p>
-            <p style="margin-top: 10px; font-size: 0.9em;">
-                Powered by Behave + Selenium + Python
-            </p>
-        </div>
-    </div>
-
-    <script>
-        // Animate progress bar on load
-        window.addEventListener('load', function() {
-            const progressBar = document.querySelector('.progress-fill');
-            const width = progressBar.style.width;
-            progressBar.style.width = '0%';
-            setTimeout(() => {
-                progressBar.style.width = width;
-            }, 100);
-        });
-    </script>
-</body>
-</html>
 """
 
     # Write HTML file
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+        f.write(render_page(metrics, html))
 
     return output_file
 
+def compact_result(result):
+    """
+    Reduce a result to the row stored in a data chunk.
+
+    Returns:
+        List of name, status, duration (ms), feature, failure message and
+        steps as [name, offset (ms), duration (ms), category index]
+    """
+    categories = list(CATEGORY_COLORS)
+    feature = next(
+        (label.get('value') for label in result.get('labels', []) if label.get('name') == 'feature'),
+        None
+    )
+    message = (result.get('statusDetails') or {}).get('message') or ''
+    return [
+        result.get('name', 'Unknown Test'),
+        result.get('status', 'unknown'),
+        result.get('stop', 0) - result.get('start', 0),
+        feature,
+        message[:MAX_MESSAGE_LENGTH],
+        [
+            [step['name'], round(step['offset'] * 1000), round(step['duration'] * 1000),
+             categories.index(step['category'])]
+            for step in step_timings(result)
+        ]
+    ]
+
+def write_chunk(data_dir, index, rows):
+    """Write one data chunk as a script that hands its rows to the page."""
+    path = os.path.join(data_dir, f"chunk-{index:05d}.js")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"window.reportChunk({index},{json.dumps(rows, separators=(',', ':'))});\n")
+
+def generate_chunked_report(results, output_dir='test_report', chunk_size=CHUNK_SIZE, history=None):
+    """
+    Generate the report as a small page plus compact data chunks.
+
+    Results are streamed: each one is added to the summary and to the
+    current chunk, and a chunk is written as soon as it is full, so memory
+    stays bounded however many results there are. The page shows the same
+    summary sections and a virtualized, filterable result list that loads
+    chunks on demand.
+
+    Args:
+        results: Iterable of Allure results (e.g. iter_allure_results())
+        output_dir: Directory for index.html and the data/ chunks
+        chunk_size: Results per chunk
+        history: Optional run history data from update_history(), also
+            used for the comparison with the previous run
+
+    Returns:
+        Tuple of (index.html path, metrics, performance)
+    """
+    data_dir = os.path.join(output_dir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    for filename in os.listdir(data_dir):
+        if filename.startswith('chunk-'):
+            os.remove(os.path.join(data_dir, filename))
+
+    summary = ResultSummary()
+    rows = []
+    chunk_count = 0
+    for result in results:
+        summary.add(result)
+        rows.append(compact_result(result))
+        if len(rows) == chunk_size:
+            write_chunk(data_dir, chunk_count, rows)
+            chunk_count += 1
+            rows = []
+    if rows:
+        write_chunk(data_dir, chunk_count, rows)
+        chunk_count += 1
+
+    metrics = summary.metrics()
+    performance = summary.performance(history['previous_durations'] if history else None)
+    manifest = {
+        'dataDir': 'data',
+        'chunks': chunk_count,
+        'chunkSize': chunk_size,
+        'total': summary.total,
+        'categories': list(CATEGORY_COLORS.items())
+    }
+
+    content = render_performance_section(performance)
+    if history:
+        content += render_history_section(history, limit=CHUNKED_HISTORY_ROWS)
+    content += """
+        <div class="test-list">
+            <h2 style="color: #2d3748; margin-bottom: 25px;">Test Results</h2>
+            <div class="result-toolbar">
+                <input id="result-search" type="search" placeholder="Search scenarios and features">
+                <select id="result-status">
+                    <option value="">All statuses</option>
+                    <option value="passed">Passed</option>
+                    <option value="failed">Failed</option>
+                    <option value="broken">Broken</option>
+                    <option value="skipped">Skipped</option>
+                </select>
+                <span id="result-count" class="result-count"></span>
+            </div>
+            <div id="result-list" class="result-list"><div id="result-spacer" class="result-spacer"></div></div>
+            <div id="result-details" class="result-details" hidden></div>
+        </div>
+"""
+    script = (f"\n    <script>window.reportManifest = {json.dumps(manifest)};</script>" +
+              VIRTUAL_LIST_SCRIPT)
+
+    output_file = os.path.join(output_dir, 'index.html')
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(render_page(metrics, content, extra_css=VIRTUAL_LIST_CSS, script=script))
+
+    return output_file, metrics, performance
+
+def update_history(results_dir='allure-results'):
+    """
+    Add new results to the run history and read the trends.
+
+    Returns:
+        History section data for render_history_section(), plus the
+        previous run's scenario durations under 'previous_durations'
+    """
+    print("[History] Updating run history...")
+    run_history = RunHistory(Config.HISTORY_DB)
+    try:
+        added = run_history.ingest(results_dir)
+        history = {
+            'trends': run_history.trends(Config.HISTORY_RUNS, Config.REGRESSION_THRESHOLD),
+            'runs': run_history.run_count(),
+            'window': Config.HISTORY_RUNS,
+            'threshold': Config.REGRESSION_THRESHOLD,
+            'previous_durations': run_history.previous_durations(results_dir)
+        }
+    finally:
+        run_history.close()
+    print(f"[OK] Added {added} new results, {history['runs']} runs recorded in {Config.HISTORY_DB}")
+    return history
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Generate a standalone HTML report from allure-results.')
+    parser.add_argument('--chunked', action='store_true',
+                        help='Write a paginated report (index.html plus data chunks) for large result sets')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'Results per data chunk with --chunked (default: {CHUNK_SIZE})')
+    parser.add_argument('-o', '--output',
+                        help='Output file (default: test_report.html), or directory with --chunked '
+                             '(default: test_report)')
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     print("=" * 70)
     print("  EM2M Test Automation - HTML Report Generator")
     print("=" * 70)
     print()
 
-    # Read results
-    print("[Reading] Reading test results from allure-results/...")
-    results = read_allure_results()
+    if args.chunked:
+        # Stream results straight into the data chunks
+        history = update_history()
+        print("[Generating] Generating chunked HTML report...")
+        output_file, metrics, _ = generate_chunked_report(
+            iter_allure_results(), args.output or 'test_report', args.chunk_size, history
+        )
+        if metrics['total'] == 0:
+            print("[ERROR] No test results found!")
+            print("\nPlease run tests first:")
+            print("  behave -f allure_behave.formatter:AllureFormatter -o allure-results")
+            return
+    else:
+        # Read results
+        print("[Reading] Reading test results from allure-results/...")
+        results = read_allure_results()
 
-    if not results:
-        print("[ERROR] No test results found!")
-        print("\nPlease run tests first:")
-        print("  behave -f allure_behave.formatter:AllureFormatter -o allure-results")
-        return
+        if not results:
+            print("[ERROR] No test results found!")
+            print("\nPlease run tests first:")
+            print("  behave -f allure_behave.formatter:AllureFormatter -o allure-results")
+            return
+
+        print(f"[OK] Found {len(results)} test results")
 
-    print(f"[OK] Found {len(results)} test results")
+        # Calculate metrics
+        print("[Processing] Calculating metrics...")
+        summary = ResultSummary()
+        for result in results:
+            summary.add(result)
+        metrics = summary.metrics()
 
-    # Calculate metrics
-    print("[Processing] Calculating metrics...")
-    metrics = calculate_metrics(results)
+        history = update_history()
+        performance = summary.performance(history['previous_durations'])
 
-    # Generate HTML report
-    print("[Generating] Generating HTML report...")
-    output_file = generate_html_report(results, metrics)
+        # Generate HTML report
+        print("[Generating] Generating HTML report...")
+        output_file = generate_html_report(results, metrics, args.output or 'test_report.html',
+                                           performance=performance, history=history)
 
     print()
     print("=" * 70)
@@ -409,6 +1256,11 @@ def main():
     print(f"[Stats] Skipped: {metrics['skipped']}")
     print(f"[Stats] Pass Rate: {metrics['pass_rate']:.1f}%")
     print(f"[Stats] Duration: {format_duration(metrics['duration'])}")
+    regressions = [t['name'] for t in history['trends'] if t['regression']]
+    if regressions:
+        print(f"[WARNING] {len(regressions)} scenarios regressed by more than {Config.REGRESSION_THRESHOLD:g}%:")
+        for name in regressions:
+            print(f"   - {name}")
     print()
     print("[Browser] Open the report in your browser:")
     print(f"   file:///{os.path.abspath(output_file)}")
@@ -0,0 +1 @@
+"""Local stand-in EM2M application package."""
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the EM2M web application.
+
+Serves the pages the suite touches (login form, navbar search with
+autocomplete, the ASEED organization page and the assets list) from a
+stdlib HTTP server, so the suite can run offline and the framework itself
+can be benchmarked without depending on the dev server's latency.
+
+Usage:
+    python -m mock_app.server --port 8765 --latency 150
+    BASE_URL=http://127.0.0.1:8765 behave
+
+    # Or let behave start it in-process
+    MOCK_APP=true behave
+"""
+
+import argparse
+import html
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import urlparse, parse_qs
+
+from config.config import Config
+
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+SESSION_COOKIE = 'em2m_session'
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.svg': 'image/svg+xml',
+    '.json': 'application/json'
+}
+
+# Organizations reachable through search. Created/updated are offsets from
+# the time the page is served, so relative dates always read the same.
+ORGANIZATIONS = {
+    'd1609db2-2f95-461c-bcd8-9338d07e48b9': {
+        'name': 'ASEED',
+        'tags': [('Dealer', 'dealer'), ('Stolen Vehicle Recovery', 'recovery'), ('Payment Assurance', 'payment')],
+        'created': timedelta(days=1),
+        'updated': timedelta(hours=1),
+        'cards': [
+            ('Loans', 0, 'account_balance', 'dark-gray'),
+            ('Assets', 1, 'local_offer', 'blue'),
+            ('Recovery Orders', 1, 'local_shipping', 'dark-blue'),
+            ('Vehicles', 0, 'directions_car', 'dark-gray'),
+            ('Media', 0, 'play_circle', 'blue'),
+            ('Geofences', 0, 'map', 'dark-blue')
+        ]
+    },
+    '5b0f4c1e-8d2a-4f6b-9c3e-7a1d2e3f4a5b': {
+        'name': 'ASEED Holdings',
+        'tags': [('Dealer', 'dealer')],
+        'created': timedelta(days=30),
+        'updated': timedelta(days=2),
+        'cards': [
+            ('Loans', 3, 'account_balance', 'dark-gray'),
+            ('Assets', 4, 'local_offer', 'blue'),
+            ('Recovery Orders', 0, 'local_shipping', 'dark-blue'),
+            ('Vehicles', 2, 'directions_car', 'dark-gray'),
+            ('Media', 0, 'play_circle', 'blue'),
+            ('Geofences', 1, 'map', 'dark-blue')
+        ]
+    },
+    '9e8d7c6b-5a4f-4e3d-8c2b-1a0f9e8d7c6b': {
+        'name': 'Equipment Rentals Inc',
+        'tags': [('Payment Assurance', 'payment')],
+        'created': timedelta(days=90),
+        'updated': timedelta(days=7),
+        'cards': [
+            ('Loans', 12, 'account_balance', 'dark-gray'),
+            ('Assets', 40, 'local_offer', 'blue'),
+            ('Recovery Orders', 2, 'local_shipping', 'dark-blue'),
+            ('Vehicles', 0, 'directions_car', 'dark-gray'),
+            ('Media', 5, 'play_circle', 'blue'),
+            ('Geofences', 3, 'map', 'dark-blue')
+        ]
+    }
+}
+
+ASSETS = [
+    {'name': 'ASEED Demo Truck', 'type': 'Vehicle', 'status': 'Active'},
+    {'name': 'Asset Tag 0042', 'type': 'Tracker', 'status': 'Active'},
+    {'name': 'Asset Tracker Demo', 'type': 'Tracker', 'status': 'Inactive'},
+    {'name': 'Equipment Trailer 12', 'type': 'Trailer', 'status': 'Active'},
+    {'name': 'Equipment Generator 3', 'type': 'Equipment', 'status': 'Maintenance'}
+]
+
+
+def format_date(moment, now):
+    """Format a date like the application: 'October 17, 2026 (a day ago)'."""
+    seconds = (now - moment).total_seconds()
+    if seconds < 3600:
+        relative = 'a few minutes ago'
+    elif seconds < 7200:
+        relative = 'an hour ago'
+    elif seconds < 86400:
+        relative = f"{int(seconds // 3600)} hours ago"
+    elif seconds < 172800:
+        relative = 'a day ago'
+    else:
+        relative = f"{int(seconds // 86400)} days ago"
+    return f"{moment:%B} {moment.day}, {moment.year} ({relative})"
+
+
+def search_items(query):
+    """
+    Find organizations and assets whose name contains the query.
+
+    Args:
+        query: Search text (case insensitive)
+
+    Returns:
+        List of {'name', 'type', 'url'} dictionaries
+    """
+    query = query.strip().lower()
+    if not query:
+        return []
+    results = [
+        {'name': org['name'], 'type': 'Organization', 'url': f"/org/{org_id}"}
+        for org_id, org in ORGANIZATIONS.items() if query in org['name'].lower()
+    ]
+    results.extend(
+        {'name': asset['name'], 'type': 'Asset', 'url': '/assets'}
+        for asset in ASSETS if query in asset['name'].lower()
+    )
+    return results
+
+
+class MockEm2mApp:
+    """Stand-in EM2M application served from a background thread."""
+
+    def __init__(self, host='127.0.0.1', port=8765, latency=0,
+                 username=Config.TEST_USERNAME, password=Config.TEST_PASSWORD):
+        """
+        Initialize the application.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on
+            latency: Delay in milliseconds added to every response
+            username: Username accepted by the login form
+            password: Password accepted by the login form
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.credentials = (username, password)
+        self.sessions = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the running application."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving in a daemon thread."""
+        self._server = ThreadingHTTPServer((self.host, self.port), MockEm2mRequestHandler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-em2m-app', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        self._server = ThreadingHTTPServer((self.host, self.port), MockEm2mRequestHandler)
+        self._server.app = self
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+
+class MockEm2mRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the mock pages and API endpoints."""
+
+    server_version = 'MockEM2M/1.0'
+
+    @property
+    def app(self):
+        return self.server.app
+
+    def log_message(self, format, *args):
+        """Keep test output clean, requests are not logged."""
+
+    def do_GET(self):
+        self._delay()
+        url = urlparse(self.path)
+        path = url.path.rstrip('/') or '/'
+
+        if path.startswith('/static/'):
+            return self._send_static(path[len('/static/'):])
+        if path == '/favicon.ico':
+            return self._send(204, b'')
+        if path == '/login':
+            return self._send_html(self._render('login.html', title='Login | EM2M'))
+
+        # Everything else requires a session
+        if not self._session_user():
+            return self._redirect('/login')
+
+        if path == '/':
+            return self._redirect('/dashboard')
+        if path == '/dashboard':
+            return self._send_page('Dashboard | EM2M', self._render('dashboard.html'))
+        if path == '/assets':
+            return self._send_page('Assets | EM2M', self._render_assets())
+        if path.startswith('/org/'):
+            org_id = path.split('/')[2]
+            if org_id in ORGANIZATIONS:
+                org = ORGANIZATIONS[org_id]
+                return self._send_page(f"{org['name']} | EM2M", self._render_organization(org_id, org))
+        if path == '/api/search':
+            query = parse_qs(url.query).get('q', [''])[0]
+            return self._send_json(200, {'results': search_items(query)})
+
+        return self._send_page('Not Found | EM2M', '<h1>Page not found</h1>', status=404)
+
+    def do_POST(self):
+        self._delay()
+        path = urlparse(self.path).path
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            body = {}
+
+        if path == '/api/login':
+            return self._login(body.get('username', ''), body.get('password', ''))
+        if path == '/api/logout':
+            self.app.sessions.pop(self._session_token(), None)
+            return self._send_json(200, {'redirect': '/login'})
+
+        return self._send_json(404, {'error': 'Not found'})
+
+    # ----------------------------------------
+    # Handlers
+    # ----------------------------------------
+
+    def _login(self, username, password):
+        """Check credentials and start a session."""
+        if not username.strip() or not password:
+            return self._send_json(400, {'error': 'Invalid username or password'})
+        if (username.strip(), password) != self.app.credentials:
+            return self._send_json(401, {'error': 'Incorrect username or password'})
+
+        token = uuid.uuid4().hex
+        self.app.sessions[token] = username.strip()
+        cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+        return self._send_json(200, {'token': token, 'redirect': '/dashboard'}, headers={'Set-Cookie': cookie})
+
+    def _render_organization(self, org_id, org):
+        """Render the organization page."""
+        now = datetime.now()
+        tags = ''.join(
+            f'<mat-chip class="tag tag-{style}">{html.escape(name)}</mat-chip>'
+            for name, style in org['tags']
+        )
+        cards = ''.join(
+            f'<mat-card class="mat-card dashboard-card card-{color}" role="link" tabindex="0" '
+            f'data-section="{label.lower().replace(" ", "-")}">'
+            f'<mat-icon class="card-icon" data-icon="{icon}"></mat-icon>'
+            f'<div class="card-count">{count}</div>'
+            f'<div class="card-label">{html.escape(label)}</div>'
+            f'</mat-card>'
+            for label, count, icon, color in org['cards']
+        )
+        return self._render(
+            'organization.html',
+            org_id=org_id,
+            name=html.escape(org['name']),
+            tags=tags,
+            created=format_date(now - org['created'], now),
+            updated=format_date(now - org['updated'], now),
+            cards=cards
+        )
+
+    def _render_assets(self):
+        """Render the assets list."""
+        items = ''.join(
+            f'<div class="asset-item"><span class="asset-name">{html.escape(asset["name"])}</span>'
+            f'<span class="asset-type">{asset["type"]}</span>'
+            f'<span class="asset-status">{asset["status"]}</span></div>'
+            for asset in ASSETS
+        )
+        return self._render('assets.html', items=items, count=len(ASSETS))
+
+    # ----------------------------------------
+    # Helpers
+    # ----------------------------------------
+
+    def _delay(self):
+        """Apply the configured response latency."""
+        if self.app.latency:
+            time.sleep(self.app.latency / 1000)
+
+    def _session_token(self):
+        """Get the session token from the request cookies."""
+        jar = cookies.SimpleCookie(self.headers.get('Cookie', ''))
+        return jar[SESSION_COOKIE].value if SESSION_COOKIE in jar else None
+
+    def _session_user(self):
+        """Get the logged in user of the request, if any."""
+        return self.app.sessions.get(self._session_token())
+
+    def _render(self, template_name, **values):
+        """Fill a template from the templates directory."""
+        with open(os.path.join(TEMPLATES_DIR, template_name), 'r', encoding='utf-8') as f:
+            return Template(f.read()).substitute(values)
+
+    def _send_page(self, title, content, status=200):
+        """Send a page inside the application shell (header, side menu, search)."""
+        user = html.escape(self._session_user() or '')
+        self._send_html(self._render('shell.html', title=title, user=user, content=content), status)
+
+    def _send_html(self, page, status=200):
+        self._send(status, page.encode('utf-8'), CONTENT_TYPES['.html'])
+
+    def _send_json(self, status, data, headers=None):
+        self._send(status, json.dumps(data).encode('utf-8'), CONTENT_TYPES['.json'], headers)
+
+    def _send_static(self, name):
+        """Send a file from the static directory."""
+        path = os.path.normpath(os.path.join(STATIC_DIR, name))
+        if not path.startswith(STATIC_DIR + os.sep) or not os.path.isfile(path):
+            return self._send(404, b'Not found', 'text/plain')
+        with open(path, 'rb') as f:
+            content = f.read()
+        content_type = CONTENT_TYPES.get(os.path.splitext(path)[1], 'application/octet-stream')
+        self._send(200, content, content_type, {'Cache-Control': 'max-age=3600'})
+
+    def _redirect(self, location):
+        self._send(302, b'', headers={'Location': location})
+
+    def _send(self, status, body, content_type=None, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Serve a local stand-in EM2M application.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=Config.MOCK_APP_PORT,
+                        help=f'Port to listen on (default: {Config.MOCK_APP_PORT})')
+    parser.add_argument('--latency', type=int, default=Config.MOCK_APP_LATENCY,
+                        help='Delay in milliseconds added to every response (default: MOCK_APP_LATENCY)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    app = MockEm2mApp(host=args.host, port=args.port, latency=args.latency)
+
+    print("=" * 70)
+    print("  EM2M Test Automation - Mock Application")
+    print("=" * 70)
+    print()
+    print(f"[OK] Serving at {app.url} (latency {args.latency} ms)")
+    print(f"     Run the suite with: BASE_URL={app.url} behave")
+    print("     Press Ctrl+C to stop")
+
+    try:
+        app.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[OK] Stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,237 @@
+/*
+ * Behaviour of the stand-in EM2M application.
+ *
+ * Like the real Angular app, pending work (debounce timers and requests)
+ * is reported through window.getAllAngularTestabilities(), so the suite's
+ * stability wait behaves the same against both.
+ */
+(function () {
+    'use strict';
+
+    var SEARCH_DEBOUNCE_MS = 300;
+    var pendingTasks = 0;
+
+    window.getAllAngularTestabilities = function () {
+        return [{ isStable: function () { return pendingTasks === 0; } }];
+    };
+
+    function startTask() {
+        var finished = false;
+        pendingTasks++;
+        return function () {
+            if (!finished) {
+                finished = true;
+                pendingTasks--;
+            }
+        };
+    }
+
+    function request(url, options) {
+        var endTask = startTask();
+        return fetch(url, options).then(function (response) {
+            return response.json().then(function (body) {
+                return { ok: response.ok, body: body };
+            });
+        }).finally(endTask);
+    }
+
+    function toggle(element, show) {
+        if (element) {
+            element.hidden = show === undefined ? !element.hidden : !show;
+        }
+    }
+
+    function on(selector, event, handler) {
+        Array.prototype.forEach.call(document.querySelectorAll(selector), function (element) {
+            element.addEventListener(event, handler);
+        });
+    }
+
+    // ----------------------------------------
+    // Login
+    // ----------------------------------------
+
+    function initLogin() {
+        var form = document.querySelector('form.login-form');
+        if (!form) { return; }
+        var error = form.querySelector('.mat-error');
+
+        form.addEventListener('submit', function (event) {
+            event.preventDefault();
+            toggle(error, false);
+            request('/api/login', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ username: form.username.value, password: form.password.value })
+            }).then(function (result) {
+                if (result.ok) {
+                    window.localStorage.setItem('em2m_token', result.body.token);
+                    window.location.href = result.body.redirect;
+                } else {
+                    error.textContent = result.body.error;
+                    toggle(error, true);
+                }
+            });
+        });
+    }
+
+    // ----------------------------------------
+    // Header: side menu, profile menu, notifications
+    // ----------------------------------------
+
+    function initHeader() {
+        on('.menu-button', 'click', function () { toggle(document.querySelector('.sidenav')); });
+        on('.profile-button', 'click', function () { toggle(document.querySelector('.profile-menu')); });
+        on('.notification-button', 'click', function () { toggle(document.querySelector('.notification-panel')); });
+        on('.logout-button', 'click', function () {
+            request('/api/logout', { method: 'POST' }).then(function (result) {
+                window.localStorage.removeItem('em2m_token');
+                window.location.href = result.body.redirect;
+            });
+        });
+    }
+
+    // ----------------------------------------
+    // Navbar search with autocomplete
+    // ----------------------------------------
+
+    function initSearch() {
+        var button = document.querySelector('.search-button');
+        var input = document.querySelector('input.search-input');
+        var overlay = document.querySelector('.cdk-overlay-container');
+        if (!button || !input || !overlay) { return; }
+
+        var timer = null, endDebounce = null, latestQuery = 0;
+
+        function close() {
+            overlay.innerHTML = '';
+        }
+
+        function render(results) {
+            close();
+            if (!results.length) { return; }
+
+            var rect = input.getBoundingClientRect();
+            var pane = document.createElement('div');
+            pane.className = 'cdk-overlay-pane';
+            pane.style.top = (rect.bottom + window.scrollY + 4) + 'px';
+            pane.style.left = Math.max(0, rect.left + window.scrollX) + 'px';
+
+            var panel = document.createElement('div');
+            panel.className = 'mat-mdc-autocomplete-panel';
+            panel.setAttribute('role', 'listbox');
+
+            results.forEach(function (result) {
+                var option = document.createElement('mat-option');
+                option.className = 'mat-mdc-option';
+                option.setAttribute('role', 'option');
+                var text = document.createElement('span');
+                text.className = 'mdc-list-item__primary-text';
+                text.textContent = result.name;
+                option.appendChild(text);
+                option.addEventListener('click', function () {
+                    close();
+                    window.location.href = result.url;
+                });
+                panel.appendChild(option);
+            });
+
+            pane.appendChild(panel);
+            overlay.appendChild(pane);
+        }
+
+        function search(query) {
+            var queryId = ++latestQuery;
+            if (!query.trim()) {
+                close();
+                return;
+            }
+            request('/api/search?q=' + encodeURIComponent(query)).then(function (result) {
+                // Ignore responses to queries the user already typed past
+                if (queryId === latestQuery) {
+                    render(result.body.results);
+                }
+            });
+        }
+
+        button.addEventListener('click', function () {
+            toggle(input, true);
+            input.focus();
+        });
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            if (!endDebounce) {
+                endDebounce = startTask();
+            }
+            timer = setTimeout(function () {
+                var end = endDebounce;
+                endDebounce = null;
+                // Start the request before ending the debounce task so the
+                // app never looks stable in between
+                search(input.value);
+                end();
+            }, SEARCH_DEBOUNCE_MS);
+        });
+
+        input.addEventListener('keydown', function (event) {
+            if (event.key === 'Escape') { close(); }
+        });
+
+        document.addEventListener('click', function (event) {
+            if (event.target !== input && !overlay.contains(event.target)) { close(); }
+        });
+    }
+
+    // ----------------------------------------
+    // Organization page: tabs, cards, upload dialog
+    // ----------------------------------------
+
+    function initOrganization() {
+        on('.mat-tab-label', 'click', function (event) {
+            var selected = event.currentTarget.getAttribute('data-tab');
+            Array.prototype.forEach.call(document.querySelectorAll('.mat-tab-label'), function (tab) {
+                var active = tab.getAttribute('data-tab') === selected;
+                tab.classList.toggle('mat-tab-label-active', active);
+                tab.setAttribute('aria-selected', active ? 'true' : 'false');
+            });
+            Array.prototype.forEach.call(document.querySelectorAll('.mat-tab-body'), function (body) {
+                toggle(body, body.getAttribute('data-tab') === selected);
+            });
+        });
+
+        on('.dashboard-card', 'click', function (event) {
+            window.location.hash = event.currentTarget.getAttribute('data-section');
+        });
+
+        on('.upload-button', 'click', function () { toggle(document.querySelector('.upload-dialog'), true); });
+        on('.close-dialog', 'click', function () { toggle(document.querySelector('.upload-dialog'), false); });
+    }
+
+    // ----------------------------------------
+    // Assets page: client side filter
+    // ----------------------------------------
+
+    function initAssets() {
+        var input = document.querySelector('.asset-search');
+        if (!input) { return; }
+        var count = document.querySelector('.results-count');
+
+        input.addEventListener('input', function () {
+            var query = input.value.trim().toLowerCase();
+            var visible = 0;
+            Array.prototype.forEach.call(document.querySelectorAll('.asset-item'), function (item) {
+                var match = item.textContent.toLowerCase().indexOf(query) !== -1;
+                toggle(item, match);
+                if (match) { visible++; }
+            });
+            count.textContent = visible + ' results';
+        });
+    }
+
+    initLogin();
+    initHeader();
+    initSearch();
+    initOrganization();
+    initAssets();
+})();
@@ -7,8 +7,76 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
-import time
+
+
+# Reads the dashboard card index in one round trip. A card is the largest
+# card element whose text contains its own label and none of the other
+# labels, which skips both inner card parts and wrappers around several
+# cards. Only this label to element lookup is cached in the page; it is
+# rebuilt when a MutationObserver sees the DOM change or the URL or
+# viewport size differ. Text, counts, geometry, visibility and computed
+# colours are re-read from the elements on every call, so class and style
+# toggles, zoom and viewport emulation are always reflected.
+CARD_INDEX_SCRIPT = """
+var selector = arguments[0], labels = arguments[1];
+var w = window;
+
+if (!w.__em2mCardIndex) {
+    var state = w.__em2mCardIndex = {mutations: 0, version: null, elements: {}};
+    new MutationObserver(function() { state.mutations++; }).observe(document.documentElement, {
+        childList: true, subtree: true, characterData: true, attributes: true
+    });
+}
+var index = w.__em2mCardIndex;
+var version = [index.mutations, location.href, w.innerWidth, w.innerHeight, selector, labels.join('|')].join(':');
+
+if (version !== index.version) {
+    var candidates = Array.prototype.slice.call(document.querySelectorAll(selector)).map(function(el) {
+        var rect = el.getBoundingClientRect();
+        return {el: el, text: el.textContent || '', area: rect.width * rect.height};
+    });
+    index.elements = {};
+    labels.forEach(function(label) {
+        var best = null;
+        candidates.forEach(function(c) {
+            if (c.text.indexOf(label) === -1) { return; }
+            var mixed = labels.some(function(other) { return other !== label && c.text.indexOf(other) !== -1; });
+            if (!mixed && (best === null || c.area > best.area)) { best = c; }
+        });
+        if (best !== null) { index.elements[label] = best.el; }
+    });
+    index.version = version;
+}
+
+var cards = {};
+labels.forEach(function(label) {
+    var el = index.elements[label];
+    if (!el || !el.isConnected) { return; }
+    var rect = el.getBoundingClientRect();
+    var style = w.getComputedStyle(el);
+    var text = (el.innerText || el.textContent || '').trim();
+    var count = text.match(/\\d+/);
+    cards[label] = {
+        label: label,
+        count: count ? count[0] : null,
+        text: text,
+        background_color: style.backgroundColor,
+        color: style.color,
+        rect: {
+            x: rect.left + w.scrollX,
+            y: rect.top + w.scrollY,
+            width: rect.width,
+            height: rect.height
+        },
+        visible: rect.width * rect.height > 0 && style.display !== 'none' && style.visibility !== 'hidden',
+        element: el
+    };
+});
+
+return cards;
+"""
 
 
 class AseedPage(BasePage):
@@ -18,6 +86,7 @@ class AseedPage(BasePage):
     # LOCATORS - Header/Navigation
     # ========================================
     HEADER = (By.CSS_SELECTOR, "header, .header, mat-toolbar")
+    HEADER_BUTTONS = (By.CSS_SELECTOR, "mat-toolbar button, header button, .header button")
     MENU_BUTTON = (By.XPATH, "//button[contains(@class, 'mat-mdc-icon-button')]//mat-icon[text()='menu']")
     SEARCH_BUTTON_HEADER = (By.XPATH, "//button[contains(text(), 'search') or .//mat-icon[text()='search']]")
     PROFILE_BUTTON = (By.CSS_SELECTOR, ".profile-button, button.profile-button")
@@ -60,13 +129,27 @@ class AseedPage(BasePage):
     # ========================================
     # LOCATORS - Dashboard Cards
     # ========================================
-    CARD_LOANS = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Loans')]]")
-    CARD_ASSETS = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Assets')]]")
-    CARD_RECOVERY_ORDERS = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Recovery Orders')]]")
-    CARD_VEHICLES = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Vehicles')]]")
-    CARD_MEDIA = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Media')]]")
-    CARD_GEOFENCES = (By.XPATH, "//*[contains(@class, 'card') or contains(@class, 'mat-card')][.//text()[contains(., 'Geofences')]]")
     ALL_CARDS = (By.CSS_SELECTOR, "mat-card, .mat-card, [class*='card']")
+    DASHBOARD_CARD_LABELS = ("Loans", "Assets", "Recovery Orders", "Vehicles", "Media", "Geofences")
+
+    # Pixels two layout measurements may differ by and still count as equal
+    LAYOUT_TOLERANCE = 2
+
+    # Regions with visual baselines, and the dynamic content (dates and
+    # card counts) masked out of every visual comparison
+    VISUAL_REGIONS = {
+        'header': HEADER,
+        'organization details': (By.CSS_SELECTOR, ".org-details, .org-info"),
+        'dashboard cards': (By.CSS_SELECTOR, ".card-grid, .mat-tab-body")
+    }
+    VISUAL_MASKS = (CREATED_DATE, UPDATED_DATE, (By.CSS_SELECTOR, ".card-count, [class*='count']"))
+
+    # Viewport sizes of the responsive checks
+    BREAKPOINTS = {
+        'mobile': (375, 667),
+        'tablet': (768, 1024),
+        'desktop': (1920, 1080)
+    }
 
     def __init__(self, driver):
         """Initialize the ASEED page object."""
@@ -106,7 +189,7 @@ class AseedPage(BasePage):
         """Click the menu/hamburger button."""
         element = self.wait_for_element(*self.MENU_BUTTON)
         element.click()
-        time.sleep(1)
+        self.wait_until_stable()
 
     def is_search_button_visible(self):
         """Check if search button in header is visible."""
@@ -120,7 +203,7 @@ class AseedPage(BasePage):
         """Click profile button."""
         element = self.wait_for_element(*self.PROFILE_BUTTON)
         element.click()
-        time.sleep(1)
+        self.wait_until_stable()
 
     def is_notifications_icon_visible(self):
         """Check if notifications icon is visible."""
@@ -182,7 +265,7 @@ class AseedPage(BasePage):
         """Click upload logo button."""
         element = self.wait_for_element(*self.UPLOAD_LOGO_BUTTON)
         element.click()
-        time.sleep(1)
+        self.wait_until_stable()
 
     def is_elasticm2m_logo_visible(self):
         """Check if ElasticM2M logo is visible."""
@@ -289,8 +372,10 @@ class AseedPage(BasePage):
         locator = tab_map.get(tab_name.upper())
         if locator:
             element = self.wait_for_element(*locator)
+            mark = self.mark_route_change()
             self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(2)
+            self.wait_until_stable()
+            self.record_page_visit(tab_name, mark)
 
     def is_tab_active(self, tab_name):
         """Check if a tab is currently active."""
@@ -308,77 +393,72 @@ class AseedPage(BasePage):
     # DASHBOARD CARDS METHODS
     # ========================================
 
+    def get_card_index(self):
+        """
+        Get the dashboard card index with the cards' current state.
+
+        One script call reads every card. The page caches which element
+        belongs to which label and only searches again after DOM changes,
+        navigation or a viewport resize; the entries themselves are read
+        fresh each time.
+
+        Returns:
+            Dictionary mapping upper-case card label to a card entry with
+            'label', 'count', 'text', 'background_color', 'color', 'rect',
+            'visible' and 'element' keys
+        """
+        cards = self.driver.execute_script(CARD_INDEX_SCRIPT, self.ALL_CARDS[1], list(self.DASHBOARD_CARD_LABELS))
+        return {label.upper(): card for label, card in cards.items()}
+
+    def get_card(self, card_name, timeout=5):
+        """
+        Wait for a dashboard card to be visible and get its index entry.
+
+        Args:
+            card_name: Card label (case insensitive)
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            Card entry or None if the card is not visible
+        """
+        if card_name.upper() not in (label.upper() for label in self.DASHBOARD_CARD_LABELS):
+            return None
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                lambda d: self._visible_card(card_name)
+            )
+        except TimeoutException:
+            return None
+
+    def _visible_card(self, card_name):
+        """Get a card entry from the index if the card is visible."""
+        card = self.get_card_index().get(card_name.upper())
+        return card if card and card['visible'] else None
+
     def is_card_visible(self, card_name):
         """Check if a specific card is visible."""
-        card_map = {
-            "LOANS": self.CARD_LOANS,
-            "ASSETS": self.CARD_ASSETS,
-            "RECOVERY ORDERS": self.CARD_RECOVERY_ORDERS,
-            "VEHICLES": self.CARD_VEHICLES,
-            "MEDIA": self.CARD_MEDIA,
-            "GEOFENCES": self.CARD_GEOFENCES
-        }
-        locator = card_map.get(card_name.upper())
-        if locator:
-            return self.is_element_visible(*locator, timeout=5)
-        return False
+        return self.get_card(card_name) is not None
 
     def get_card_count_value(self, card_name):
         """Get the count value displayed on a card."""
-        card_map = {
-            "LOANS": self.CARD_LOANS,
-            "ASSETS": self.CARD_ASSETS,
-            "RECOVERY ORDERS": self.CARD_RECOVERY_ORDERS,
-            "VEHICLES": self.CARD_VEHICLES,
-            "MEDIA": self.CARD_MEDIA,
-            "GEOFENCES": self.CARD_GEOFENCES
-        }
-        locator = card_map.get(card_name.upper())
-        if locator:
-            try:
-                card = self.wait_for_element(*locator, timeout=5)
-                # Find the count number in the card
-                text = card.text
-                # Extract number from text
-                import re
-                numbers = re.findall(r'\d+', text)
-                if numbers:
-                    return numbers[0]
-            except:
-                pass
-        return None
+        card = self.get_card(card_name)
+        return card['count'] if card else None
 
     def click_card(self, card_name):
         """Click on a specific dashboard card."""
-        card_map = {
-            "LOANS": self.CARD_LOANS,
-            "ASSETS": self.CARD_ASSETS,
-            "RECOVERY ORDERS": self.CARD_RECOVERY_ORDERS,
-            "VEHICLES": self.CARD_VEHICLES,
-            "MEDIA": self.CARD_MEDIA,
-            "GEOFENCES": self.CARD_GEOFENCES
-        }
-        locator = card_map.get(card_name.upper())
-        if locator:
-            element = self.wait_for_element(*locator)
-            self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(2)
+        card = self.get_card(card_name, timeout=self.timeout)
+        if card:
+            mark = self.mark_route_change()
+            self.driver.execute_script("arguments[0].click();", card['element'])
+            self.wait_until_stable()
+            self.record_page_visit(card_name, mark)
 
     def hover_over_card(self, card_name):
         """Hover over a specific card."""
-        card_map = {
-            "LOANS": self.CARD_LOANS,
-            "ASSETS": self.CARD_ASSETS,
-            "RECOVERY ORDERS": self.CARD_RECOVERY_ORDERS,
-            "VEHICLES": self.CARD_VEHICLES,
-            "MEDIA": self.CARD_MEDIA,
-            "GEOFENCES": self.CARD_GEOFENCES
-        }
-        locator = card_map.get(card_name.upper())
-        if locator:
-            element = self.wait_for_element(*locator)
-            ActionChains(self.driver).move_to_element(element).perform()
-            time.sleep(0.5)
+        card = self.get_card(card_name, timeout=self.timeout)
+        if card:
+            ActionChains(self.driver).move_to_element(card['element']).perform()
+            self.wait_until_stable()
 
     def get_all_cards(self):
         """Get all dashboard card elements."""
@@ -386,22 +466,49 @@ class AseedPage(BasePage):
 
     def get_card_background_color(self, card_name):
         """Get background color of a specific card."""
-        card_map = {
-            "LOANS": self.CARD_LOANS,
-            "ASSETS": self.CARD_ASSETS,
-            "RECOVERY ORDERS": self.CARD_RECOVERY_ORDERS,
-            "VEHICLES": self.CARD_VEHICLES,
-            "MEDIA": self.CARD_MEDIA,
-            "GEOFENCES": self.CARD_GEOFENCES
-        }
-        locator = card_map.get(card_name.upper())
-        if locator:
-            try:
-                element = self.wait_for_element(*locator, timeout=5)
-                return element.value_of_css_property('background-color')
-            except:
-                pass
-        return None
+        card = self.get_card(card_name)
+        return card['background_color'] if card else None
+
+    # ========================================
+    # LAYOUT SNAPSHOT METHODS
+    # ========================================
+
+    def get_dashboard_card_layout(self):
+        """
+        Get the layout of the visible dashboard cards from the card index.
+
+        Returns:
+            Dictionary mapping card label to card entry
+        """
+        return {card['label']: card for card in self.get_card_index().values() if card['visible']}
+
+    def get_tab_layout(self):
+        """Get snapshot entries of the visible tabs, left to right."""
+        entries = self.snapshot([self.ALL_TABS], ('font-size', 'text-transform'))[self.ALL_TABS]
+        return sorted([e for e in entries if e['visible']], key=lambda e: e['rect']['x'])
+
+    def get_header_button_layout(self):
+        """Get snapshot entries of the visible header buttons."""
+        entries = self.snapshot([self.HEADER_BUTTONS])[self.HEADER_BUTTONS]
+        return [e for e in entries if e['visible']]
+
+    def group_into_rows(self, entries):
+        """
+        Group snapshot entries into rows by their top edge.
+
+        Args:
+            entries: Snapshot entries
+
+        Returns:
+            List of rows from top to bottom, each sorted left to right
+        """
+        rows = []
+        for entry in sorted(entries, key=lambda e: (e['rect']['y'], e['rect']['x'])):
+            if rows and abs(rows[-1][0]['rect']['y'] - entry['rect']['y']) <= self.LAYOUT_TOLERANCE:
+                rows[-1].append(entry)
+            else:
+                rows.append([entry])
+        return rows
 
     # ========================================
     # UTILITY METHODS
@@ -410,7 +517,7 @@ class AseedPage(BasePage):
     def scroll_to_element(self, element):
         """Scroll to a specific element."""
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-        time.sleep(0.5)
+        self.wait_until_stable()
 
     def get_element_size(self, locator):
         """Get size of an element."""
@@ -438,5 +545,35 @@ class AseedPage(BasePage):
 
     def set_viewport_size(self, width, height):
         """Set viewport size."""
-        self.driver.set_window_size(width, height)
-        time.sleep(1)
+        self.set_viewport(width, height)
+
+    def capture_visual_region(self, region_name='page'):
+        """
+        Screenshot the page or a named region with the dynamic content masked.
+
+        Args:
+            region_name: 'page' or a name from VISUAL_REGIONS
+
+        Returns:
+            Tuple of (PNG bytes, mask rectangles, CSS width), see
+            BasePage.capture_for_comparison()
+        """
+        region = None if region_name == 'page' else self.VISUAL_REGIONS[region_name]
+        return self.capture_for_comparison(region, self.VISUAL_MASKS)
+
+    def sweep_layout(self, breakpoint_names=None):
+        """
+        Capture the organization name, tabs and cards at several breakpoints.
+
+        Args:
+            breakpoint_names: Names from BREAKPOINTS (default: all of them)
+
+        Returns:
+            Dictionary mapping breakpoint name to its layout, see
+            BasePage.sweep_viewports()
+        """
+        names = breakpoint_names or list(self.BREAKPOINTS)
+        return self.sweep_viewports(
+            {name: self.BREAKPOINTS[name] for name in names},
+            [self.ORG_NAME, self.ALL_TABS, self.ALL_CARDS]
+        )
@@ -4,6 +4,7 @@ Page Object Model for Assets Page.
 
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from config.config import Config
 
 
 class AssetsPage(BasePage):
@@ -27,7 +28,7 @@ class AssetsPage(BasePage):
     def __init__(self, driver):
         """Initialize the assets page."""
         super().__init__(driver)
-        self.base_url = "https://elasticm2m-dev.app.em2m.net"
+        self.base_url = Config.BASE_URL
 
     def navigate_to_assets(self):
         """Navigate to the assets page."""
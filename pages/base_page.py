@@ -5,7 +5,181 @@ Base Page class containing common methods for all pages.
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utilities import sleep_budget
+from utilities.screenshot_writer import capture_screenshot
+from utilities.web_vitals import WebVitalsCollector
+import time
+
+
+# Resolves true once the page has been quiet for the requested period:
+# Angular testabilities stable (the signal whenStable() resolves on), no
+# XHR/fetch requests in flight and no finite CSS animations running.
+# Resolves false when the timeout expires first.
+WAIT_UNTIL_STABLE_SCRIPT = """
+var timeoutMs = arguments[0], quietMs = arguments[1], done = arguments[arguments.length - 1];
+var w = window;
+
+if (!w.__em2mRequestTracker) {
+    var tracker = w.__em2mRequestTracker = {pending: 0};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        tracker.pending++;
+        this.addEventListener('loadend', function() { tracker.pending--; }, {once: true});
+        return send.apply(this, arguments);
+    };
+    if (w.fetch) {
+        var fetch = w.fetch;
+        w.fetch = function() {
+            tracker.pending++;
+            return fetch.apply(this, arguments).finally(function() { tracker.pending--; });
+        };
+    }
+}
+
+function angularStable() {
+    if (typeof w.getAllAngularTestabilities !== 'function') { return true; }
+    return w.getAllAngularTestabilities().every(function(t) { return t.isStable(); });
+}
+
+function animationsDone() {
+    if (!document.getAnimations) { return true; }
+    return !document.getAnimations().some(function(a) {
+        return a.playState === 'running' && a.effect &&
+            a.effect.getTiming().iterations !== Infinity;
+    });
+}
+
+var start = Date.now(), quietSince = null;
+(function poll() {
+    var now = Date.now();
+    var stable = document.readyState === 'complete' && angularStable() &&
+        w.__em2mRequestTracker.pending <= 0 && animationsDone();
+    if (!stable) {
+        quietSince = null;
+    } else if (quietSince === null) {
+        quietSince = now;
+    }
+    if (quietSince !== null && now - quietSince >= quietMs) { return done(true); }
+    if (now - start >= timeoutMs) { return done(false); }
+    setTimeout(poll, 25);
+})();
+"""
+
+# Collects geometry, computed styles, text and visibility of every element
+# matched by each query in a single round trip
+SNAPSHOT_SCRIPT = """
+var queries = arguments[0], props = arguments[1];
+
+function find(query) {
+    if (query.xpath) {
+        var result = document.evaluate(query.value, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(query.value));
+}
+
+return queries.map(function(query) {
+    return find(query).map(function(el) {
+        var rect = el.getBoundingClientRect();
+        var style = window.getComputedStyle(el);
+        var styles = {};
+        props.forEach(function(prop) { styles[prop] = style.getPropertyValue(prop); });
+        return {
+            rect: {
+                x: rect.left + window.scrollX,
+                y: rect.top + window.scrollY,
+                width: rect.width,
+                height: rect.height
+            },
+            styles: styles,
+            text: (el.innerText || el.textContent || '').trim(),
+            visible: rect.width > 0 && rect.height > 0 && style.display !== 'none' &&
+                style.visibility !== 'hidden' && parseFloat(style.opacity) > 0
+        };
+    });
+});
+"""
+
+# SNAPSHOT_SCRIPT plus the viewport and document size, so a breakpoint of a
+# viewport sweep is captured in one round trip
+LAYOUT_SNAPSHOT_SCRIPT = """
+var elements = (function() {
+""" + SNAPSHOT_SCRIPT + """
+}).apply(null, arguments);
+var root = document.documentElement;
+return {
+    viewport: {
+        width: window.innerWidth,
+        height: window.innerHeight,
+        scroll_x: window.scrollX,
+        scroll_y: window.scrollY,
+        scroll_width: root.scrollWidth,
+        scroll_height: root.scrollHeight
+    },
+    elements: elements
+};
+"""
+
+# Clicks an element and resolves with the first input that becomes visible
+# because of the click (inserted, unhidden or restyled), found by a
+# MutationObserver installed before the click. When none appears before the
+# timeout, resolves with the focused input, or null.
+CLICK_AND_WAIT_FOR_NEW_INPUT_SCRIPT = """
+var target = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+
+function visible(el) {
+    if (el.type === 'hidden' || el.getClientRects().length === 0) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+var before = new Set(Array.prototype.filter.call(document.querySelectorAll('input'), visible));
+var finished = false, observer, timer, fallback;
+
+function finish(input) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    clearTimeout(fallback);
+    done(input);
+}
+
+function check() {
+    var inputs = document.querySelectorAll('input');
+    for (var i = 0; i < inputs.length; i++) {
+        if (!before.has(inputs[i]) && visible(inputs[i])) { return finish(inputs[i]); }
+    }
+}
+
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, attributes: true,
+    attributeFilter: ['hidden', 'style', 'class', 'type']
+});
+// Transitions change visibility without a mutation, so also check about once a frame
+timer = setInterval(check, 16);
+fallback = setTimeout(function() {
+    var active = document.activeElement;
+    finish(active && active.tagName === 'INPUT' ? active : null);
+}, timeoutMs);
+
+target.click();
+check();
+"""
+
+# Selenium locator strategies expressed as CSS selectors
+CSS_EQUIVALENTS = {
+    By.CSS_SELECTOR: '{}',
+    By.TAG_NAME: '{}',
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: '.{}'
+}
 
 
 class BasePage:
@@ -31,6 +205,23 @@ class BasePage:
             EC.presence_of_element_located((by, value))
         )
 
+    def wait_for_element(self, by, value, timeout=None):
+        """
+        Wait for an element to be present.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            timeout: Optional custom timeout
+
+        Returns:
+            WebElement
+        """
+        wait_timeout = timeout if timeout else self.timeout
+        return WebDriverWait(self.driver, wait_timeout).until(
+            EC.presence_of_element_located((by, value))
+        )
+
     def find_elements(self, by, value):
         """
         Find multiple elements.
@@ -132,6 +323,202 @@ class BasePage:
             EC.invisibility_of_element_located((by, value))
         )
 
+    def wait_until_stable(self, timeout=None, quiet_period=0.1):
+        """
+        Wait for the page to settle instead of sleeping a fixed time.
+
+        The page is stable when Angular reports no pending work, no
+        XHR/fetch requests are in flight and no finite CSS animations are
+        running, continuously for the quiet period.
+
+        Args:
+            timeout: Optional custom timeout
+            quiet_period: Seconds the page must stay stable
+
+        Returns:
+            True if the page became stable, False if the timeout expired
+        """
+        wait_timeout = timeout if timeout else self.timeout
+        deadline = time.monotonic() + wait_timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                return bool(self.driver.execute_async_script(
+                    WAIT_UNTIL_STABLE_SCRIPT, int(remaining * 1000), int(quiet_period * 1000)
+                ))
+            except TimeoutException:
+                return False
+            except WebDriverException:
+                # The document was replaced while waiting, wait on the new one
+                with sleep_budget.exempt():
+                    time.sleep(0.05)
+
+    def click_and_wait_for_new_input(self, element, timeout=None):
+        """
+        Click an element and return the input field the click reveals.
+
+        A MutationObserver is installed before the click, so this returns
+        as soon as a new visible input appears without polling the inputs
+        from the test side.
+
+        Args:
+            element: WebElement to click
+            timeout: Optional custom timeout
+
+        Returns:
+            The new input WebElement, the focused input if no new one
+            appeared, or None
+        """
+        wait_timeout = timeout if timeout else self.timeout
+        try:
+            return self.driver.execute_async_script(
+                CLICK_AND_WAIT_FOR_NEW_INPUT_SCRIPT, element, int(wait_timeout * 1000)
+            )
+        except TimeoutException:
+            return None
+
+    def snapshot(self, selectors, props=()):
+        """
+        Capture layout information of many elements in one round trip.
+
+        Use this instead of reading .size, .location and
+        value_of_css_property() element by element when a step makes
+        several assertions about the same elements.
+
+        Args:
+            selectors: List of CSS selector strings or (By, value) locators
+            props: Computed CSS properties to read (e.g. 'font-size')
+
+        Returns:
+            Dictionary mapping each selector to a list of element entries,
+            each with 'rect' (x, y, width, height), 'styles', 'text' and
+            'visible' keys
+        """
+        results = self.driver.execute_script(SNAPSHOT_SCRIPT, self._snapshot_queries(selectors), list(props))
+        return dict(zip(selectors, results))
+
+    def set_viewport(self, width, height, mobile=False):
+        """
+        Resize the viewport and wait for the layout to settle.
+
+        With CDP the size is emulated through Emulation.setDeviceMetricsOverride,
+        which is exact (no window chrome, no minimum window width) and does
+        not resize the OS window. Other browsers resize the window.
+
+        Args:
+            width: Viewport width in CSS pixels
+            height: Viewport height in CSS pixels
+            mobile: Emulate a mobile device (meta viewport, overlay scrollbars)
+        """
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+                'width': width,
+                'height': height,
+                'deviceScaleFactor': 0,
+                'mobile': mobile
+            })
+        else:
+            self.driver.set_window_size(width, height)
+        self.wait_until_stable(quiet_period=0.05)
+
+    def reset_viewport(self):
+        """Remove the viewport emulation set by set_viewport()."""
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+            self.wait_until_stable(quiet_period=0.05)
+
+    def sweep_viewports(self, breakpoints, selectors, props=()):
+        """
+        Capture the layout of the same page at several viewport sizes.
+
+        The page is loaded once. Each breakpoint costs one viewport change and
+        one snapshot round trip. The viewport emulation is removed afterwards.
+
+        Args:
+            breakpoints: Dictionary mapping a name to (width, height) or
+                (width, height, mobile)
+            selectors: List of CSS selector strings or (By, value) locators
+            props: Computed CSS properties to read (e.g. 'font-size')
+
+        Returns:
+            Dictionary mapping each breakpoint name to a dictionary with
+            'viewport' (width, height, scroll_x, scroll_y, scroll_width,
+            scroll_height) and
+            'elements' (selector to snapshot entries, as in snapshot())
+        """
+        queries = self._snapshot_queries(selectors)
+        layouts = {}
+        try:
+            for name, size in breakpoints.items():
+                self.set_viewport(*size)
+                layout = self.driver.execute_script(LAYOUT_SNAPSHOT_SCRIPT, queries, list(props))
+                layouts[name] = {
+                    'viewport': layout['viewport'],
+                    'elements': dict(zip(selectors, layout['elements']))
+                }
+        finally:
+            self.reset_viewport()
+        return layouts
+
+    def capture_for_comparison(self, region=None, masks=()):
+        """
+        Take a lossless screenshot of the viewport or one region for visual
+        comparison, and locate the masked elements inside it.
+
+        The region and mask geometry are read in one round trip. With CDP
+        the region is captured directly as a PNG, even when it extends below
+        the viewport.
+
+        Args:
+            region: Optional CSS selector or (By, value) locator of the region
+                (default: the whole viewport)
+            masks: CSS selectors or locators of dynamic content to ignore
+
+        Returns:
+            Tuple of (PNG bytes, list of (x, y, width, height) mask rectangles
+            in CSS pixels relative to the screenshot, CSS width of the screenshot)
+        """
+        selectors = ([region] if region else []) + list(masks)
+        layout = self.driver.execute_script(LAYOUT_SNAPSHOT_SCRIPT, self._snapshot_queries(selectors), [])
+        viewport, elements = layout['viewport'], layout['elements']
+
+        if region:
+            visible = [e for e in elements.pop(0) if e['visible']]
+            if not visible:
+                raise AssertionError(f"Region {region} is not visible")
+            clip = visible[0]['rect']
+        else:
+            clip = {'x': viewport['scroll_x'], 'y': viewport['scroll_y'],
+                    'width': viewport['width'], 'height': viewport['height']}
+
+        mask_rects = [
+            (e['rect']['x'] - clip['x'], e['rect']['y'] - clip['y'], e['rect']['width'], e['rect']['height'])
+            for entries in elements for e in entries if e['visible']
+        ]
+
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            image, _ = capture_screenshot(self.driver, clip=clip, image_format='png')
+        elif region:
+            by, value = region if isinstance(region, tuple) else (By.CSS_SELECTOR, region)
+            image = self.find_element(by, value).screenshot_as_png
+        else:
+            image = self.driver.get_screenshot_as_png()
+        return image, mask_rects, clip['width']
+
+    def _snapshot_queries(self, selectors):
+        """Convert selectors and locators to SNAPSHOT_SCRIPT queries."""
+        queries = []
+        for selector in selectors:
+            by, value = selector if isinstance(selector, tuple) else (By.CSS_SELECTOR, selector)
+            if by == By.XPATH:
+                queries.append({'xpath': True, 'value': value})
+            else:
+                queries.append({'xpath': False, 'value': CSS_EQUIVALENTS[by].format(value)})
+        return queries
+
     def scroll_to_element(self, element):
         """
         Scroll to an element.
@@ -153,11 +540,38 @@ class BasePage:
         """Refresh the current page."""
         self.driver.refresh()
 
-    def navigate_to(self, url):
+    def navigate_to(self, url, label=None):
         """
-        Navigate to a specific URL.
+        Navigate to a specific URL and record the page visit.
 
         Args:
             url: URL to navigate to
+            label: Name to record the visit under (defaults to the URL)
         """
         self.driver.get(url)
+        self.record_page_visit(label or url)
+
+    def mark_route_change(self):
+        """
+        Read the page clock before a click that changes the route.
+
+        Returns:
+            Mark to pass to record_page_visit(), or None when page
+            performance is not being collected
+        """
+        collector = WebVitalsCollector.collector_for(self.driver)
+        return collector.mark(self.driver) if collector else None
+
+    def record_page_visit(self, label, mark=None):
+        """
+        Record the load, paint and layout shift timings of the current page.
+
+        Args:
+            label: Name of the visit, used by the page performance budget steps
+            mark: Result of mark_route_change() before the click, if any
+
+        Returns:
+            Visit dictionary, or None when page performance is not being collected
+        """
+        collector = WebVitalsCollector.collector_for(self.driver)
+        return collector.record(self.driver, label, mark) if collector else None
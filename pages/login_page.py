@@ -4,6 +4,7 @@ Page Object Model for Login Page.
 
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from config.config import Config
 
 
 class LoginPage(BasePage):
@@ -19,7 +20,7 @@ class LoginPage(BasePage):
     def __init__(self, driver):
         """Initialize the login page."""
         super().__init__(driver)
-        self.base_url = "https://elasticm2m-dev.app.em2m.net"
+        self.base_url = Config.BASE_URL
 
     def navigate_to_login(self):
         """Navigate to the login page."""
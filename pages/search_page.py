@@ -4,9 +4,116 @@ Page Object Model for Search functionality.
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.config import Config
 from pages.base_page import BasePage
 
 
+# Focuses and clears the search input. With insertText the term is then
+# inserted through CDP, which fires input but no keyup, and KEYUP_SCRIPT
+# follows; without it the whole term is set here and the input/keyup events
+# Angular listens to are dispatched in the same call.
+SET_SEARCH_TERM_SCRIPT = """
+var input = arguments[0], text = arguments[1];
+input.focus();
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+setValue.call(input, '');
+if (text !== null) {
+    setValue.call(input, text);
+    input.dispatchEvent(new Event('input', { bubbles: true }));
+    input.dispatchEvent(new KeyboardEvent('keyup', { bubbles: true, key: text.slice(-1) }));
+}
+"""
+
+# The keyup SET_SEARCH_TERM_SCRIPT dispatches, for terms inserted through CDP
+KEYUP_SCRIPT = """
+arguments[0].dispatchEvent(new KeyboardEvent('keyup', { bubbles: true, key: arguments[1].slice(-1) }));
+"""
+
+# Resolves once the autocomplete has answered the term in the input: the
+# debounce and the search request are finished (Angular stable, no requests
+# in flight) and the rendered options have not changed for the quiet period.
+# Apps that do not report the debounce as pending work are given at least
+# debounceMs to start their request. Resolves with the option texts, or
+# null when the timeout expires first.
+WAIT_FOR_AUTOCOMPLETE_SCRIPT = """
+var input = arguments[0], term = arguments[1], timeoutMs = arguments[2],
+    quietMs = arguments[3], debounceMs = arguments[4], done = arguments[arguments.length - 1];
+var w = window;
+
+function appIdle() {
+    var tracker = w.__em2mRequestTracker;
+    if (tracker && tracker.pending > 0) { return false; }
+    if (typeof w.getAllAngularTestabilities !== 'function') { return true; }
+    return w.getAllAngularTestabilities().every(function(t) { return t.isStable(); });
+}
+
+function optionTexts() {
+    return Array.prototype.filter.call(document.querySelectorAll("mat-option[role='option']"), function(el) {
+        return el.getClientRects().length > 0;
+    }).map(function(el) { return (el.innerText || el.textContent || '').trim(); });
+}
+
+var start = Date.now(), sawBusy = false, signature = null, quietSince = null;
+(function poll() {
+    var now = Date.now();
+    var idle = input.value === term && appIdle();
+    if (!idle) { sawBusy = true; }
+    var texts = optionTexts(), current = JSON.stringify(texts);
+    if (!idle || current !== signature) {
+        signature = current;
+        quietSince = idle ? now : null;
+    } else if (quietSince === null) {
+        quietSince = now;
+    }
+    var debounced = sawBusy || now - start >= debounceMs;
+    if (debounced && quietSince !== null && now - quietSince >= quietMs) { return done(texts); }
+    if (now - start >= timeoutMs) { return done(null); }
+    setTimeout(poll, 25);
+})();
+"""
+
+# First visible navbar button whose text mentions search
+FIND_SEARCH_BUTTON_SCRIPT = """
+return Array.prototype.find.call(document.querySelectorAll('button'), function(button) {
+    return button.getClientRects().length > 0 &&
+        (button.innerText || '').trim().toLowerCase().indexOf('search') !== -1;
+}) || null;
+"""
+
+# Visible autocomplete options, either as elements or as {index, text}
+# entries, collected in one round trip
+VISIBLE_OPTIONS_SCRIPT = """
+var selector = arguments[0], asSnapshot = arguments[1];
+var options = Array.prototype.filter.call(document.querySelectorAll(selector), function(el) {
+    var style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+});
+if (!asSnapshot) { return options; }
+return options.map(function(el, index) {
+    return { index: index, text: (el.innerText || el.textContent || '').trim() };
+});
+"""
+
+# Matches a visible autocomplete option by exact or partial text and clicks
+# it without another round trip. Returns the clicked option (or null) and
+# the texts of all visible options for error messages.
+CLICK_OPTION_SCRIPT = """
+var selector = arguments[0], text = arguments[1].trim(), exact = arguments[2];
+var options = Array.prototype.filter.call(document.querySelectorAll(selector), function(el) {
+    var style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+});
+var texts = options.map(function(el) { return (el.innerText || el.textContent || '').trim(); });
+var index = texts.findIndex(function(optionText) {
+    return exact ? optionText === text : optionText.toLowerCase().indexOf(text.toLowerCase()) !== -1;
+});
+if (index === -1) { return { clicked: null, options: texts }; }
+options[index].click();
+return { clicked: { index: index, text: texts[index] }, options: texts };
+"""
+
+
 class SearchPage(BasePage):
     """Search page object."""
 
@@ -22,74 +129,94 @@ class SearchPage(BasePage):
 
     def click_search_button(self):
         """Click the search button in the navbar (not the burger menu)."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        import time
-
         # Wait for the page to be ready
-        time.sleep(1)
-
-        # Store visible inputs BEFORE clicking
-        inputs_before = self.driver.find_elements(By.TAG_NAME, "input")
-        visible_inputs_before = [inp for inp in inputs_before if inp.is_displayed()]
-        print(f"Visible inputs BEFORE clicking search button: {len(visible_inputs_before)}")
+        self.wait_until_stable()
 
         # Find the search button (the one with text 'search')
-        all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-        search_button = None
-
-        for btn in all_buttons:
-            if btn.is_displayed() and 'search' in btn.text.strip().lower():
-                search_button = btn
-                print(f"Found search button with text: '{btn.text}'")
-                break
-
+        search_button = self.driver.execute_script(FIND_SEARCH_BUTTON_SCRIPT)
         if not search_button:
             raise Exception("Could not find search button on navbar")
 
-        # Use JavaScript click to avoid any overlay issues
-        self.driver.execute_script("arguments[0].click();", search_button)
-        print("Clicked search button")
+        # Click it and take the input that appears in response
+        self.current_search_input = self.click_and_wait_for_new_input(search_button)
+        if self.current_search_input is None:
+            raise Exception("No search input appeared after clicking the search button")
+        print(f"Found NEW search input with class: {self.current_search_input.get_attribute('class')}")
 
-        # Wait for NEW input to appear
-        time.sleep(2)
-
-        # Find the NEW input that appeared
-        inputs_after = self.driver.find_elements(By.TAG_NAME, "input")
-        visible_inputs_after = [inp for inp in inputs_after if inp.is_displayed()]
-        print(f"Visible inputs AFTER clicking search button: {len(visible_inputs_after)}")
-
-        # Store the new input for later use
-        new_inputs = [inp for inp in visible_inputs_after if inp not in visible_inputs_before]
-        if new_inputs:
-            self.current_search_input = new_inputs[0]
-            print(f"Found NEW search input with class: {self.current_search_input.get_attribute('class')}")
-        else:
-            # Fallback: use the last visible input
-            self.current_search_input = visible_inputs_after[-1] if visible_inputs_after else None
-            print("Using last visible input as search input")
-
-    def enter_search_term(self, search_term):
+    def enter_search_term(self, search_term, per_character=None):
         """
         Enter text in the search input field that appeared after clicking search button.
 
+        The whole term is inserted in one call and the method returns once
+        the autocomplete has answered it. Typing one character at a time is
+        kept for tests that exercise the debounce itself.
+
         Args:
             search_term: Text to search for
-        """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        import time
+            per_character: Type one character at a time (default: Config.SEARCH_TYPE_PER_CHARACTER)
 
+        Returns:
+            List of dropdown option texts for the term, or None if typed per character
+            or the autocomplete did not settle in time
+        """
         # Use the input that was stored when we clicked the search button
         if not hasattr(self, 'current_search_input') or self.current_search_input is None:
             raise Exception("Search input not found. Make sure to click search button first!")
 
-        search_input = self.current_search_input
+        if per_character is None:
+            per_character = Config.SEARCH_TYPE_PER_CHARACTER
+        if per_character:
+            self._type_per_character(self.current_search_input, search_term)
+            return None
+
+        self._insert_text(self.current_search_input, search_term)
+        print(f"Entered '{search_term}' successfully")
+        return self.wait_for_autocomplete(search_term)
+
+    def wait_for_autocomplete(self, search_term, timeout=None, quiet_period=0.1):
+        """
+        Wait for the autocomplete to finish answering a search term.
+
+        Args:
+            search_term: Term currently in the search input
+            timeout: Optional custom timeout
+            quiet_period: Seconds the rendered options must stay unchanged
+
+        Returns:
+            List of dropdown option texts, or None if the timeout expired
+        """
+        wait_timeout = timeout if timeout else self.timeout
+        try:
+            texts = self.driver.execute_async_script(
+                WAIT_FOR_AUTOCOMPLETE_SCRIPT, self.current_search_input, search_term,
+                int(wait_timeout * 1000), int(quiet_period * 1000), Config.SEARCH_DEBOUNCE_MS
+            )
+        except TimeoutException:
+            texts = None
+        if texts is None:
+            print(f"Warning: Autocomplete did not settle for '{search_term}'")
+        return texts
+
+    def _insert_text(self, search_input, search_term):
+        """Put the whole term into the input, through CDP Input.insertText when available."""
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_script(SET_SEARCH_TERM_SCRIPT, search_input, None)
+            try:
+                self.driver.execute_cdp_cmd('Input.insertText', {'text': search_term})
+                self.driver.execute_script(KEYUP_SCRIPT, search_input, search_term)
+                return
+            except WebDriverException:
+                pass  # Fall back to setting the value from JavaScript
+        self.driver.execute_script(SET_SEARCH_TERM_SCRIPT, search_input, search_term)
+
+    def _type_per_character(self, search_input, search_term):
+        """Type one character at a time so every keystroke restarts the debounce."""
+        import time
+
         print(f"Typing '{search_term}' into search input with class: {search_input.get_attribute('class')}")
 
         # Focus the input
         self.driver.execute_script("arguments[0].focus();", search_input)
-        time.sleep(0.3)
 
         # Clear any existing value
         self.driver.execute_script("arguments[0].value = '';", search_input)
@@ -105,8 +232,8 @@ class SearchPage(BasePage):
 
         print(f"Typed '{search_term}' successfully")
 
-        # Wait for autocomplete to trigger
-        time.sleep(3)
+        # Wait for the debounced autocomplete request to complete
+        self.wait_until_stable()
 
     def wait_for_dropdown(self, timeout=15):
         """
@@ -117,7 +244,6 @@ class SearchPage(BasePage):
         """
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        import time
 
         # Wait for mat-option elements to appear
         try:
@@ -125,10 +251,9 @@ class SearchPage(BasePage):
                 EC.presence_of_element_located((By.CSS_SELECTOR, "mat-option[role='option']"))
             )
             print("Dropdown with mat-option elements found")
-            time.sleep(0.5)
         except:
             print("Warning: Dropdown not found, continuing anyway...")
-            time.sleep(1)
+        self.wait_until_stable()
 
     def is_dropdown_visible(self):
         """
@@ -141,16 +266,23 @@ class SearchPage(BasePage):
 
     def get_dropdown_options(self):
         """
-        Get all options from the search dropdown.
+        Get all visible options from the search dropdown.
 
         Returns:
             List of WebElements
         """
-        # Get all mat-option elements with role='option'
-        options = self.driver.find_elements(By.CSS_SELECTOR, "mat-option[role='option']")
-        visible_options = [opt for opt in options if opt.is_displayed()]
-        print(f"Found {len(visible_options)} visible dropdown options")
-        return visible_options
+        options = self.driver.execute_script(VISIBLE_OPTIONS_SCRIPT, self.DROPDOWN_OPTIONS[1], False)
+        print(f"Found {len(options)} visible dropdown options")
+        return options
+
+    def get_dropdown_snapshot(self):
+        """
+        Get the index and text of every visible dropdown option in one call.
+
+        Returns:
+            List of {'index', 'text'} dictionaries in dropdown order
+        """
+        return self.driver.execute_script(VISIBLE_OPTIONS_SCRIPT, self.DROPDOWN_OPTIONS[1], True)
 
     def get_dropdown_option_texts(self):
         """
@@ -159,8 +291,7 @@ class SearchPage(BasePage):
         Returns:
             List of strings
         """
-        options = self.get_dropdown_options()
-        return [option.text for option in options]
+        return [option['text'] for option in self.get_dropdown_snapshot()]
 
     def click_exact_match(self, text):
         """
@@ -171,30 +302,16 @@ class SearchPage(BasePage):
         """
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        import time
 
         # Wait for mat-option elements to be present
         WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "mat-option[role='option']"))
+            EC.presence_of_all_elements_located(self.DROPDOWN_OPTIONS)
         )
 
-        options = self.get_dropdown_options()
-        print(f"Searching for exact match '{text}' in {len(options)} options")
-
-        for option in options:
-            option_text = option.text.strip()
-            print(f"  Option text: '{option_text}'")
-
-            # Check if this option contains the exact text
-            if option_text == text.strip():
-                print(f"Found exact match: '{option_text}', clicking...")
-
-                # Click using JavaScript to avoid interception
-                self.driver.execute_script("arguments[0].click();", option)
-                time.sleep(1)
-                return
-
-        raise Exception(f"Exact match '{text}' not found in dropdown. Available options: {[opt.text.strip() for opt in options]}")
+        mark = self.mark_route_change()
+        self._click_option(text, exact=True)
+        self.wait_until_stable()
+        self.record_page_visit(text, mark)
 
     def click_partial_match(self, text):
         """
@@ -203,12 +320,7 @@ class SearchPage(BasePage):
         Args:
             text: Text to partially match and click
         """
-        options = self.get_dropdown_options()
-        for option in options:
-            if text.lower() in option.text.lower():
-                option.click()
-                return
-        raise Exception(f"Partial match containing '{text}' not found in dropdown")
+        self._click_option(text, exact=False)
 
     def is_text_in_dropdown(self, text):
         """
@@ -223,6 +335,23 @@ class SearchPage(BasePage):
         option_texts = self.get_dropdown_option_texts()
         return any(text.lower() in option.lower() for option in option_texts)
 
+    def _click_option(self, text, exact):
+        """
+        Find and click a dropdown option inside the browser in one command.
+
+        Args:
+            text: Text to match
+            exact: Match the whole option text instead of a case-insensitive substring
+
+        Raises:
+            Exception: If no visible option matches
+        """
+        result = self.driver.execute_script(CLICK_OPTION_SCRIPT, self.DROPDOWN_OPTIONS[1], text, exact)
+        if result['clicked'] is None:
+            kind = "Exact match" if exact else "Partial match containing"
+            raise Exception(f"{kind} '{text}' not found in dropdown. Available options: {result['options']}")
+        print(f"Clicked option {result['clicked']['index']}: '{result['clicked']['text']}'")
+
     def search_and_select(self, search_term):
         """
         Complete search flow: click button, enter text, select exact match.
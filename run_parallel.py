@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Parallel Test Runner
+Splits scenarios across worker processes and merges their reports.
+
+Each worker is a separate behave process with its own WebDriver and its own
+allure-results/JUnit output. When all workers finish, their outputs are merged
+into allure-results/ and reports/junit/ so generate_html_report.py and JUnit
+consumers see the same layout as a serial run.
+
+Scenarios are assigned longest-first using durations from the previous run's
+allure-results, so workers finish at about the same time.
+
+Usage:
+    python run_parallel.py --workers 4
+    python run_parallel.py --workers 4 --tags=@smoke
+    python run_parallel.py --workers 2 features/aseed_ui.feature
+    python run_parallel.py --workers 4 --no-capture   (unknown options go to behave)
+"""
+
+import argparse
+import heapq
+import json
+import os
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from statistics import median
+
+from behave.parser import parse_file
+from config.config import Config
+from generate_html_report import iter_allure_results, format_duration
+from utilities.driver_binary import DriverBinaryCache
+from utilities.sleep_budget import rank_sites, format_ranking
+
+try:
+    from behave.tag_expression import make_tag_expression
+except ImportError:
+    # behave 1.2.6
+    from behave.tag_expression import TagExpression as make_tag_expression
+
+
+ALLURE_RESULTS_DIR = 'allure-results'
+JUNIT_DIR = os.path.join('reports', 'junit')
+WORKERS_DIR = os.path.join('reports', 'parallel')
+JUNIT_COUNTERS = ('tests', 'errors', 'failures', 'skipped')
+COMMAND_TIMINGS_FILE = Config.COMMAND_TIMINGS_FILE
+SLEEP_REPORT_FILE = Config.SLEEP_REPORT_FILE
+WEB_VITALS_FILE = Config.WEB_VITALS_FILE
+
+# Estimate in seconds for scenarios without history when no history exists at all
+DEFAULT_SCENARIO_ESTIMATE = 30.0
+
+
+def scenario_key(feature_name, scenario_name, parameters=None):
+    """
+    Build the key used to match a scenario with its historical results.
+
+    Scenario Outline rows are told apart by their example values, the
+    " -- @1.1 Examples" suffix behave adds to generated names is dropped.
+    """
+    base_name = scenario_name.split(' -- @')[0].strip()
+    return (feature_name, base_name, tuple(sorted(parameters or ())))
+
+
+def find_feature_files(paths):
+    """Expand feature directories into a sorted list of feature files."""
+    feature_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                feature_files.extend(
+                    os.path.join(root, name) for name in files if name.endswith('.feature')
+                )
+        else:
+            feature_files.append(path)
+    return sorted(feature_files)
+
+
+def discover_scenarios(paths, tags=None):
+    """
+    Collect every runnable scenario, expanding Scenario Outline examples.
+
+    Args:
+        paths: Feature files or directories
+        tags: Optional list of behave tag expressions
+
+    Returns:
+        List of scenario dictionaries with 'location', 'feature', 'name' and 'key'
+    """
+    tag_expression = make_tag_expression(tags) if tags else None
+    scenarios = []
+
+    for feature_file in find_feature_files(paths):
+        feature = parse_file(feature_file)
+        if feature is None:
+            continue
+        for scenario in feature.walk_scenarios():
+            if tag_expression and not tag_expression.check(scenario.effective_tags):
+                continue
+            row = getattr(scenario, '_row', None)
+            parameters = zip(row.headings, row.cells) if row else None
+            scenarios.append({
+                'location': f"{feature_file}:{scenario.line}",
+                'feature': feature.name,
+                'name': scenario.name,
+                'key': scenario_key(feature.name, scenario.name, parameters)
+            })
+
+    return scenarios
+
+
+def load_scenario_durations(results_dir=ALLURE_RESULTS_DIR):
+    """
+    Read per-scenario durations from a previous run's Allure results.
+
+    When a scenario has several results (reruns), the most recent one wins.
+
+    Args:
+        results_dir: Directory containing *-result.json files
+
+    Returns:
+        Dictionary mapping scenario key to duration in seconds
+    """
+    if not os.path.exists(results_dir):
+        return {}
+
+    latest = {}
+    for result in iter_allure_results(results_dir):
+        if 'start' not in result or 'stop' not in result:
+            continue
+        feature = next(
+            (label.get('value') for label in result.get('labels', []) if label.get('name') == 'feature'),
+            None
+        )
+        if feature is None:
+            continue
+        parameters = [(p.get('name'), p.get('value')) for p in result.get('parameters', [])]
+        key = scenario_key(feature, result.get('name', ''), parameters)
+        if key not in latest or result['stop'] > latest[key]['stop']:
+            latest[key] = result
+
+    return {key: (r['stop'] - r['start']) / 1000 for key, r in latest.items()}
+
+
+def shard_scenarios(scenarios, workers, durations=None):
+    """
+    Split scenarios across workers so they finish at about the same time.
+
+    Uses longest-processing-time-first scheduling: scenarios are sorted by
+    expected duration and each one goes to the currently least loaded worker.
+    Scenarios without history are estimated at the median known duration.
+
+    Args:
+        scenarios: List of scenario dictionaries
+        workers: Number of workers
+        durations: Optional dictionary of scenario key to duration in seconds
+
+    Returns:
+        List of (estimated seconds, scenario list) tuples, one per worker
+        (empty shards removed)
+    """
+    durations = durations or {}
+    default_estimate = median(durations.values()) if durations else DEFAULT_SCENARIO_ESTIMATE
+
+    def estimate(scenario):
+        return durations.get(scenario['key'], default_estimate)
+
+    # Heap of (load, worker index), the least loaded worker is always on top
+    loads = [(0.0, index) for index in range(workers)]
+    shards = [[] for _ in range(workers)]
+
+    for scenario in sorted(scenarios, key=estimate, reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(scenario)
+        heapq.heappush(loads, (load + estimate(scenario), index))
+
+    totals = {index: load for load, index in loads}
+    return [(totals[index], shard) for index, shard in enumerate(shards) if shard]
+
+
+def worker_dirs(worker_id):
+    """Get the allure-results and JUnit directories of a worker."""
+    base = os.path.join(WORKERS_DIR, f"worker-{worker_id}")
+    return os.path.join(base, 'allure-results'), os.path.join(base, 'junit')
+
+
+def worker_timings_file(worker_id):
+    """Get the WebDriver command timings file of a worker."""
+    return os.path.join(WORKERS_DIR, f"worker-{worker_id}", os.path.basename(COMMAND_TIMINGS_FILE))
+
+
+def worker_sleep_report(worker_id):
+    """Get the sleep report file of a worker."""
+    return os.path.join(WORKERS_DIR, f"worker-{worker_id}", os.path.basename(SLEEP_REPORT_FILE))
+
+
+def worker_web_vitals_file(worker_id):
+    """Get the page performance file of a worker."""
+    return os.path.join(WORKERS_DIR, f"worker-{worker_id}", os.path.basename(WEB_VITALS_FILE))
+
+
+def start_worker(worker_id, shard, behave_args):
+    """
+    Launch a behave process for one shard.
+
+    Args:
+        worker_id: Worker number
+        shard: List of scenario dictionaries to run
+        behave_args: Extra arguments passed to behave
+
+    Returns:
+        Tuple of (Popen, log file)
+    """
+    results_dir, junit_dir = worker_dirs(worker_id)
+    os.makedirs(results_dir, exist_ok=True)
+    os.makedirs(junit_dir, exist_ok=True)
+
+    command = [
+        sys.executable, '-m', 'behave',
+        '-f', 'allure_behave.formatter:AllureFormatter', '-o', results_dir,
+        '-f', 'progress',
+        '--junit', '--junit-directory', junit_dir,
+        *behave_args,
+        *[scenario['location'] for scenario in shard]
+    ]
+
+    env = dict(
+        os.environ,
+        WORKER_ID=str(worker_id),
+        COMMAND_TIMINGS_FILE=worker_timings_file(worker_id),
+        SLEEP_REPORT_FILE=worker_sleep_report(worker_id),
+        WEB_VITALS_FILE=worker_web_vitals_file(worker_id)
+    )
+    log_file = open(os.path.join(WORKERS_DIR, f"worker-{worker_id}", 'behave.log'), 'w', encoding='utf-8')
+    process = subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+    return process, log_file
+
+
+def merge_allure_results(worker_ids, output_dir=ALLURE_RESULTS_DIR):
+    """Copy every worker's Allure files into one results directory."""
+    os.makedirs(output_dir, exist_ok=True)
+    count = 0
+    for worker_id in worker_ids:
+        results_dir, _ = worker_dirs(worker_id)
+        if not os.path.exists(results_dir):
+            continue
+        for filename in os.listdir(results_dir):
+            shutil.copy2(os.path.join(results_dir, filename), os.path.join(output_dir, filename))
+            count += 1
+    return count
+
+
+def merge_junit_reports(worker_ids, output_dir=JUNIT_DIR):
+    """
+    Merge per-worker JUnit files into one file per feature.
+
+    Workers running scenarios of the same feature each write a
+    TESTS-<feature>.xml, so their test cases and counters are combined.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    suites = {}
+
+    for worker_id in worker_ids:
+        _, junit_dir = worker_dirs(worker_id)
+        if not os.path.exists(junit_dir):
+            continue
+        for filename in sorted(os.listdir(junit_dir)):
+            if not filename.endswith('.xml'):
+                continue
+            suite = ET.parse(os.path.join(junit_dir, filename)).getroot()
+            merged = suites.get(filename)
+            if merged is None:
+                suites[filename] = suite
+                continue
+            for attribute in JUNIT_COUNTERS:
+                total = int(merged.get(attribute, 0)) + int(suite.get(attribute, 0))
+                merged.set(attribute, str(total))
+            total_time = float(merged.get('time', 0)) + float(suite.get('time', 0))
+            merged.set('time', f"{total_time:.6f}")
+            merged.extend(list(suite))
+
+    for filename, suite in suites.items():
+        ET.ElementTree(suite).write(os.path.join(output_dir, filename), encoding='utf-8', xml_declaration=True)
+
+    return len(suites)
+
+
+def merge_scenario_reports(paths, output_file):
+    """
+    Combine the scenarios of per-worker JSON reports into one file.
+
+    Returns:
+        Number of scenarios merged
+    """
+    merged = {'generated_at': None, 'scenarios': []}
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        merged['generated_at'] = max(merged['generated_at'] or '', report.get('generated_at', ''))
+        merged['scenarios'].extend(report.get('scenarios', []))
+
+    if not merged['scenarios']:
+        return 0
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2)
+    return len(merged['scenarios'])
+
+
+def merge_command_timings(worker_ids, output_file=COMMAND_TIMINGS_FILE):
+    """Combine the scenarios of every worker's command timings file."""
+    return merge_scenario_reports([worker_timings_file(w) for w in worker_ids], output_file)
+
+
+def merge_web_vitals(worker_ids, output_file=WEB_VITALS_FILE):
+    """Combine the scenarios of every worker's page performance file."""
+    return merge_scenario_reports([worker_web_vitals_file(w) for w in worker_ids], output_file)
+
+
+def merge_sleep_reports(worker_ids, output_file=SLEEP_REPORT_FILE):
+    """
+    Combine every worker's sleep report and re-rank the call sites.
+
+    Returns:
+        Ranked call sites of the whole run
+    """
+    merged = {'generated_at': None, 'budget': Config.SLEEP_BUDGET, 'mode': Config.SLEEP_BUDGET_MODE,
+              'total': 0, 'scenarios': [], 'sites': []}
+    sites = {}
+    for worker_id in worker_ids:
+        path = worker_sleep_report(worker_id)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        merged['generated_at'] = max(merged['generated_at'] or '', report.get('generated_at', ''))
+        merged['scenarios'].extend(report.get('scenarios', []))
+        for site in report.get('sites', []):
+            # Workers run disjoint scenarios, so scenario counts add up
+            totals = sites.setdefault(site['site'], {'site': site['site'], 'calls': 0, 'total': 0.0, 'scenarios': 0})
+            for field in ('calls', 'total', 'scenarios'):
+                totals[field] += site[field]
+
+    if not merged['scenarios']:
+        return []
+    merged['total'] = round(sum(s['total'] for s in merged['scenarios']), 3)
+    merged['sites'] = rank_sites(sites.values())
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2)
+    return merged['sites']
+
+
+def reset_directory(path):
+    """Remove and recreate a directory."""
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Run behave scenarios in parallel worker processes.')
+    parser.add_argument('paths', nargs='*', default=['features'],
+                        help='Feature files or directories (default: features)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 2,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('-t', '--tags', action='append',
+                        help='Tag expression, same syntax as behave --tags (repeatable)')
+    parser.add_argument('--timings', default=ALLURE_RESULTS_DIR,
+                        help='Allure results of a previous run used to balance workers '
+                             f'(default: {ALLURE_RESULTS_DIR})')
+    # Any other option is passed through to every behave worker
+    args, behave_args = parser.parse_known_args()
+    args.behave_args = behave_args
+    return args
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 70)
+    print("  EM2M Test Automation - Parallel Runner")
+    print("=" * 70)
+    print()
+
+    scenarios = discover_scenarios(args.paths, args.tags)
+    if not scenarios:
+        print("[ERROR] No scenarios matched!")
+        return 1
+
+    # Read history before the previous results are cleaned
+    durations = load_scenario_durations(args.timings)
+    known = sum(1 for scenario in scenarios if scenario['key'] in durations)
+    print(f"[OK] Found {len(scenarios)} scenarios ({known} with timing history)")
+
+    shards = shard_scenarios(scenarios, max(1, args.workers), durations)
+    print(f"[OK] Running on {len(shards)} workers")
+
+    # Resolve the driver binary once so workers start from the shared cache
+    # instead of all running webdriver-manager at the same time
+    try:
+        driver_path = DriverBinaryCache.from_config(Config).resolve(Config.BROWSER.lower())
+        print(f"[OK] Using driver: {driver_path}")
+    except Exception as e:
+        print(f"[WARNING] Could not resolve the driver binary: {e}")
+
+    reset_directory(WORKERS_DIR)
+    reset_directory(ALLURE_RESULTS_DIR)
+    reset_directory(JUNIT_DIR)
+
+    workers = []
+    for worker_id, (estimate, shard) in enumerate(shards, start=1):
+        print(f"[Worker {worker_id}] {len(shard)} scenarios, estimated {format_duration(estimate)}")
+        workers.append((worker_id,) + start_worker(worker_id, shard, args.behave_args))
+
+    exit_code = 0
+    for worker_id, process, log_file in workers:
+        return_code = process.wait()
+        log_file.close()
+        status = "OK" if return_code == 0 else "FAILED"
+        print(f"[Worker {worker_id}] finished: {status} (log: {log_file.name})")
+        if return_code != 0:
+            exit_code = 1
+
+    worker_ids = [worker_id for worker_id, _, _ in workers]
+    print()
+    print(f"[Merged] {merge_allure_results(worker_ids)} Allure files into {ALLURE_RESULTS_DIR}/")
+    print(f"[Merged] {merge_junit_reports(worker_ids)} JUnit suites into {JUNIT_DIR}/")
+    print(f"[Merged] {merge_command_timings(worker_ids)} scenario timings into {COMMAND_TIMINGS_FILE}")
+    print(f"[Merged] {merge_web_vitals(worker_ids)} scenario page timings into {WEB_VITALS_FILE}")
+    sleep_sites = merge_sleep_reports(worker_ids)
+    print(f"[Merged] {len(sleep_sites)} sleep call sites into {SLEEP_REPORT_FILE}")
+    print()
+    print(format_ranking(sleep_sites[:10]))
+    print()
+    print("Generate the HTML report with: python generate_html_report.py")
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,6 +28,18 @@ if "%1"=="" (
 ) else if "%1"=="assets" (
     echo Running assets tests...
     behave features/assets.feature
+) else if "%1"=="parallel" (
+    echo Running tests in parallel...
+    if "%2"=="" (
+        python run_parallel.py --workers 4
+    ) else (
+        python run_parallel.py --workers %2
+    )
+) else if "%1"=="mock" (
+    echo Running all tests against the local mock app...
+    set MOCK_APP=true
+    behave
+    set MOCK_APP=
 ) else if "%1"=="report" (
     echo Running tests with Allure report...
     behave -f allure_behave.formatter:AllureFormatter -o allure-results
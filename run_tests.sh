@@ -28,6 +28,12 @@ elif [ "$1" = "login" ]; then
 elif [ "$1" = "assets" ]; then
     echo "Running assets tests..."
     behave features/assets.feature
+elif [ "$1" = "parallel" ]; then
+    echo "Running tests in parallel..."
+    python run_parallel.py --workers ${2:-4}
+elif [ "$1" = "mock" ]; then
+    echo "Running all tests against the local mock app..."
+    MOCK_APP=true behave
 elif [ "$1" = "report" ]; then
     echo "Running tests with Allure report..."
     behave -f allure_behave.formatter:AllureFormatter -o allure-results
@@ -0,0 +1,41 @@
+"""
+Tests for the standalone HTML report's result aggregation.
+"""
+
+import pytest
+
+from generate_html_report import SLOWEST_STEPS, ResultSummary, generate_chunked_report
+
+
+@pytest.fixture
+def equal_step_result():
+    """Allure result whose steps all take exactly one second."""
+    return {
+        'name': 'Verify ASEED page loads successfully',
+        'historyId': 'aseed-page-loads',
+        'status': 'passed',
+        'start': 1000,
+        'stop': 1000 + 1000 * (SLOWEST_STEPS + 2),
+        'steps': [
+            {'name': f'Then check {i}', 'status': 'passed', 'start': 1000 + 1000 * i, 'stop': 2000 + 1000 * i}
+            for i in range(SLOWEST_STEPS + 2)
+        ]
+    }
+
+
+def test_slowest_steps_with_equal_durations(equal_step_result):
+    summary = ResultSummary()
+    summary.add(equal_step_result)
+    summary.add(dict(equal_step_result, historyId='aseed-page-loads-again'))
+
+    slowest = summary.performance()['slowest_steps']
+    assert len(slowest) == SLOWEST_STEPS
+    assert all(step['duration'] == 1.0 for step in slowest)
+
+
+def test_chunked_report_with_equal_step_durations(equal_step_result, tmp_path):
+    output_file, metrics, performance = generate_chunked_report([equal_step_result], str(tmp_path))
+
+    assert metrics['total'] == 1
+    assert len(performance['slowest_steps']) == SLOWEST_STEPS
+    assert (tmp_path / 'data' / 'chunk-00000.js').exists()
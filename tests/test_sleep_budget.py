@@ -0,0 +1,74 @@
+"""
+Tests for the sleep budget accounting.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utilities import sleep_budget
+from utilities.driver_binary import _FileLock
+from utilities.sleep_budget import SleepMonitor
+
+
+@pytest.fixture
+def monitor():
+    """Installed monitor in fail mode with a budget no polling loop fits in."""
+    monitor = SleepMonitor(budget=0.01, mode='fail')
+    monitor.install()
+    monitor.start_scenario(SimpleNamespace(feature=SimpleNamespace(name='Sleeps'), name='Polling',
+                                           filename='sleeps.feature', line=1))
+    yield monitor
+    monitor.uninstall()
+
+
+def test_fixed_sleep_is_counted(monitor):
+    time.sleep(0.005)
+
+    summary = monitor.end_scenario()
+    assert summary['calls'] == 1
+    [site] = summary['by_site']
+    assert site.startswith('tests/test_sleep_budget.py:') and site.endswith(' in test_fixed_sleep_is_counted')
+
+
+def test_exempt_sleep_is_not_counted(monitor):
+    with sleep_budget.exempt():
+        time.sleep(0.02)
+
+    assert monitor.end_scenario()['calls'] == 0
+
+
+def test_driver_binary_lock_poll_is_not_counted(monitor, tmp_path):
+    lock_file = str(tmp_path / 'driver.lock')
+    open(lock_file, 'w').close()
+    threading.Timer(0.1, os.remove, [lock_file]).start()
+
+    with _FileLock(lock_file, poll_interval=0.02):
+        pass
+
+    summary = monitor.end_scenario()
+    assert summary['calls'] == 0
+    assert monitor.ranked_sites() == []
+
+
+def test_wait_until_stable_retry_is_not_counted(monitor):
+    pytest.importorskip('selenium')
+    from selenium.common.exceptions import WebDriverException
+    from pages.base_page import BasePage
+
+    class ReplacedDocumentDriver:
+        """Driver whose first stability wait is interrupted by a navigation."""
+
+        calls = 0
+
+        def execute_async_script(self, script, *args):
+            self.calls += 1
+            if self.calls == 1:
+                raise WebDriverException('document unloaded while waiting for result')
+            return True
+
+    assert BasePage(ReplacedDocumentDriver()).wait_until_stable(timeout=1)
+    assert monitor.end_scenario()['calls'] == 0
@@ -0,0 +1,284 @@
+"""
+Accessibility audit.
+Checks a page against common WCAG rules with a single injected script and
+returns the violations for steps to assert on.
+"""
+
+
+# Minimum contrast ratios (normal text, large text) per WCAG level
+WCAG_LEVELS = {
+    'AA': (4.5, 3.0),
+    'AAA': (7.0, 4.5)
+}
+
+RULES = ('color-contrast', 'image-alt', 'button-name', 'link-name', 'label', 'tabindex')
+
+# Walks the visible elements below the root selector or element (default:
+# body) once
+# and collects every violation plus the keyboard focus order. Text contrast
+# is measured against the composited background colours of the element and
+# its ancestors; text over a background image cannot be measured and is
+# skipped. Subtrees hidden with aria-hidden are not exposed to assistive
+# technology, so their images and names are not checked.
+AUDIT_SCRIPT = """
+var root = arguments[0], minRatio = arguments[1], minLargeRatio = arguments[2];
+var roots = !root ? [document.body]
+    : typeof root === 'string' ? Array.prototype.slice.call(document.querySelectorAll(root)) : [root];
+var violations = [], backgrounds = new Map(), seen = new Set();
+
+function selectorFor(el) {
+    var parts = [];
+    while (el && el.nodeType === 1 && parts.length < 4) {
+        if (el.id) { parts.unshift('#' + CSS.escape(el.id)); break; }
+        var part = el.tagName.toLowerCase(), parent = el.parentElement;
+        if (parent) {
+            var same = Array.prototype.filter.call(parent.children, function(c) { return c.tagName === el.tagName; });
+            if (same.length > 1) { part += ':nth-of-type(' + (same.indexOf(el) + 1) + ')'; }
+        }
+        parts.unshift(part);
+        el = parent;
+    }
+    return parts.join(' > ');
+}
+
+function report(rule, el, message, details) {
+    var entry = {rule: rule, selector: selectorFor(el), message: message};
+    for (var key in details || {}) { entry[key] = details[key]; }
+    violations.push(entry);
+}
+
+function isVisible(el, style) {
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && parseFloat(style.opacity) > 0;
+}
+
+function isAriaHidden(el) {
+    return !!el.closest('[aria-hidden="true"]');
+}
+
+function parseColor(value) {
+    var match = /rgba?\\(([^)]+)\\)/.exec(value || '');
+    if (!match) { return null; }
+    var parts = match[1].split(/[\\s,\\/]+/).filter(Boolean).map(parseFloat);
+    return [parts[0], parts[1], parts[2], parts.length > 3 ? parts[3] : 1];
+}
+
+function blend(top, bottom) {
+    var a = top[3] + bottom[3] * (1 - top[3]);
+    if (a === 0) { return [0, 0, 0, 0]; }
+    return [0, 1, 2].map(function(i) {
+        return (top[i] * top[3] + bottom[i] * bottom[3] * (1 - top[3])) / a;
+    }).concat([a]);
+}
+
+// Composited background behind an element, null over background images
+function background(el) {
+    if (backgrounds.has(el)) { return backgrounds.get(el); }
+    var result;
+    var style = window.getComputedStyle(el);
+    var color = parseColor(style.backgroundColor);
+    if (style.backgroundImage !== 'none') {
+        result = null;
+    } else if (color && color[3] >= 1) {
+        result = color;
+    } else {
+        var below = el.parentElement ? background(el.parentElement) : [255, 255, 255, 1];
+        result = below && color && color[3] > 0 ? blend(color, below) : below;
+    }
+    backgrounds.set(el, result);
+    return result;
+}
+
+function luminance(color) {
+    var c = color.slice(0, 3).map(function(v) {
+        v /= 255;
+        return v <= 0.03928 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+    });
+    return 0.2126 * c[0] + 0.7152 * c[1] + 0.0722 * c[2];
+}
+
+function contrast(a, b) {
+    var la = luminance(a), lb = luminance(b);
+    return (Math.max(la, lb) + 0.05) / (Math.min(la, lb) + 0.05);
+}
+
+function ownText(el) {
+    var text = '';
+    el.childNodes.forEach(function(node) { if (node.nodeType === 3) { text += node.nodeValue; } });
+    return text.trim();
+}
+
+// Text an assistive technology would read, without aria-hidden descendants
+// such as Material icon ligatures
+function exposedText(el) {
+    var text = '';
+    el.childNodes.forEach(function(node) {
+        if (node.nodeType === 3) {
+            text += node.nodeValue;
+        } else if (node.nodeType === 1 && node.getAttribute('aria-hidden') !== 'true') {
+            text += ' ' + (node.tagName === 'IMG' ? node.getAttribute('alt') || '' : exposedText(node));
+        }
+    });
+    return text.replace(/\\s+/g, ' ').trim();
+}
+
+function accessibleName(el) {
+    var label = (el.getAttribute('aria-label') || '').trim();
+    if (label) { return label; }
+    var ids = el.getAttribute('aria-labelledby');
+    if (ids) {
+        label = ids.split(/\\s+/).map(function(id) { return document.getElementById(id); })
+            .filter(Boolean).map(function(n) { return n.textContent; }).join(' ').trim();
+        if (label) { return label; }
+    }
+    if (el.labels && el.labels.length) {
+        label = Array.prototype.map.call(el.labels, function(l) { return l.textContent; }).join(' ').trim();
+        if (label) { return label; }
+    }
+    if (el.tagName === 'INPUT' && /^(button|submit|reset)$/.test(el.type)) { return el.value.trim(); }
+    if (el.tagName !== 'INPUT' && el.tagName !== 'SELECT' && el.tagName !== 'TEXTAREA') {
+        label = exposedText(el);
+        if (label) { return label; }
+    }
+    return (el.getAttribute('title') || '').trim();
+}
+
+function checkContrast(el, style) {
+    if (!ownText(el) || el.closest(':disabled, [aria-disabled="true"]')) { return; }
+    var bg = background(el), fg = parseColor(style.color);
+    if (!bg || !fg) { return; }
+    var size = parseFloat(style.fontSize), weight = parseInt(style.fontWeight, 10) || 400;
+    var large = size >= 24 || (size >= 18.66 && weight >= 700);
+    var required = large ? minLargeRatio : minRatio;
+    var ratio = contrast(fg[3] < 1 ? blend(fg, bg) : fg, bg);
+    if (ratio < required) {
+        report('color-contrast', el, 'Text contrast ' + ratio.toFixed(2) + ':1 is below ' + required + ':1', {
+            text: ownText(el).slice(0, 80),
+            ratio: Math.round(ratio * 100) / 100,
+            required: required,
+            foreground: style.color,
+            background: 'rgb(' + bg.slice(0, 3).map(Math.round).join(', ') + ')'
+        });
+    }
+}
+
+function checkImage(el) {
+    if (el.tagName === 'IMG') {
+        var alt = el.getAttribute('alt');
+        if (alt === null) {
+            report('image-alt', el, 'Image has no alt attribute', {src: el.getAttribute('src')});
+        } else if (/\\.(png|jpe?g|gif|svg|webp)$/i.test(alt.trim()) || /^(image|img|picture|photo|graphic)$/i.test(alt.trim())) {
+            report('image-alt', el, 'Image alt text "' + alt + '" is not descriptive', {src: el.getAttribute('src')});
+        }
+    } else if (el.getAttribute('role') === 'img' && !accessibleName(el)) {
+        report('image-alt', el, 'Element with role="img" has no accessible name');
+    }
+}
+
+function checkName(el) {
+    var role = el.getAttribute('role');
+    if (el.tagName === 'BUTTON' || role === 'button') {
+        if (!accessibleName(el)) { report('button-name', el, 'Button has no accessible name (add aria-label to icon buttons)'); }
+    } else if ((el.tagName === 'A' && el.hasAttribute('href')) || role === 'link') {
+        if (!accessibleName(el)) { report('link-name', el, 'Link has no accessible name'); }
+    } else if ((el.tagName === 'INPUT' && !/^(hidden|button|submit|reset|image)$/.test(el.type)) ||
+               el.tagName === 'SELECT' || el.tagName === 'TEXTAREA') {
+        if (!accessibleName(el)) { report('label', el, 'Form field has no label'); }
+    }
+}
+
+var FOCUSABLE = 'a[href], area[href], button, input, select, textarea, iframe, summary, ' +
+    '[tabindex], [contenteditable=""], [contenteditable="true"]';
+var focusable = [], checked = 0;
+
+roots.forEach(function(root) {
+    var walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+    for (var el = root; el; el = walker.nextNode()) {
+        if (seen.has(el) || /^(SCRIPT|STYLE|NOSCRIPT|TEMPLATE|HEAD)$/.test(el.tagName)) { continue; }
+        seen.add(el);
+        var style = window.getComputedStyle(el);
+        if (!isVisible(el, style)) { continue; }
+        checked++;
+        checkContrast(el, style);
+        if (!isAriaHidden(el)) {
+            checkImage(el);
+            checkName(el);
+        }
+        if (el.matches(FOCUSABLE) && !el.disabled && el.tabIndex >= 0 && el.type !== 'hidden') {
+            focusable.push(el);
+            if (el.tabIndex > 0) {
+                report('tabindex', el, 'Positive tabindex ' + el.tabIndex + ' changes the focus order', {tabindex: el.tabIndex});
+            }
+        }
+    }
+});
+
+// Keyboard order: positive tabindex ascending first, then document order
+var order = focusable.map(function(el, i) { return {el: el, i: i}; }).sort(function(a, b) {
+    var ta = a.el.tabIndex || Infinity, tb = b.el.tabIndex || Infinity;
+    return ta === tb ? a.i - b.i : ta - tb;
+});
+
+return {
+    violations: violations,
+    focus_order: order.map(function(entry) {
+        return {selector: selectorFor(entry.el), name: accessibleName(entry.el).slice(0, 80), tabindex: entry.el.tabIndex};
+    }),
+    checked: checked
+};
+"""
+
+
+def audit_page(driver, root=None, level='AA'):
+    """
+    Audit the current page for accessibility problems in one round trip.
+
+    Args:
+        driver: WebDriver instance
+        root: Optional CSS selector or WebElement limiting the audit to
+            its subtrees
+        level: WCAG conformance level for contrast, 'AA' or 'AAA'
+
+    Returns:
+        Dictionary with 'violations' (list of {rule, selector, message, ...}),
+        'focus_order' (focusable elements in keyboard order, each with
+        selector, name and tabindex) and 'checked' (number of visible
+        elements audited)
+    """
+    if level not in WCAG_LEVELS:
+        raise ValueError(f"Invalid WCAG level '{level}'. Expected one of: {', '.join(WCAG_LEVELS)}")
+    min_ratio, min_large_ratio = WCAG_LEVELS[level]
+    return driver.execute_script(AUDIT_SCRIPT, root, min_ratio, min_large_ratio)
+
+
+def filter_violations(audit, *rules):
+    """
+    Get the violations of some rules.
+
+    Args:
+        audit: Result of audit_page()
+        *rules: Rule names from RULES (default: all rules)
+
+    Returns:
+        List of violation dictionaries
+    """
+    return [v for v in audit['violations'] if not rules or v['rule'] in rules]
+
+
+def format_violations(violations, limit=10):
+    """
+    Format violations as readable lines for assertion messages.
+
+    Args:
+        violations: Violation dictionaries
+        limit: Maximum number of violations listed
+
+    Returns:
+        Formatted string
+    """
+    lines = [f"{len(violations)} accessibility violation(s):"]
+    for violation in violations[:limit]:
+        lines.append(f"  [{violation['rule']}] {violation['selector']}: {violation['message']}")
+    if len(violations) > limit:
+        lines.append(f"  ... and {len(violations) - limit} more")
+    return "\n".join(lines)
@@ -0,0 +1,96 @@
+"""
+Allure results reader.
+Streams *-result.json files from an allure-results directory, parsing them
+on a thread pool and with orjson when it is installed.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+
+RESULT_SUFFIX = '-result.json'
+
+# Files parsed ahead of the consumer per worker thread, bounds memory use
+READ_AHEAD = 4
+
+
+def result_files(results_dir, skip=None):
+    """
+    List the result files of a directory by name only.
+
+    Containers (*-container.json) and attachments are skipped without being
+    opened or stat'ed.
+
+    Args:
+        results_dir: Allure results directory
+        skip: Optional set of file names to leave out
+
+    Returns:
+        Sorted list of file names
+    """
+    skip = skip or ()
+    with os.scandir(results_dir) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(RESULT_SUFFIX) and entry.name not in skip
+        )
+
+
+def read_result(path):
+    """
+    Parse one result file.
+
+    Returns:
+        Result dictionary, or None if the file cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            return loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read {os.path.basename(path)}: {e}")
+        return None
+
+
+def iter_results(results_dir, filenames=None, workers=None):
+    """
+    Yield parsed results as they are read, in file name order.
+
+    Files are parsed on a thread pool, at most READ_AHEAD per worker ahead
+    of the consumer, so memory stays bounded however many files there are.
+    Unreadable files are skipped with a warning.
+
+    Args:
+        results_dir: Allure results directory
+        filenames: Result file names to read (default: all result files)
+        workers: Number of reader threads (default: based on CPU count)
+
+    Yields:
+        Tuples of (file name, result dictionary)
+    """
+    if filenames is None:
+        filenames = result_files(results_dir)
+    workers = workers or min(16, (os.cpu_count() or 2) * 2)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for filename in filenames:
+            pending.append((filename, executor.submit(read_result, os.path.join(results_dir, filename))))
+            if len(pending) >= workers * READ_AHEAD:
+                yield from _completed(*pending.popleft())
+        while pending:
+            yield from _completed(*pending.popleft())
+
+
+def _completed(filename, future):
+    """Yield the result of a read once it finished, unless it failed."""
+    result = future.result()
+    if result is not None:
+        yield filename, result
@@ -0,0 +1,258 @@
+"""
+WebDriver command profiler.
+Records every command a scenario sends to the browser and aggregates the
+timings per step and per scenario.
+"""
+
+import json
+import math
+import os
+import re
+import time
+from datetime import datetime
+
+
+# Commands whose parameters carry a locator
+FIND_COMMANDS = ('findElement', 'findElements', 'findChildElement', 'findChildElements')
+SCRIPT_COMMANDS = ('executeScript', 'executeAsyncScript', 'w3cExecuteScript', 'w3cExecuteScriptAsync')
+
+# Slowest individual commands kept per scenario
+SLOWEST_COMMANDS = 10
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: List of numbers
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, 0 for an empty list
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(durations):
+    """
+    Aggregate a list of durations in seconds.
+
+    Returns:
+        Dictionary with count, total, p50, p95 and max
+    """
+    return {
+        'count': len(durations),
+        'total': round(sum(durations), 4),
+        'p50': round(percentile(durations, 50), 4),
+        'p95': round(percentile(durations, 95), 4),
+        'max': round(max(durations), 4) if durations else 0
+    }
+
+
+def describe_target(command, params):
+    """Get a short description of what a command acts on (locator or script)."""
+    params = params or {}
+    if command in FIND_COMMANDS and 'using' in params:
+        return f"{params['using']}={params.get('value')}"
+    if command in SCRIPT_COMMANDS and params.get('script'):
+        script = re.sub(r'\s+', ' ', params['script']).strip()
+        return script[:60] + ('...' if len(script) > 60 else '')
+    if command == 'executeCdpCommand':
+        return params.get('cmd')
+    if command == 'get':
+        return params.get('url')
+    return None
+
+
+class CommandProfiler:
+    """
+    Times WebDriver commands and attributes them to the running step.
+
+    instrument() wraps driver.execute, which every WebDriver and WebElement
+    call goes through. Commands sent outside a scenario (e.g. while a pooled
+    browser is reset) are not recorded.
+    """
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.scenarios = []
+        self._scenario = None
+        self._step = None
+
+    def instrument(self, driver):
+        """
+        Wrap a driver so its commands are recorded. Safe to call repeatedly.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            The same driver
+        """
+        if getattr(driver, '_command_profiler', None) is self:
+            return driver
+
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = profiled_execute
+        driver._command_profiler = self
+        return driver
+
+    def start_scenario(self, scenario):
+        """Start recording a scenario."""
+        self._scenario = {
+            'feature': scenario.feature.name,
+            'name': scenario.name,
+            'location': f"{scenario.filename}:{scenario.line}",
+            'steps': [],
+            'hook_commands': []
+        }
+        self._step = None
+
+    def start_step(self, step):
+        """Attribute the following commands to a step."""
+        if self._scenario is None:
+            return
+        self._step = {'name': f"{step.keyword} {step.name}", 'line': step.line, 'commands': []}
+        self._scenario['steps'].append(self._step)
+
+    def end_step(self, step):
+        """Stop attributing commands to the current step."""
+        if self._step is not None:
+            self._step['duration'] = step.duration
+            self._step['status'] = step.status.name
+        self._step = None
+
+    def end_scenario(self, scenario):
+        """
+        Stop recording a scenario and aggregate its timings.
+
+        Returns:
+            Scenario timing summary, or None if no scenario was started
+        """
+        if self._scenario is None:
+            return None
+
+        recorded = self._scenario
+        self._scenario = None
+        self._step = None
+
+        commands = [c for step in recorded['steps'] for c in step['commands']] + recorded['hook_commands']
+        summary = {
+            'feature': recorded['feature'],
+            'name': recorded['name'],
+            'location': recorded['location'],
+            'status': scenario.status.name,
+            'duration': scenario.duration,
+            'commands': summarize([c['duration'] for c in commands]),
+            'by_command': self._group(commands, 'command'),
+            'by_target': self._group([c for c in commands if c['target']], 'target'),
+            'steps': [
+                {
+                    'name': step['name'],
+                    'line': step['line'],
+                    'status': step.get('status'),
+                    'duration': step.get('duration', 0),
+                    'commands': summarize([c['duration'] for c in step['commands']]),
+                    'by_command': self._group(step['commands'], 'command')
+                }
+                for step in recorded['steps']
+            ],
+            'slowest': [
+                dict(c, duration=round(c['duration'], 4))
+                for c in sorted(commands, key=lambda c: c['duration'], reverse=True)[:SLOWEST_COMMANDS]
+            ]
+        }
+        self.scenarios.append(summary)
+        return summary
+
+    def format_summary(self, summary):
+        """
+        Format a scenario summary as a plain text table for report attachments.
+
+        Args:
+            summary: Dictionary returned by end_scenario()
+
+        Returns:
+            Summary text
+        """
+        totals = summary['commands']
+        lines = [
+            f"WebDriver commands: {totals['count']} in {totals['total']:.2f}s "
+            f"(p50 {totals['p50'] * 1000:.0f} ms, p95 {totals['p95'] * 1000:.0f} ms) "
+            f"of {summary['duration']:.2f}s scenario time",
+            "",
+            f"{'Step':<60} {'Cmds':>5} {'Cmd time':>9} {'Step time':>10}"
+        ]
+        for step in summary['steps']:
+            lines.append(
+                f"{step['name'][:60]:<60} {step['commands']['count']:>5} "
+                f"{step['commands']['total']:>8.2f}s {step['duration']:>9.2f}s"
+            )
+
+        lines += ["", f"{'Command':<30} {'Count':>6} {'Total':>9} {'p50':>8} {'p95':>8}"]
+        by_total = sorted(summary['by_command'].items(), key=lambda item: item[1]['total'], reverse=True)
+        for command, stats in by_total:
+            lines.append(
+                f"{command:<30} {stats['count']:>6} {stats['total']:>8.2f}s "
+                f"{stats['p50'] * 1000:>6.0f}ms {stats['p95'] * 1000:>6.0f}ms"
+            )
+
+        if summary['slowest']:
+            lines += ["", "Slowest commands:"]
+            for c in summary['slowest']:
+                target = f" [{c['target']}]" if c['target'] else ""
+                lines.append(f"  {c['duration'] * 1000:>7.0f} ms  {c['command']}{target}  in {c['step']}")
+
+        return "\n".join(lines)
+
+    def write(self, path):
+        """
+        Write all scenario summaries to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'scenarios': self.scenarios
+            }, f, indent=2)
+
+    def _record(self, command, params, duration):
+        """Store one command against the current step."""
+        if self._scenario is None:
+            return
+        entry = {
+            'command': command,
+            'target': describe_target(command, params),
+            'duration': duration,
+            'step': self._step['name'] if self._step else '(hooks)'
+        }
+        if self._step is not None:
+            self._step['commands'].append(entry)
+        else:
+            self._scenario['hook_commands'].append(entry)
+
+    @staticmethod
+    def _group(commands, key):
+        """Aggregate commands grouped by one of their fields."""
+        groups = {}
+        for c in commands:
+            groups.setdefault(c[key], []).append(c['duration'])
+        return {name: summarize(durations) for name, durations in groups.items()}
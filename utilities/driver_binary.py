@@ -0,0 +1,216 @@
+"""
+Driver binary resolution cache.
+Resolves chromedriver/geckodriver once and shares the result across runs
+and parallel workers.
+"""
+
+import json
+import os
+import time
+
+from utilities import sleep_budget
+
+
+# Seconds after which a lock left behind by a crashed process is broken
+STALE_LOCK_SECONDS = 300
+
+# Config setting that pins the driver path of each browser
+PINNED_PATH_SETTINGS = {
+    'chrome': 'CHROMEDRIVER_PATH',
+    'firefox': 'GECKODRIVER_PATH'
+}
+
+
+class DriverBinaryCache:
+    """
+    Cache of resolved driver binary paths.
+
+    Resolution order for a browser:
+        1. Pinned path (CHROMEDRIVER_PATH / GECKODRIVER_PATH)
+        2. Path already resolved by this process
+        3. On-disk cache shared by all runs and workers, if not older than ttl
+        4. webdriver-manager, then the result is written to the on-disk cache
+
+    In offline mode step 4 is never taken, so a run without a pinned or
+    cached driver fails fast instead of trying the network.
+    """
+
+    CACHE_FILE = 'resolved-drivers.json'
+
+    def __init__(self, cache_dir, ttl=86400, offline=False, pinned=None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache and lock files
+            ttl: Seconds before a cached path is resolved again
+            offline: Never call webdriver-manager
+            pinned: Dictionary of browser name to a fixed driver path
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.cache_file = os.path.join(self.cache_dir, self.CACHE_FILE)
+        self.lock_file = self.cache_file + '.lock'
+        self.ttl = ttl
+        self.offline = offline
+        self.pinned = {browser: path for browser, path in (pinned or {}).items() if path}
+        self._resolved = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Create a cache from the driver settings of a Config class.
+
+        Args:
+            config: Config class
+
+        Returns:
+            DriverBinaryCache instance
+        """
+        return cls(
+            config.DRIVER_CACHE_DIR,
+            ttl=config.DRIVER_CACHE_TTL,
+            offline=config.DRIVER_OFFLINE,
+            pinned={browser: getattr(config, setting) for browser, setting in PINNED_PATH_SETTINGS.items()}
+        )
+
+    def resolve(self, browser):
+        """
+        Get the driver binary path for a browser.
+
+        Args:
+            browser: 'chrome' or 'firefox'
+
+        Returns:
+            Path to the driver executable
+
+        Raises:
+            FileNotFoundError: If a pinned path does not exist, or no driver
+                is available in offline mode
+        """
+        if browser in self.pinned:
+            path = self.pinned[browser]
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"Pinned {browser} driver not found: {path}")
+            return path
+
+        if browser in self._resolved:
+            return self._resolved[browser]
+
+        path = self._read_cached(browser)
+        if path is None:
+            if self.offline:
+                raise FileNotFoundError(
+                    f"No cached {browser} driver in {self.cache_file} and DRIVER_OFFLINE is enabled. "
+                    f"Set {PINNED_PATH_SETTINGS[browser]} or run once online to populate the cache."
+                )
+            path = self._install_locked(browser)
+
+        self._resolved[browser] = path
+        return path
+
+    def is_pinned(self, browser):
+        """Check whether a browser uses a pinned driver path."""
+        return browser in self.pinned
+
+    def invalidate(self, browser):
+        """
+        Forget the resolved path of a browser, e.g. after the browser was
+        upgraded and the cached driver no longer matches.
+
+        Args:
+            browser: 'chrome' or 'firefox'
+        """
+        self._resolved.pop(browser, None)
+        if self.offline:
+            return
+        with self._lock():
+            entries = self._read_entries()
+            if entries.pop(browser, None) is not None:
+                self._write_entries(entries)
+
+    def _read_cached(self, browser):
+        """Get a fresh, existing path from the on-disk cache."""
+        entry = self._read_entries().get(browser)
+        if not entry or not os.path.isfile(entry.get('path', '')):
+            return None
+        if not self.offline and time.time() - entry.get('resolved_at', 0) > self.ttl:
+            return None
+        return entry['path']
+
+    def _install_locked(self, browser):
+        """Run webdriver-manager while holding the cache lock."""
+        with self._lock():
+            # Another worker may have resolved it while we waited for the lock
+            path = self._read_cached(browser)
+            if path:
+                return path
+
+            path = self._install(browser)
+            entries = self._read_entries()
+            entries[browser] = {'path': path, 'resolved_at': time.time()}
+            self._write_entries(entries)
+            return path
+
+    @staticmethod
+    def _install(browser):
+        """Download or locate a matching driver with webdriver-manager."""
+        if browser == 'firefox':
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    def _read_entries(self):
+        """Read the on-disk cache, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_entries(self, entries):
+        """Write the on-disk cache atomically."""
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(temp_file, self.cache_file)
+
+    def _lock(self):
+        """Get a context manager holding the cross-process cache lock."""
+        return _FileLock(self.lock_file)
+
+
+class _FileLock:
+    """Portable exclusive lock based on atomic creation of a lock file."""
+
+    def __init__(self, path, poll_interval=0.1):
+        self.path = path
+        self.poll_interval = poll_interval
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._break_if_stale()
+                with sleep_budget.exempt():
+                    time.sleep(self.poll_interval)
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(str(os.getpid()))
+            return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _break_if_stale(self):
+        """Remove a lock file left behind by a process that died holding it."""
+        try:
+            if time.time() - os.path.getmtime(self.path) > STALE_LOCK_SECONDS:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
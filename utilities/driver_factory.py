@@ -0,0 +1,159 @@
+"""
+WebDriver factory.
+Builds Chrome or Firefox from the browser settings in Config.
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.common.exceptions import SessionNotCreatedException
+
+
+# URL patterns blocked when BLOCK_FONTS is enabled
+FONT_URL_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+
+# Chrome switches that keep timers and rendering at full speed when the
+# window is hidden or headless
+CHROME_FAST_ARGUMENTS = [
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--mute-audio'
+]
+
+
+class DriverFactory:
+    """
+    Creates WebDriver instances from browser options.
+
+    Options are the dictionary returned by Config.get_browser_options():
+        browser:            'chrome' or 'firefox'
+        headless:           Run without a window (Chrome uses --headless=new)
+        window_size:        'width,height'
+        timeout:            Implicit wait in seconds
+        page_load_timeout:  Page load timeout in seconds
+        fast_mode:          Disable extensions and background throttling
+        page_load_strategy: 'normal', 'eager' or 'none'
+        block_images:       Do not download images
+        block_fonts:        Do not download web fonts
+    """
+
+    BROWSERS = ('chrome', 'firefox')
+
+    def __init__(self, options, binaries):
+        """
+        Initialize the factory.
+
+        Args:
+            options: Browser options dictionary
+            binaries: DriverBinaryCache used to locate the driver executable
+        """
+        browser = options['browser'].lower()
+        if browser not in self.BROWSERS:
+            raise ValueError(
+                f"Unsupported browser '{options['browser']}'. Expected one of: {', '.join(self.BROWSERS)}"
+            )
+        self.options = dict(options, browser=browser)
+        self.width, self.height = self._parse_window_size(options['window_size'])
+        self.binaries = binaries
+
+    def create(self):
+        """
+        Launch a new browser.
+
+        Returns:
+            WebDriver instance
+        """
+        browser = self.options['browser']
+        launch = self._create_firefox if browser == 'firefox' else self._create_chrome
+        try:
+            driver = launch(self.binaries.resolve(browser))
+        except SessionNotCreatedException:
+            if self.binaries.is_pinned(browser):
+                raise
+            # The browser was upgraded since the driver was cached, resolve again
+            self.binaries.invalidate(browser)
+            driver = launch(self.binaries.resolve(browser))
+
+        driver.set_window_size(self.width, self.height)
+        driver.implicitly_wait(self.options['timeout'])
+        driver.set_page_load_timeout(self.options['page_load_timeout'])
+        return driver
+
+    def _create_chrome(self, driver_path):
+        """Launch Chrome with the configured options."""
+        chrome_options = ChromeOptions()
+        chrome_options.page_load_strategy = self.options['page_load_strategy']
+
+        if self.options['headless']:
+            chrome_options.add_argument('--headless=new')
+
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument(f'--window-size={self.width},{self.height}')
+
+        if self.options['fast_mode']:
+            for argument in CHROME_FAST_ARGUMENTS:
+                chrome_options.add_argument(argument)
+
+        if self.options['block_images']:
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+
+        driver = webdriver.Chrome(
+            service=ChromeService(driver_path),
+            options=chrome_options
+        )
+
+        # Chrome has no font preference, so font requests are blocked through CDP
+        if self.options['block_fonts']:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': FONT_URL_PATTERNS})
+
+        return driver
+
+    def _create_firefox(self, driver_path):
+        """Launch Firefox with the configured options."""
+        firefox_options = FirefoxOptions()
+        firefox_options.page_load_strategy = self.options['page_load_strategy']
+
+        if self.options['headless']:
+            firefox_options.add_argument('-headless')
+
+        if self.options['fast_mode']:
+            firefox_options.set_preference('extensions.enabledScopes', 0)
+            firefox_options.set_preference('dom.min_background_timeout_value', 4)
+            firefox_options.set_preference('dom.timeout.enable_budget_timer_throttling', False)
+            firefox_options.set_preference('app.update.enabled', False)
+            firefox_options.set_preference('browser.shell.checkDefaultBrowser', False)
+
+        if self.options['block_images']:
+            firefox_options.set_preference('permissions.default.image', 2)
+
+        if self.options['block_fonts']:
+            firefox_options.set_preference('browser.display.use_document_fonts', 0)
+            firefox_options.set_preference('gfx.downloadable_fonts.enabled', False)
+
+        return webdriver.Firefox(
+            service=FirefoxService(driver_path),
+            options=firefox_options
+        )
+
+    @staticmethod
+    def _parse_window_size(window_size):
+        """Parse a 'width,height' string into two integers."""
+        try:
+            width, height = (int(part) for part in window_size.lower().replace('x', ',').split(','))
+        except ValueError:
+            raise ValueError(f"Invalid WINDOW_SIZE '{window_size}'. Expected 'width,height', e.g. 1920,1080")
+        return width, height
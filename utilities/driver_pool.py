@@ -0,0 +1,142 @@
+"""
+WebDriver pool that keeps warm browsers alive across scenarios.
+"""
+
+from selenium.common.exceptions import WebDriverException, NoAlertPresentException
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver instances.
+
+    Browsers are handed out with acquire() and returned with release().
+    Between scenarios a returned browser is reset cheaply (cookies, storage,
+    extra tabs and viewport) instead of being quit and relaunched.
+
+    Reuse scopes:
+        scenario: quit the browser after every scenario (original behaviour)
+        feature:  keep the browser for all scenarios of a feature file
+        run:      keep the browser for the whole test run
+    """
+
+    SCOPES = ('scenario', 'feature', 'run')
+
+    def __init__(self, factory, scope='feature'):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable returning a new WebDriver instance
+            scope: Reuse scope ('scenario', 'feature' or 'run')
+        """
+        if scope not in self.SCOPES:
+            raise ValueError(
+                f"Invalid driver reuse scope '{scope}'. Expected one of: {', '.join(self.SCOPES)}"
+            )
+        self.factory = factory
+        self.scope = scope
+        self._idle = []
+        self._window_sizes = {}
+
+    def acquire(self):
+        """
+        Get a browser from the pool, launching a new one if none is idle.
+
+        Returns:
+            WebDriver instance
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_alive(driver):
+                return driver
+            self._quit(driver)
+
+        driver = self.factory()
+        self._window_sizes[id(driver)] = driver.get_window_size()
+        return driver
+
+    def release(self, driver, discard=False):
+        """
+        Return a browser to the pool.
+
+        Args:
+            driver: WebDriver instance obtained from acquire()
+            discard: Quit the browser instead of keeping it warm
+        """
+        if discard or self.scope == 'scenario':
+            self._quit(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"Warning: Could not reset browser, discarding it: {e}")
+            self._quit(driver)
+            return
+
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        """
+        Reset browser state so the next scenario starts clean.
+
+        Args:
+            driver: WebDriver instance to reset
+        """
+        # Dismiss any leftover alert, it blocks every other command
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        # Close extra tabs/windows and go back to the first one
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so clear it before leaving the page
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.get('about:blank')
+
+        # Clear cookies for all domains when CDP is available
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            driver.delete_all_cookies()
+
+        # Restore the viewport the browser was launched with
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+        size = self._window_sizes.get(id(driver))
+        if size and driver.get_window_size() != size:
+            driver.set_window_size(size['width'], size['height'])
+
+    def end_feature(self):
+        """Close idle browsers at the end of a feature when using feature scope."""
+        if self.scope == 'feature':
+            self.close_all()
+
+    def close_all(self):
+        """Quit all idle browsers."""
+        while self._idle:
+            self._quit(self._idle.pop())
+
+    def _is_alive(self, driver):
+        """Check that the browser session still responds."""
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _quit(self, driver):
+        """Quit a browser, ignoring errors from already dead sessions."""
+        self._window_sizes.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
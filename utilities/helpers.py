@@ -7,33 +7,42 @@ import json
 from datetime import datetime
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from config.config import Config
+from utilities.screenshot_writer import IMAGE_FORMATS, capture_screenshot, encode_screenshot
 
 
 class TestHelpers:
     """Collection of helper methods for tests."""
 
     @staticmethod
-    def take_screenshot(driver, name):
+    def take_screenshot(driver, name, writer=None):
         """
         Take a screenshot and save it with timestamp.
 
         Args:
             driver: WebDriver instance
             name: Base name for the screenshot
+            writer: Optional ScreenshotWriter (e.g. context.screenshot_writer)
+                that saves in the background; without one the screenshot is
+                written before returning
 
         Returns:
             Path to saved screenshot
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_dir = "reports/screenshots"
+        data, _ = capture_screenshot(driver, quality=Config.SCREENSHOT_QUALITY)
 
-        if not os.path.exists(screenshot_dir):
-            os.makedirs(screenshot_dir)
+        if writer:
+            return writer.submit(data, f"{name}_{timestamp}")
 
-        filename = f"{name}_{timestamp}.png"
-        filepath = os.path.join(screenshot_dir, filename)
+        if not os.path.exists(Config.SCREENSHOT_DIR):
+            os.makedirs(Config.SCREENSHOT_DIR)
 
-        driver.save_screenshot(filepath)
+        extension = IMAGE_FORMATS[Config.SCREENSHOT_FORMAT][0]
+        filepath = os.path.join(Config.SCREENSHOT_DIR, f"{name}_{timestamp}.{extension}")
+        with open(filepath, 'wb') as f:
+            f.write(encode_screenshot(data, Config.SCREENSHOT_FORMAT, Config.SCREENSHOT_QUALITY,
+                                      Config.SCREENSHOT_MAX_WIDTH))
         return filepath
 
     @staticmethod
@@ -0,0 +1,48 @@
+"""
+Deep-link navigation cache.
+Remembers the page URL an entity resolved to through search.
+"""
+
+
+class NavigationCache:
+    """Cache of entity URLs keyed by search term."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._urls = {}
+
+    def get(self, search_term):
+        """
+        Get the cached URL for a search term.
+
+        Args:
+            search_term: Term that was searched for
+
+        Returns:
+            URL string or None
+        """
+        return self._urls.get(self._key(search_term))
+
+    def record(self, search_term, url):
+        """
+        Remember the URL a search term resolved to.
+
+        Args:
+            search_term: Term that was searched for
+            url: URL the search navigated to
+        """
+        self._urls[self._key(search_term)] = url
+
+    def invalidate(self, search_term):
+        """
+        Forget the URL of a search term.
+
+        Args:
+            search_term: Term that was searched for
+        """
+        self._urls.pop(self._key(search_term), None)
+
+    @staticmethod
+    def _key(search_term):
+        """Normalize a search term into a cache key."""
+        return search_term.strip().lower()
@@ -0,0 +1,238 @@
+"""
+Run history store.
+Keeps every run's per-scenario duration and status in an append-only SQLite
+database so reports can show trends, regressions and flaky rates.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from statistics import median
+
+from utilities.allure_results import iter_results, result_files
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ingested_at TEXT NOT NULL,
+    started_at INTEGER,
+    stopped_at INTEGER
+);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    filename TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id)
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    scenario_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    feature TEXT,
+    status TEXT,
+    start INTEGER,
+    stop INTEGER,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS results_scenario ON results (scenario_id, run_id);
+"""
+
+
+def scenario_id(result):
+    """Get the identifier that matches a scenario across runs."""
+    return result.get('historyId') or result.get('fullName') or result.get('name', '')
+
+
+def flip_rate(statuses):
+    """
+    Share of consecutive runs whose outcome changed.
+
+    Args:
+        statuses: Outcomes oldest first ('passed', 'failed' or 'mixed' for a
+            run with both, e.g. after a rerun)
+
+    Returns:
+        Rate between 0 and 1
+    """
+    if len(statuses) < 2:
+        return 1.0 if statuses == ['mixed'] else 0.0
+    flips = sum(1 for previous, current in zip(statuses, statuses[1:])
+                if previous != current or current == 'mixed')
+    return flips / (len(statuses) - 1)
+
+
+class RunHistory:
+    """
+    Append-only store of scenario results per run.
+
+    Every ingest() records the result files it has not seen before as one
+    new run, so call it once after each test run.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (and create if needed) the history database.
+
+        Args:
+            db_path: SQLite file path
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path)
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def ingest(self, results_dir):
+        """
+        Add the result files of a directory that are not in the store yet.
+
+        Args:
+            results_dir: Allure results directory
+
+        Returns:
+            Number of results added (0 when there was nothing new)
+        """
+        if not os.path.exists(results_dir):
+            return 0
+
+        known = {row[0] for row in self._db.execute("SELECT filename FROM ingested_files")}
+        new_files = result_files(results_dir, skip=known)
+        if not new_files:
+            return 0
+
+        # Unreadable files are not recorded, so the next ingest retries them
+        rows = []
+        for filename, result in iter_results(results_dir, new_files):
+            feature = next(
+                (label.get('value') for label in result.get('labels', []) if label.get('name') == 'feature'),
+                None
+            )
+            start, stop = result.get('start', 0), result.get('stop', 0)
+            rows.append((filename, scenario_id(result), result.get('name', 'Unknown Test'), feature,
+                         result.get('status'), start, stop, (stop - start) / 1000))
+
+        if not rows:
+            return 0
+        with self._db:
+            run_id = self._db.execute(
+                "INSERT INTO runs (ingested_at, started_at, stopped_at) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'),
+                 min(r[5] for r in rows), max(r[6] for r in rows))
+            ).lastrowid
+            self._db.executemany(
+                "INSERT INTO ingested_files (filename, run_id) VALUES (?, ?)",
+                [(row[0], run_id) for row in rows]
+            )
+            self._db.executemany(
+                "INSERT INTO results (run_id, scenario_id, name, feature, status, start, stop, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row[1:] for row in rows]
+            )
+        return len(rows)
+
+    def previous_durations(self, results_dir):
+        """
+        Get the scenario durations of the run ingested before a directory's results.
+
+        The directory's run is the latest one holding any of its result
+        files, so a report regenerated from older results still compares
+        them with the run before them.
+
+        Args:
+            results_dir: Allure results directory, already ingested
+
+        Returns:
+            Dictionary of scenario id to duration in seconds (empty without an earlier run)
+        """
+        if not os.path.exists(results_dir):
+            return {}
+
+        ingested = dict(self._db.execute("SELECT filename, run_id FROM ingested_files"))
+        run_ids = [ingested[filename] for filename in result_files(results_dir) if filename in ingested]
+        if not run_ids:
+            return {}
+        previous = self._db.execute("SELECT MAX(id) FROM runs WHERE id < ?", (max(run_ids),)).fetchone()[0]
+        if previous is None:
+            return {}
+
+        # Reruns leave several results per scenario, the last one counts
+        rows = self._db.execute(
+            "SELECT scenario_id, duration FROM results WHERE run_id = ? ORDER BY stop", (previous,)
+        )
+        return dict(rows)
+
+    def run_count(self):
+        """Get the number of runs in the store."""
+        return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def trends(self, runs=20, regression_threshold=20):
+        """
+        Summarize each scenario over the last runs.
+
+        A scenario regressed when its latest duration is more than the
+        threshold above the median of its earlier runs in the window.
+
+        Args:
+            runs: Number of most recent runs to look at
+            regression_threshold: Percentage slowdown that counts as a regression
+
+        Returns:
+            List of scenario dictionaries (name, feature, durations oldest
+            first, latest, baseline, change, regression, pass_rate,
+            flaky_rate, runs), regressions first, then by flaky rate
+        """
+        recent = [row[0] for row in self._db.execute(
+            "SELECT id FROM runs ORDER BY id DESC LIMIT ?", (runs,)
+        )]
+        if not recent:
+            return []
+
+        placeholders = ",".join("?" * len(recent))
+        rows = self._db.execute(
+            f"SELECT scenario_id, run_id, name, feature, status, duration FROM results "
+            f"WHERE run_id IN ({placeholders}) ORDER BY run_id, stop",
+            recent
+        )
+
+        # Per scenario and run: the last result's duration and every status (reruns)
+        scenarios = {}
+        for scenario, run_id, name, feature, status, duration in rows:
+            entry = scenarios.setdefault(scenario, {'name': name, 'feature': feature, 'runs': {}})
+            entry['name'] = name
+            run = entry['runs'].setdefault(run_id, {'duration': duration, 'statuses': set()})
+            run['duration'] = duration
+            run['statuses'].add(status)
+
+        trends = []
+        for entry in scenarios.values():
+            run_ids = sorted(entry['runs'])
+            ordered = [entry['runs'][run_id] for run_id in run_ids]
+            durations = [run['duration'] for run in ordered]
+            # Skipped results say nothing about stability
+            outcomes = [
+                'passed' if statuses == {'passed'} else 'mixed' if 'passed' in statuses else 'failed'
+                for statuses in (run['statuses'] - {'skipped'} for run in ordered)
+                if statuses
+            ]
+            latest = durations[-1]
+            baseline = median(durations[:-1]) if len(durations) > 1 else None
+            change = (latest - baseline) / baseline * 100 if baseline else None
+            trends.append({
+                'name': entry['name'],
+                'feature': entry['feature'],
+                'durations': durations,
+                'latest': latest,
+                'baseline': baseline,
+                'change': change,
+                # Only scenarios of the latest run can have just regressed
+                'regression': run_ids[-1] == recent[0] and change is not None and change > regression_threshold,
+                'pass_rate': outcomes.count('passed') / len(outcomes) * 100 if outcomes else 0,
+                'flaky_rate': flip_rate(outcomes) * 100,
+                'runs': len(outcomes)
+            })
+
+        return sorted(trends, key=lambda t: (not t['regression'], -t['flaky_rate'], t['name']))
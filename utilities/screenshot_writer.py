@@ -0,0 +1,153 @@
+"""
+Screenshot capture and background writer.
+Captures compressed screenshots straight from the browser and encodes,
+deduplicates and saves them on a background thread.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import queue
+import threading
+
+from PIL import Image
+
+
+# File extension and Pillow format of each supported output format
+IMAGE_FORMATS = {
+    'webp': ('webp', 'WEBP'),
+    'jpeg': ('jpg', 'JPEG'),
+    'png': ('png', 'PNG')
+}
+
+
+def capture_screenshot(driver, quality=80, clip=None, image_format='jpeg'):
+    """
+    Grab the current viewport as image bytes without touching the disk.
+
+    Chrome captures through CDP Page.captureScreenshot, as a JPEG encoded by
+    the browser unless a lossless PNG is requested; other browsers return a PNG.
+
+    Args:
+        driver: WebDriver instance
+        quality: JPEG quality (1-100) for CDP captures
+        clip: Optional page region {'x', 'y', 'width', 'height', 'scale'} for
+            CDP captures, which may extend beyond the viewport
+        image_format: 'jpeg' or 'png' for CDP captures
+
+    Returns:
+        Tuple of (image bytes, 'jpeg' or 'png')
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        params = {'format': image_format, 'fromSurface': True}
+        if image_format == 'jpeg':
+            params['quality'] = quality
+        if clip:
+            params['clip'] = dict({'scale': 1}, **clip)
+            params['captureBeyondViewport'] = True
+        try:
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', params)
+            return base64.b64decode(result['data']), image_format
+        except Exception as e:
+            print(f"Warning: CDP screenshot failed, falling back to WebDriver: {e}")
+    return driver.get_screenshot_as_png(), 'png'
+
+
+def encode_screenshot(data, image_format='webp', quality=80, max_width=0):
+    """
+    Re-encode screenshot bytes, shrinking them to max_width if needed.
+
+    Args:
+        data: PNG or JPEG bytes
+        image_format: 'webp', 'jpeg' or 'png'
+        quality: Lossy encoding quality (1-100)
+        max_width: Maximum width in pixels, 0 to keep the size
+
+    Returns:
+        Encoded image bytes
+    """
+    image = Image.open(io.BytesIO(data))
+    if max_width and image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)))
+    if image_format == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    output = io.BytesIO()
+    image.save(output, format=IMAGE_FORMATS[image_format][1], quality=quality)
+    return output.getvalue()
+
+
+class ScreenshotWriter:
+    """
+    Saves screenshots from a background thread.
+
+    submit() only hashes the bytes and queues them, so the caller never
+    waits for image encoding or disk I/O. Identical frames are stored once.
+    """
+
+    def __init__(self, directory, image_format='webp', quality=80, max_width=0):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            directory: Directory screenshots are saved to
+            image_format: 'webp', 'jpeg' or 'png'
+            quality: Lossy encoding quality (1-100)
+            max_width: Maximum width in pixels, 0 to keep the size
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported screenshot format '{image_format}'. "
+                             f"Expected one of: {', '.join(IMAGE_FORMATS)}")
+        self.directory = directory
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self._paths = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='screenshot-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, data, name):
+        """
+        Queue screenshot bytes to be encoded and saved.
+
+        Args:
+            data: PNG or JPEG bytes
+            name: File name without extension
+
+        Returns:
+            Path the screenshot is (or will be) saved at. A frame identical
+            to an earlier one returns the earlier path and is not saved again.
+        """
+        digest = hashlib.sha1(data).hexdigest()
+        if digest in self._paths:
+            return self._paths[digest]
+        path = os.path.join(self.directory, f"{name}.{IMAGE_FORMATS[self.image_format][0]}")
+        self._paths[digest] = path
+        self._queue.put((data, path))
+        return path
+
+    def close(self, timeout=30):
+        """
+        Finish the queued screenshots and stop the thread.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Encode and save queued screenshots until close() is called."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            data, path = item
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                encoded = encode_screenshot(data, self.image_format, self.quality, self.max_width)
+                with open(path, 'wb') as f:
+                    f.write(encoded)
+            except Exception as e:
+                print(f"Warning: Could not save screenshot {path}: {e}")
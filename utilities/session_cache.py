@@ -0,0 +1,204 @@
+"""
+Authenticated session cache.
+Logs in once per credential pair and restores the session into later browsers.
+"""
+
+import json
+import time
+from urllib.parse import urlparse
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+# Returns a copy of a Web Storage area as a plain object
+DUMP_STORAGE_SCRIPT = """
+var storage = window[arguments[0]];
+var items = {};
+for (var i = 0; i < storage.length; i++) {
+    var key = storage.key(i);
+    items[key] = storage.getItem(key);
+}
+return items;
+"""
+
+# Seeds Web Storage on the first document of the application origin
+SEED_STORAGE_SCRIPT = """
+(function() {
+    if (window.location.origin !== %(origin)s) { return; }
+    var local = %(local)s, session = %(session)s;
+    Object.keys(local).forEach(function(k) { window.localStorage.setItem(k, local[k]); });
+    Object.keys(session).forEach(function(k) { window.sessionStorage.setItem(k, session[k]); });
+})();
+"""
+
+# Resolves to 'login' when the app shows the login form, 'app' once the
+# authenticated shell is rendered, and null while still loading
+SESSION_STATE_SCRIPT = """
+if (window.location.pathname.indexOf('/login') === 0 ||
+        document.querySelector('button.form-login-button')) {
+    return 'login';
+}
+if (document.readyState === 'complete' && document.querySelector('header, .header, mat-toolbar')) {
+    return 'app';
+}
+return null;
+"""
+
+
+class SessionCache:
+    """Cache of authenticated browser sessions keyed by credential pair."""
+
+    def __init__(self, base_url, ttl=1800, timeout=10):
+        """
+        Initialize the session cache.
+
+        Args:
+            base_url: Application base URL
+            ttl: Maximum snapshot age in seconds
+            timeout: Maximum time to wait for a restored session to be accepted
+        """
+        parsed = urlparse(base_url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.ttl = ttl
+        self.timeout = timeout
+        self._snapshots = {}
+
+    def capture(self, driver, credentials):
+        """
+        Capture cookies and Web Storage of a logged in browser.
+
+        Args:
+            driver: WebDriver instance with an authenticated session
+            credentials: (username, password) tuple used to log in
+        """
+        self._snapshots[credentials] = {
+            'cookies': driver.get_cookies(),
+            'local_storage': driver.execute_script(DUMP_STORAGE_SCRIPT, 'localStorage'),
+            'session_storage': driver.execute_script(DUMP_STORAGE_SCRIPT, 'sessionStorage'),
+            'landing_url': driver.current_url,
+            'captured_at': time.time()
+        }
+
+    def get(self, credentials):
+        """
+        Get a non-expired snapshot for a credential pair.
+
+        Args:
+            credentials: (username, password) tuple
+
+        Returns:
+            Snapshot dictionary or None
+        """
+        snapshot = self._snapshots.get(credentials)
+        if snapshot and self._is_expired(snapshot):
+            self.invalidate(credentials)
+            return None
+        return snapshot
+
+    def invalidate(self, credentials):
+        """
+        Drop the snapshot of a credential pair.
+
+        Args:
+            credentials: (username, password) tuple
+        """
+        self._snapshots.pop(credentials, None)
+
+    def restore(self, driver, credentials):
+        """
+        Inject a cached session into a browser and open the landing page.
+
+        Args:
+            driver: WebDriver instance that has not navigated yet
+            credentials: (username, password) tuple
+
+        Returns:
+            True if the application accepted the session, False otherwise
+        """
+        snapshot = self.get(credentials)
+        if not snapshot:
+            return False
+
+        if hasattr(driver, 'execute_cdp_cmd'):
+            self._inject_with_cdp(driver, snapshot)
+        else:
+            self._inject_with_webdriver(driver, snapshot)
+
+        if self._wait_for_session_state(driver) == 'app':
+            print("Restored cached login session")
+            return True
+
+        print("Cached login session was rejected, falling back to UI login")
+        self.invalidate(credentials)
+        return False
+
+    def _inject_with_cdp(self, driver, snapshot):
+        """Set cookies and seed storage before the first navigation."""
+        driver.execute_cdp_cmd('Network.enable', {})
+        for cookie in snapshot['cookies']:
+            driver.execute_cdp_cmd('Network.setCookie', self._to_cdp_cookie(cookie))
+
+        script = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': SEED_STORAGE_SCRIPT % {
+                'origin': json.dumps(self.origin),
+                'local': json.dumps(snapshot['local_storage']),
+                'session': json.dumps(snapshot['session_storage'])
+            }
+        })
+        try:
+            driver.get(snapshot['landing_url'])
+        finally:
+            # Only the first document needs seeding, later pages own their storage
+            driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {
+                'identifier': script['identifier']
+            })
+
+    def _inject_with_webdriver(self, driver, snapshot):
+        """Fallback for browsers without CDP: open the origin first, then inject."""
+        driver.get(self.origin)
+        for cookie in snapshot['cookies']:
+            driver.add_cookie(cookie)
+        driver.execute_script(
+            "var local = arguments[0], session = arguments[1];"
+            "Object.keys(local).forEach(function(k) { localStorage.setItem(k, local[k]); });"
+            "Object.keys(session).forEach(function(k) { sessionStorage.setItem(k, session[k]); });",
+            snapshot['local_storage'],
+            snapshot['session_storage']
+        )
+        driver.get(snapshot['landing_url'])
+
+    def _wait_for_session_state(self, driver):
+        """Wait until the app shows either the login form or the authenticated shell."""
+        try:
+            return WebDriverWait(driver, self.timeout).until(
+                lambda d: d.execute_script(SESSION_STATE_SCRIPT)
+            )
+        except TimeoutException:
+            return None
+
+    def _is_expired(self, snapshot):
+        """Check snapshot age and cookie expiry."""
+        now = time.time()
+        if now - snapshot['captured_at'] > self.ttl:
+            return True
+        return any(
+            'expiry' in cookie and cookie['expiry'] <= now
+            for cookie in snapshot['cookies']
+        )
+
+    @staticmethod
+    def _to_cdp_cookie(cookie):
+        """Convert a WebDriver cookie to Network.setCookie parameters."""
+        params = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False)
+        }
+        if 'expiry' in cookie:
+            params['expires'] = cookie['expiry']
+        if cookie.get('sameSite'):
+            params['sameSite'] = cookie['sameSite']
+        return params
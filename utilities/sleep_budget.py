@@ -0,0 +1,225 @@
+"""
+Sleep budget accounting.
+Records every fixed time.sleep() made by project code and enforces a
+per-scenario budget of unconditional idle time.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGET_MODES = ('warn', 'fail')
+
+# Per-thread depth of exempt() blocks
+_exempt = threading.local()
+
+
+@contextmanager
+def exempt():
+    """
+    Leave the sleeps inside the block out of the sleep accounting.
+
+    For polling loops in framework code, where a short sleep between
+    retries is part of a condition wait rather than a fixed delay.
+    """
+    _exempt.depth = getattr(_exempt, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _exempt.depth -= 1
+
+
+class SleepBudgetExceeded(AssertionError):
+    """Raised in fail mode when a sleep would exceed the scenario budget."""
+
+
+class SleepMonitor:
+    """
+    Shim around time.sleep() that accounts fixed delays per call site.
+
+    Only sleeps called directly from project files on the thread that runs
+    the scenarios are counted, so polling inside Selenium's WebDriverWait
+    or the mock app's server threads is ignored. Polling loops in project
+    code opt out with exempt().
+
+    Budget modes:
+        warn: report scenarios that slept longer than the budget
+        fail: fail the step whose sleep would exceed the budget
+    """
+
+    def __init__(self, budget=0, mode='warn', root=PROJECT_ROOT):
+        """
+        Initialize the monitor.
+
+        Args:
+            budget: Maximum seconds of sleeping per scenario, 0 for no limit
+            mode: 'warn' or 'fail'
+            root: Directory whose files count as project code
+        """
+        if mode not in BUDGET_MODES:
+            raise ValueError(f"Invalid sleep budget mode '{mode}'. Expected one of: {', '.join(BUDGET_MODES)}")
+        self.budget = budget
+        self.mode = mode
+        self.root = os.path.abspath(root) + os.sep
+        self.scenarios = []
+        self._sites = {}
+        self._scenario = None
+        self._original_sleep = None
+        self._thread_id = None
+
+    def install(self):
+        """Replace time.sleep() with the accounting shim."""
+        if self._original_sleep is None:
+            self._original_sleep = time.sleep
+            self._thread_id = threading.get_ident()
+            time.sleep = self._sleep
+
+    def uninstall(self):
+        """Restore the original time.sleep()."""
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+
+    def start_scenario(self, scenario):
+        """Start accounting sleeps for a scenario."""
+        self._scenario = {
+            'feature': scenario.feature.name,
+            'name': scenario.name,
+            'location': f"{scenario.filename}:{scenario.line}",
+            'total': 0.0,
+            'calls': 0,
+            'by_site': {}
+        }
+
+    def end_scenario(self):
+        """
+        Stop accounting sleeps for the current scenario.
+
+        Returns:
+            Scenario sleep summary, or None if no scenario was started
+        """
+        summary, self._scenario = self._scenario, None
+        if summary is None:
+            return None
+        summary['total'] = round(summary['total'], 3)
+        for stats in summary['by_site'].values():
+            stats['total'] = round(stats['total'], 3)
+        summary['over_budget'] = bool(self.budget) and summary['total'] > self.budget
+        self.scenarios.append(summary)
+        return summary
+
+    def ranked_sites(self, limit=None):
+        """
+        Get call sites ordered by total sleep time across the run.
+
+        Args:
+            limit: Maximum number of sites to return
+
+        Returns:
+            List of {'site', 'calls', 'total', 'scenarios'} dictionaries
+        """
+        return rank_sites([dict(s, scenarios=len(s['scenarios'])) for s in self._sites.values()], limit)
+
+    def format_summary(self, summary):
+        """Format a scenario sleep summary as plain text."""
+        budget = f" (budget {self.budget:g}s)" if self.budget else ""
+        lines = [f"Fixed sleeps: {summary['calls']} calls, {summary['total']:.2f}s idle{budget}", ""]
+        for site, stats in sorted(summary['by_site'].items(), key=lambda item: item[1]['total'], reverse=True):
+            lines.append(f"{stats['total']:>8.2f}s {stats['calls']:>5}x  {site}")
+        return "\n".join(lines)
+
+    def write(self, path):
+        """
+        Write per-scenario totals and the ranked call sites to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'budget': self.budget,
+                'mode': self.mode,
+                'total': round(sum(s['total'] for s in self.scenarios), 3),
+                'scenarios': self.scenarios,
+                'sites': self.ranked_sites()
+            }, f, indent=2)
+
+    def _sleep(self, seconds):
+        """Accounting replacement for time.sleep()."""
+        site = self._call_site()
+        if (site and self._scenario is not None and threading.get_ident() == self._thread_id
+                and not getattr(_exempt, 'depth', 0)):
+            if self.budget and self.mode == 'fail' and self._scenario['total'] + seconds > self.budget:
+                raise SleepBudgetExceeded(
+                    f"Sleeping {seconds:g}s at {site} would exceed the scenario sleep budget of "
+                    f"{self.budget:g}s ({self._scenario['total']:.2f}s already spent). "
+                    f"Replace the fixed delay with a condition wait."
+                )
+            self._account(site, seconds)
+        self._original_sleep(seconds)
+
+    def _account(self, site, seconds):
+        """Add a sleep to the scenario and run totals."""
+        scenario = self._scenario
+        scenario['total'] += seconds
+        scenario['calls'] += 1
+        stats = scenario['by_site'].setdefault(site, {'calls': 0, 'total': 0.0})
+        stats['calls'] += 1
+        stats['total'] += seconds
+
+        run_stats = self._sites.setdefault(site, {'site': site, 'calls': 0, 'total': 0.0, 'scenarios': set()})
+        run_stats['calls'] += 1
+        run_stats['total'] += seconds
+        run_stats['scenarios'].add(scenario['location'])
+
+    def _call_site(self):
+        """Get 'file:line in function' of the project code calling sleep, if any."""
+        frame = sys._getframe(2)
+        if frame.f_code.co_filename.startswith('<'):
+            return None
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not filename.startswith(self.root) or 'site-packages' in filename:
+            return None
+        relative = os.path.relpath(filename, self.root).replace(os.sep, '/')
+        return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def rank_sites(sites, limit=None):
+    """
+    Order call site totals by sleep time, largest first.
+
+    Args:
+        sites: Iterable of {'site', 'calls', 'total', 'scenarios'} dictionaries,
+            where 'scenarios' is the number of scenarios the site slept in
+        limit: Maximum number of sites to return
+
+    Returns:
+        List of dictionaries, largest total first
+    """
+    ranked = sorted(
+        (dict(s, total=round(s['total'], 3)) for s in sites),
+        key=lambda s: s['total'],
+        reverse=True
+    )
+    return ranked[:limit] if limit else ranked
+
+
+def format_ranking(sites, title="Worst sleep call sites"):
+    """Format ranked call sites as plain text."""
+    if not sites:
+        return "No fixed sleeps recorded"
+    lines = [f"{title}:", f"{'Total':>9} {'Calls':>6} {'Scen.':>6}  Call site"]
+    for s in sites:
+        lines.append(f"{s['total']:>8.2f}s {s['calls']:>6} {s['scenarios']:>6}  {s['site']}")
+    return "\n".join(lines)
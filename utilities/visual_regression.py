@@ -0,0 +1,355 @@
+"""
+Visual regression comparison.
+Compares screenshots with per-scenario, per-region baselines on a worker
+pool, with masks for dynamic content and tolerance for anti-aliasing.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+
+# Side of the perceptual hash grid (2 * HASH_SIZE * HASH_SIZE bits)
+HASH_SIZE = 16
+HASH_BITS = 2 * HASH_SIZE * HASH_SIZE
+
+# Share of differing hash bits above which the page layout changed as a
+# whole; anti-aliasing tolerance cannot help then and is not computed
+LAYOUT_CHANGE_DISTANCE = 0.25
+
+# Diff image colours (RGB)
+DIFF_COLOR = (255, 0, 0)
+ANTI_ALIAS_COLOR = (255, 200, 0)
+MASK_COLOR = (120, 160, 255)
+
+
+def slugify(text):
+    """Turn a feature, scenario or region name into a file name."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'unnamed'
+
+
+def load_pixels(data):
+    """Decode image bytes to an RGB uint8 array of shape (height, width, 3)."""
+    return np.asarray(Image.open(io.BytesIO(data)).convert('RGB'))
+
+
+def apply_masks(pixels, masks):
+    """
+    Blank out masked regions so they never count as differences.
+
+    Args:
+        pixels: Image array (height first, then width)
+        masks: List of (x, y, width, height) rectangles in image pixels
+
+    Returns:
+        Masked copy of the array
+    """
+    masked = pixels.copy()
+    height, width = masked.shape[:2]
+    for x, y, w, h in masks:
+        masked[max(0, y):min(height, y + h), max(0, x):min(width, x + w)] = 0
+    return masked
+
+
+def perceptual_hash(pixels):
+    """
+    Perceptual hash of an image from a downscaled grayscale copy: whether
+    each cell is brighter than its right neighbour (difference hash) and
+    whether it is brighter than the mean (average hash, which also sees
+    changes that span whole rows).
+
+    Returns:
+        Hash as a hex string
+    """
+    gray = Image.fromarray(pixels).convert('L').resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR)
+    cells = np.asarray(gray, dtype=np.int16)
+    bits = np.concatenate([
+        (cells[:, 1:] > cells[:, :-1]).flatten(),
+        (cells[:, :-1] > cells.mean()).flatten()
+    ])
+    return np.packbits(bits).tobytes().hex()
+
+
+def hash_distance(first, second):
+    """Number of differing bits between two perceptual hashes."""
+    return bin(int(first, 16) ^ int(second, 16)).count('1')
+
+
+def pixel_digest(pixels):
+    """Exact digest of an image's size and pixels."""
+    return hashlib.sha1(str(pixels.shape).encode() + pixels.tobytes()).hexdigest()
+
+
+def diff_pixels(baseline, current, threshold=0.1, anti_aliasing=True):
+    """
+    Find the pixels that differ between two images of the same size.
+
+    A pixel differs when any channel changed by more than the threshold. With
+    anti-aliasing tolerance, a differing pixel is ignored when it is an
+    intermediate shade between its neighbours in either image and both
+    images have a matching colour within one pixel of it, which is what
+    sub-pixel shifts of text and edges look like. Solid strokes of changed
+    text are not intermediate shades and still count.
+
+    Args:
+        baseline: RGB array
+        current: RGB array of the same shape
+        threshold: Allowed channel difference as a share of 255
+        anti_aliasing: Tolerate one pixel shifts
+
+    Returns:
+        Tuple of boolean arrays (differing pixels, anti-aliased pixels)
+    """
+    limit = threshold * 255
+    first, second = baseline.astype(np.int16), current.astype(np.int16)
+    changed = np.abs(first - second).max(axis=2) > limit
+    anti_aliased = np.zeros_like(changed)
+    if not anti_aliasing or not changed.any():
+        return changed, anti_aliased
+
+    # Only the bounding box of the changes (plus a one pixel border) is examined
+    rows, cols = np.nonzero(changed.any(axis=1))[0], np.nonzero(changed.any(axis=0))[0]
+    top, bottom = max(rows[0] - 1, 0), min(rows[-1] + 2, changed.shape[0])
+    left, right = max(cols[0] - 1, 0), min(cols[-1] + 2, changed.shape[1])
+    a, b = first[top:bottom, left:right], second[top:bottom, left:right]
+    box = changed[top:bottom, left:right]
+    anti_aliased[top:bottom, left:right] = (
+        box & (_intermediate(a) | _intermediate(b)) & _near_match(a, b, limit) & _near_match(b, a, limit)
+    )
+    return changed & ~anti_aliased, anti_aliased
+
+
+def _neighbours(pixels):
+    """Yield the image shifted by each of the eight one pixel offsets."""
+    height, width = pixels.shape[:2]
+    padded = np.pad(pixels, ((1, 1), (1, 1)) + ((0, 0),) * (pixels.ndim - 2), mode='edge')
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                yield padded[dy:dy + height, dx:dx + width]
+
+
+def _intermediate(pixels):
+    """Whether each pixel is strictly between its darkest and brightest neighbour."""
+    luma = pixels @ np.array([299, 587, 114], dtype=np.int32)
+    neighbours = np.stack(list(_neighbours(luma)))
+    return (luma > neighbours.min(axis=0)) & (luma < neighbours.max(axis=0))
+
+
+def _near_match(source, target, limit):
+    """Whether each target pixel matches a source pixel within one pixel of it."""
+    matched = np.abs(source - target).max(axis=2) <= limit
+    for shifted in _neighbours(source):
+        matched |= np.abs(shifted - target).max(axis=2) <= limit
+    return matched
+
+
+def render_diff(current, changed, anti_aliased, masks):
+    """
+    Draw a diff image: the current screenshot faded, differing pixels red,
+    tolerated anti-aliasing yellow and masked regions blue.
+
+    Returns:
+        PNG bytes
+    """
+    gray = current.astype(np.float32).mean(axis=2, keepdims=True)
+    image = np.repeat(gray * 0.3 + 255 * 0.7, 3, axis=2).astype(np.uint8)
+    height, width = image.shape[:2]
+    for x, y, w, h in masks:
+        image[max(0, y):min(height, y + h), max(0, x):min(width, x + w)] = MASK_COLOR
+    image[anti_aliased] = ANTI_ALIAS_COLOR
+    image[changed] = DIFF_COLOR
+    output = io.BytesIO()
+    Image.fromarray(image).save(output, format='PNG')
+    return output.getvalue()
+
+
+class VisualComparator:
+    """
+    Compares screenshots with stored baselines on a thread pool.
+
+    Baselines live at <baseline_dir>/<feature>/<scenario>/<region>.png with
+    a .json sidecar holding the masks, perceptual hash and pixel digest of
+    the masked baseline. A screenshot whose masked pixels have the same
+    digest skips decoding the baseline and the full diff. A missing
+    baseline is created from the first screenshot.
+    """
+
+    def __init__(self, baseline_dir, output_dir, workers=2, threshold=0.1,
+                 max_diff_ratio=0.0, update=False):
+        """
+        Initialize the comparator.
+
+        Args:
+            baseline_dir: Directory holding the baselines
+            output_dir: Directory diff and actual images are written to
+            workers: Number of comparison threads
+            threshold: Allowed channel difference per pixel as a share of 255
+            max_diff_ratio: Share of unmasked pixels allowed to differ
+                (0 fails on any difference that is not anti-aliasing)
+            update: Replace baselines with the new screenshots instead of
+                comparing
+        """
+        self.baseline_dir = baseline_dir
+        self.output_dir = output_dir
+        self.threshold = threshold
+        self.max_diff_ratio = max_diff_ratio
+        self.update = update
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='visual')
+
+    def submit(self, image, feature, scenario, region, masks=(), css_width=None):
+        """
+        Queue a screenshot for comparison and return at once.
+
+        Args:
+            image: PNG bytes of the screenshot
+            feature: Feature name
+            scenario: Scenario name
+            region: Region name ('page' for the whole viewport)
+            masks: List of (x, y, width, height) rectangles to ignore, in
+                CSS pixels relative to the screenshot
+            css_width: Width of the screenshot in CSS pixels, to scale the
+                masks on high-density displays
+
+        Returns:
+            Future resolving to the result dictionary of compare()
+        """
+        return self._executor.submit(self.compare, image, feature, scenario, region, masks, css_width)
+
+    def compare(self, image, feature, scenario, region, masks=(), css_width=None):
+        """
+        Compare a screenshot with its baseline.
+
+        Returns:
+            Dictionary with 'name', 'status' (passed, failed, new or
+            updated), 'message', 'diff_ratio', 'hash_distance',
+            'prefiltered', 'duration' and, when it failed, 'diff' and
+            'actual' image paths
+        """
+        started = time.perf_counter()
+        name = f"{scenario} - {region}"
+        base = os.path.join(self.baseline_dir, slugify(feature), slugify(scenario), slugify(region))
+
+        current = load_pixels(image)
+        scale = current.shape[1] / css_width if css_width else 1
+        masks = sorted([round(v * scale) for v in mask] for mask in masks)
+        masked = apply_masks(current, masks)
+        digest, phash = pixel_digest(masked), perceptual_hash(masked)
+        result = {'name': name, 'diff_ratio': 0.0, 'hash_distance': 0, 'prefiltered': False}
+
+        sidecar = self._read_sidecar(base)
+        if self.update or sidecar is None:
+            self._save_baseline(base, current, masks, digest, phash)
+            status = 'updated' if sidecar else 'new'
+            result.update(status=status, message=f"Baseline {status}: {base}.png")
+        elif sidecar['masks'] == masks and sidecar['digest'] == digest:
+            result.update(status='passed', message="Identical to baseline", prefiltered=True)
+        else:
+            result.update(self._diff(base, current, masks, sidecar, phash))
+
+        result['duration'] = time.perf_counter() - started
+        return result
+
+    def close(self):
+        """Wait for queued comparisons and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def _diff(self, base, current, masks, sidecar, phash):
+        """Run the full pixel comparison against the baseline."""
+        baseline = load_pixels(self._read_file(f"{base}.png"))
+        if baseline.shape != current.shape:
+            paths = self._write_outputs(base, current, None)
+            return dict(paths, status='failed', diff_ratio=1.0, message=(
+                f"Size changed from {baseline.shape[1]}x{baseline.shape[0]} "
+                f"to {current.shape[1]}x{current.shape[0]}"
+            ))
+
+        # Masks of both runs are ignored, dynamic content may have moved
+        all_masks = masks + [m for m in sidecar['masks'] if m not in masks]
+        distance = hash_distance(phash, sidecar['hash'])
+        layout_changed = distance > LAYOUT_CHANGE_DISTANCE * HASH_BITS
+        changed, anti_aliased = diff_pixels(
+            apply_masks(baseline, all_masks), apply_masks(current, all_masks),
+            self.threshold, anti_aliasing=not layout_changed
+        )
+
+        unmasked = apply_masks(np.ones(changed.shape, dtype=bool), all_masks)
+        ratio = int(changed.sum()) / max(int(unmasked.sum()), 1)
+        result = {'diff_ratio': ratio, 'hash_distance': distance}
+        if ratio <= self.max_diff_ratio:
+            result.update(status='passed', message=f"{ratio:.4%} of pixels differ")
+            return result
+
+        paths = self._write_outputs(base, current, render_diff(current, changed, anti_aliased, all_masks))
+        result.update(paths, status='failed', message=(
+            f"{ratio:.4%} of pixels differ (allowed {self.max_diff_ratio:.4%})"
+            + (", layout changed" if layout_changed else "")
+        ))
+        return result
+
+    def _write_outputs(self, base, current, diff):
+        """Save the actual screenshot and the diff image of a failed comparison."""
+        prefix = os.path.join(self.output_dir, os.path.relpath(base, self.baseline_dir))
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        paths = {'actual': f"{prefix}.actual.png"}
+        Image.fromarray(current).save(paths['actual'])
+        if diff is not None:
+            paths['diff'] = f"{prefix}.diff.png"
+            with open(paths['diff'], 'wb') as f:
+                f.write(diff)
+        return paths
+
+    def _save_baseline(self, base, pixels, masks, digest, phash):
+        """Write a baseline image and its sidecar."""
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        Image.fromarray(pixels).save(f"{base}.png")
+        with open(f"{base}.json", 'w') as f:
+            json.dump({'masks': masks, 'hash': phash, 'digest': digest}, f, indent=2)
+
+    def _read_sidecar(self, base):
+        """Read a baseline's sidecar, or None when there is no baseline."""
+        if not os.path.exists(f"{base}.png") or not os.path.exists(f"{base}.json"):
+            return None
+        with open(f"{base}.json") as f:
+            return json.load(f)
+
+    def _read_file(self, path):
+        """Read a file's bytes."""
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+def attach_to_allure(result):
+    """Attach the diff and actual images of a failed comparison to Allure."""
+    try:
+        import allure
+    except ImportError:
+        return  # If allure is not available, continue
+    for key, label in (('diff', 'Visual Diff'), ('actual', 'Visual Actual')):
+        if result.get(key):
+            allure.attach.file(
+                result[key],
+                name=f"{label} - {result['name']}",
+                attachment_type=allure.attachment_type.PNG
+            )
+
+
+def format_results(results):
+    """
+    Format comparison results for assertion messages.
+
+    Returns:
+        One line per comparison
+    """
+    return "\n".join(
+        f"  [{r['status'].upper()}] {r['name']}: {r['message']}"
+        + (f" (diff: {r['diff']})" if r.get('diff') else "")
+        for r in results
+    )
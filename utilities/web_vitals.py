@@ -0,0 +1,288 @@
+"""
+Page performance collector.
+Records Navigation Timing, paint timings, Largest Contentful Paint, layout
+shifts and long tasks for every page visit of a scenario.
+"""
+
+import json
+import os
+from datetime import datetime
+
+
+# Starts PerformanceObservers for LCP, layout shifts and long tasks, and
+# tracks the time of the last DOM change. Runs at document start through
+# CDP; other browsers get it when a visit is first measured (buffered
+# entries are replayed, earlier long tasks are missed).
+OBSERVER_SCRIPT = """
+(function() {
+    if (window.__em2mVitals) { return; }
+    var v = window.__em2mVitals = {lcp: null, shifts: [], longTasks: [], lastMutation: 0};
+
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function(list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    }
+    observe('largest-contentful-paint', function(e) { v.lcp = e.startTime; });
+    observe('layout-shift', function(e) {
+        if (!e.hadRecentInput && v.shifts.length < 1000) { v.shifts.push({time: e.startTime, value: e.value}); }
+    });
+    observe('longtask', function(e) {
+        if (v.longTasks.length < 1000) { v.longTasks.push({start: e.startTime, duration: e.duration}); }
+    });
+
+    function watchMutations() {
+        new MutationObserver(function() { v.lastMutation = performance.now(); }).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    if (document.documentElement) { watchMutations(); } else { document.addEventListener('DOMContentLoaded', watchMutations); }
+})();
+"""
+
+# Page clock before an action that may change the route
+MARK_SCRIPT = OBSERVER_SCRIPT + """
+return {origin: performance.timeOrigin, now: performance.now()};
+"""
+
+# Resolves with the timings of the current document. With a mark from the
+# same document only entries after it are reported (a route change);
+# otherwise the whole page load is, once the load event has finished.
+COLLECT_SCRIPT = OBSERVER_SCRIPT + """
+var mark = arguments[0], done = arguments[arguments.length - 1];
+var since = mark && mark.origin === performance.timeOrigin ? mark.now : null;
+
+function collect() {
+    var v = window.__em2mVitals, from = since === null ? 0 : since;
+    var nav = performance.getEntriesByType('navigation')[0], paints = {};
+    performance.getEntriesByType('paint').forEach(function(p) { paints[p.name] = p.startTime; });
+    var resources = performance.getEntriesByType('resource').filter(function(r) { return r.startTime >= from; });
+    done({
+        url: location.href,
+        since: since,
+        now: performance.now(),
+        navigation: nav ? {
+            ttfb: nav.responseStart,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            transfer_size: nav.transferSize || 0
+        } : null,
+        first_paint: paints['first-paint'] || null,
+        first_contentful_paint: paints['first-contentful-paint'] || null,
+        lcp: v.lcp,
+        layout_shifts: v.shifts.filter(function(s) { return s.time >= from; }),
+        long_tasks: v.longTasks.filter(function(t) { return t.start >= from; }),
+        requests: resources.length,
+        last_response: resources.reduce(function(end, r) { return Math.max(end, r.responseEnd); }, 0),
+        last_mutation: v.lastMutation
+    });
+}
+
+if (since === null && document.readyState !== 'complete') {
+    window.addEventListener('load', function() { setTimeout(collect, 0); }, {once: true});
+} else {
+    collect();
+}
+"""
+
+# Long task time beyond this counts as blocking (Total Blocking Time)
+BLOCKING_THRESHOLD_MS = 50
+
+
+def cumulative_layout_shift(shifts):
+    """
+    Largest session window of layout shifts, as Core Web Vitals define CLS.
+
+    A window collects shifts less than 1s apart, for at most 5s.
+
+    Args:
+        shifts: List of {'time' (ms), 'value'} dictionaries
+
+    Returns:
+        CLS score
+    """
+    best = current = 0.0
+    window_start = previous = None
+    for shift in sorted(shifts, key=lambda s: s['time']):
+        if window_start is None or shift['time'] - previous > 1000 or shift['time'] - window_start > 5000:
+            window_start, current = shift['time'], 0.0
+        current += shift['value']
+        previous = shift['time']
+        best = max(best, current)
+    return best
+
+
+def _seconds(ms):
+    """Convert page milliseconds to rounded seconds, keeping missing values."""
+    return round(ms / 1000, 3) if ms else None
+
+
+class WebVitalsCollector:
+    """
+    Measures every page visit of a scenario.
+
+    instrument() installs the observers into every document a driver opens
+    and marks the driver, so page objects find the collector through
+    collector_for(). Full page loads are measured from Navigation Timing;
+    route changes from the click until the last DOM change or response.
+    """
+
+    def __init__(self):
+        """Initialize the collector."""
+        self.scenarios = []
+        self._scenario = None
+
+    @staticmethod
+    def collector_for(driver):
+        """Get the collector a driver was instrumented with, or None."""
+        return getattr(driver, '_web_vitals', None)
+
+    def instrument(self, driver):
+        """
+        Install the observers into every new document. Safe to call repeatedly.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            The same driver
+        """
+        if self.collector_for(driver) is self:
+            return driver
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': OBSERVER_SCRIPT})
+        driver._web_vitals = self
+        return driver
+
+    def start_scenario(self, scenario):
+        """Start recording a scenario."""
+        self._scenario = {
+            'feature': scenario.feature.name,
+            'name': scenario.name,
+            'location': f"{scenario.location.filename}:{scenario.location.line}",
+            'visits': []
+        }
+
+    def end_scenario(self):
+        """
+        Stop recording a scenario.
+
+        Returns:
+            Scenario dictionary with its visits, or None if no scenario was started
+        """
+        recorded, self._scenario = self._scenario, None
+        if recorded is not None:
+            self.scenarios.append(recorded)
+        return recorded
+
+    def mark(self, driver):
+        """
+        Read the page clock before an action that may change the route.
+
+        Returns:
+            Mark to pass to record()
+        """
+        return driver.execute_script(MARK_SCRIPT)
+
+    def record(self, driver, label, mark=None):
+        """
+        Measure the current page and store it as a visit of the scenario.
+
+        Args:
+            driver: WebDriver instance
+            label: Name of the visit, e.g. the page or card clicked
+            mark: Result of mark() before a click; without one (or when the
+                click loaded a new document) the page load is measured
+
+        Returns:
+            Visit dictionary (times in seconds), or None outside a scenario
+        """
+        if self._scenario is None:
+            return None
+        data = driver.execute_async_script(COLLECT_SCRIPT, mark)
+        long_tasks = data['long_tasks']
+        visit = {
+            'label': label,
+            'kind': 'route' if data['since'] is not None else 'navigation',
+            'url': data['url'],
+            'cls': round(cumulative_layout_shift(data['layout_shifts']), 4),
+            'long_tasks': len(long_tasks),
+            'total_blocking_time': _seconds(sum(
+                max(0, t['duration'] - BLOCKING_THRESHOLD_MS) for t in long_tasks
+            )) or 0.0,
+            'requests': data['requests']
+        }
+
+        if data['since'] is not None:
+            # A route change ends with the last DOM change, response or long task
+            end = max([data['last_mutation'], data['last_response']] +
+                      [t['start'] + t['duration'] for t in long_tasks])
+            visit['load'] = round(max(0, end - data['since']) / 1000, 3)
+        else:
+            navigation = data['navigation'] or {}
+            visit.update(
+                load=_seconds(navigation.get('load')),
+                ttfb=_seconds(navigation.get('ttfb')),
+                dom_content_loaded=_seconds(navigation.get('dom_content_loaded')),
+                first_paint=_seconds(data['first_paint']),
+                first_contentful_paint=_seconds(data['first_contentful_paint']),
+                lcp=_seconds(data['lcp']),
+                transfer_size=navigation.get('transfer_size', 0)
+            )
+
+        self._scenario['visits'].append(visit)
+        return visit
+
+    def find_visit(self, label):
+        """
+        Get the latest visit of the running scenario with a label.
+
+        Args:
+            label: Visit label (case-insensitive)
+
+        Returns:
+            Visit dictionary, or None if the page was not visited
+        """
+        if self._scenario is None:
+            return None
+        matches = [v for v in self._scenario['visits'] if v['label'].lower() == label.lower()]
+        return matches[-1] if matches else None
+
+    def format_summary(self, scenario):
+        """
+        Format a scenario's visits as a plain text table for report attachments.
+
+        Args:
+            scenario: Dictionary returned by end_scenario()
+
+        Returns:
+            Summary text
+        """
+        def fmt(value):
+            return f"{value:.3f}s" if value is not None else "-"
+
+        lines = [f"{'Visit':<30} {'Kind':<10} {'Load':>8} {'FCP':>8} {'LCP':>8} {'CLS':>7} {'TBT':>8} {'Reqs':>5}"]
+        for visit in scenario['visits']:
+            lines.append(
+                f"{visit['label'][:30]:<30} {visit['kind']:<10} {fmt(visit['load']):>8} "
+                f"{fmt(visit.get('first_contentful_paint')):>8} {fmt(visit.get('lcp')):>8} "
+                f"{visit['cls']:>7.3f} {fmt(visit['total_blocking_time']):>8} {visit['requests']:>5}"
+            )
+        return "\n".join(lines)
+
+    def write(self, path):
+        """
+        Write all scenarios and their visits to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'scenarios': self.scenarios
+            }, f, indent=2)